@@ -0,0 +1,162 @@
+import pygame, time, json, statistics, platform
+from Global.settings import *
+from Simulation.headless_simulation import HeadlessSimulation
+from Benchmarks.synthetic_tile_map import SyntheticTileMap
+from Menu.menu import Menu
+from Debug.frame_profiler import FrameProfiler
+
+class FrameBenchmark:
+    def __init__(self, number_of_frames = 600, delta_time = 1 / 60):
+
+        # The number of frames to simulate for each benchmark and the delta time of each frame
+        self.number_of_frames = number_of_frames
+        self.delta_time = delta_time
+
+        # The sizes (in scaled screens) and densities of the synthetic tile maps to benchmark
+        self.tile_map_widths_in_screens = [1, 10, 100]
+        self.tile_map_densities = [0.05, 0.25]
+
+        # List of the results of every benchmark
+        self.results = []
+
+    # --------------------------------------------------------------------------------------
+    # Timing methods
+
+    def time_method(self, owner, method_name, phase_name, phase_timings):
+        # Replaces a method on an object with a version that records how long each call takes (in nanoseconds) inside the phase timings dictionary
+        # Note: Only used for the menu, which has no frame profiler (The game's phases are timed by its frame profiler)
+
+        original_method = getattr(owner, method_name)
+        phase_timings[phase_name] = []
+
+        def timed_method(*args, **kwargs):
+            start_time = time.perf_counter_ns()
+            result = original_method(*args, **kwargs)
+            phase_timings[phase_name].append(time.perf_counter_ns() - start_time)
+            return result
+
+        setattr(owner, method_name, timed_method)
+
+    def summarise_timings(self, timings):
+        # Returns the statistics of a list of timings (in nanoseconds), in milliseconds
+
+        # Percentiles need at least two timings
+        if len(timings) < 2:
+            timings = timings * 2
+
+        percentiles = statistics.quantiles(timings, n = 100, method = "inclusive")
+
+        return {
+            "calls": len(timings),
+            "mean_ms": statistics.fmean(timings) / 1_000_000,
+            "p50_ms": percentiles[49] / 1_000_000,
+            "p90_ms": percentiles[89] / 1_000_000,
+            "p99_ms": percentiles[98] / 1_000_000,
+            "max_ms": max(timings) / 1_000_000
+            }
+
+    # --------------------------------------------------------------------------------------
+    # Benchmarks
+
+    def find_scripted_input(self, frame_number):
+        # Returns the keys held down and the keys pressed for a frame of the benchmark, so that the player runs, jumps, double jumps and power jumps across the tile map
+
+        # The input repeats every 480 frames
+        cycle_frame_number = frame_number % 480
+
+        # Run right for the first half of the cycle and left for the second half
+        held_keys = {pygame.K_d} if cycle_frame_number < 240 else {pygame.K_a}
+
+        # Charge up a power jump near the end of the cycle
+        if 400 <= cycle_frame_number < 440:
+            held_keys.add(pygame.K_SPACE)
+
+        # Jump once every second, and double jump shortly afterwards
+        pressed_keys = []
+        if cycle_frame_number % 60 == 30:
+            pressed_keys.append(pygame.K_w)
+        elif cycle_frame_number % 60 == 40:
+            pressed_keys.append(pygame.K_SPACE)
+
+        return held_keys, pressed_keys
+
+    def benchmark_game(self, width_in_screens, density):
+
+        # Create the synthetic tile map and the level (The time taken to create the level is also recorded)
+        non_transformed_tile_map = SyntheticTileMap(width_in_screens = width_in_screens, density = density).create_tile_map()
+
+        start_time = time.perf_counter_ns()
+        simulation = HeadlessSimulation(non_transformed_tile_map)
+        level_creation_time = time.perf_counter_ns() - start_time
+
+        # Record the time taken by each phase of Game.run with the game's frame profiler, so that the benchmark reports the same phases as the frame profiler's overlay
+        # Note: The rolling window holds every frame of the benchmark, so that no timings are dropped (The overlay is never shown, so it isn't drawn)
+        simulation.game.frame_profiler = FrameProfiler(window_size = self.number_of_frames)
+        simulation.game.frame_profiler.enabled = True
+
+        # Simulate all of the frames, recording the time taken for each whole frame
+        frame_timings = []
+        for frame_number in range(0, self.number_of_frames):
+            held_keys, pressed_keys = self.find_scripted_input(frame_number)
+
+            start_time = time.perf_counter_ns()
+            simulation.step(self.delta_time, held_keys = held_keys, pressed_keys = pressed_keys)
+            frame_timings.append(time.perf_counter_ns() - start_time)
+
+        self.results.append({
+            "benchmark": "Game.run",
+            "width_in_screens": width_in_screens,
+            "density": density,
+            "number_of_world_tiles": simulation.game.tile_grid.find_number_of_tiles(),
+            "level_creation_ms": level_creation_time / 1_000_000,
+            "frame": self.summarise_timings(frame_timings),
+            "phases": {phase_name: self.summarise_timings(list(phase_durations)) for phase_name, phase_durations in simulation.game.frame_profiler.phase_durations_dict.items()}
+            })
+
+    def benchmark_menu(self):
+
+        # Create the menu, drawing onto an offscreen surface with the same size as the screen
+        menu = Menu(screen = pygame.Surface((screen_width, screen_height)))
+
+        # Record the time taken by each phase of Menu.run
+        phase_timings = {}
+        self.time_method(menu, "animate_background", "Background", phase_timings)
+        self.time_method(menu, "update_buttons", "Buttons", phase_timings)
+
+        # Simulate all of the frames, recording the time taken for each whole frame
+        frame_timings = []
+        for frame_number in range(0, self.number_of_frames):
+            start_time = time.perf_counter_ns()
+            menu.run(self.delta_time)
+            frame_timings.append(time.perf_counter_ns() - start_time)
+
+        self.results.append({
+            "benchmark": "Menu.run",
+            "frame": self.summarise_timings(frame_timings),
+            "phases": {phase_name: self.summarise_timings(timings) for phase_name, timings in phase_timings.items()}
+            })
+
+    def run(self, output_file_path):
+
+        # Benchmark the game with every size and density of synthetic tile map
+        for width_in_screens in self.tile_map_widths_in_screens:
+            for density in self.tile_map_densities:
+                self.benchmark_game(width_in_screens = width_in_screens, density = density)
+
+                # Show the progress
+                print(f"Game.run: {width_in_screens} screens wide, {density} density: {self.results[-1]['frame']['mean_ms']:.3f} ms per frame")
+
+        # Benchmark the menu
+        self.benchmark_menu()
+        print(f"Menu.run: {self.results[-1]['frame']['mean_ms']:.3f} ms per frame")
+
+        # Write the results to the output file
+        with open(output_file_path, "w") as output_file:
+            json.dump({
+                "python_version": platform.python_version(),
+                "pygame_version": pygame.version.ver,
+                "platform": platform.platform(),
+                "number_of_frames": self.number_of_frames,
+                "delta_time": self.delta_time,
+                "results": self.results
+                }, output_file, indent = 4)
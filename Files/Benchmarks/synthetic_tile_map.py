@@ -0,0 +1,51 @@
+import random
+from Global.settings import *
+
+class SyntheticTileMap:
+    def __init__(self, width_in_screens, density, number_of_rows = 17, seed = 0):
+
+        # Creates tile maps of any size for benchmarking, in the same format as the tile maps loaded from the level tile maps file (0 = Nothing, 1 = Player, 2 = World tile)
+
+        # The number of columns in one scaled screen (The scaled surface is a quarter of the size of the screen)
+        self.columns_per_screen = int((screen_width / 4) // TILE_SIZE)
+
+        # The size of the tile map
+        self.number_of_columns = self.columns_per_screen * width_in_screens
+        self.number_of_rows = number_of_rows
+
+        # The chance of each cell above the ground being a world tile (0 = Only the ground, 1 = Every cell)
+        self.density = density
+
+        # Random number generator with a fixed seed, so that the same tile map is created every time
+        self.random = random.Random(seed)
+
+    def create_tile_map(self):
+
+        non_transformed_tile_map = []
+
+        # For each row in the tile map
+        for row_index in range(0, self.number_of_rows):
+
+            # The bottom two rows are always the ground
+            if row_index >= self.number_of_rows - 2:
+                row = [2] * self.number_of_columns
+
+            # The top three rows are left empty so that the player has space to jump
+            elif row_index < 3:
+                row = [0] * self.number_of_columns
+
+            # All other rows have world tiles scattered across them
+            else:
+                row = [2 if self.random.random() < self.density else 0 for _ in range(0, self.number_of_columns)]
+
+            non_transformed_tile_map.append(row)
+
+        # Clear the cells below the player's spawning position so that the player starts by falling onto the ground
+        for row_index in range(1, self.number_of_rows - 2):
+            non_transformed_tile_map[row_index][1] = 0
+            non_transformed_tile_map[row_index][2] = 0
+
+        # Spawn the player in the top left of the tile map
+        non_transformed_tile_map[1][1] = 1
+
+        return non_transformed_tile_map
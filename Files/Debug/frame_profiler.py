@@ -0,0 +1,138 @@
+import pygame, time, json
+from collections import deque
+
+class FrameProfiler:
+    def __init__(self, window_size = 120):
+
+        # Used to time each phase of a frame (e.g. drawing the tiles, running the player), so that frame spikes can be found without attaching a profiler
+
+        # Attribute which determines whether the phases are timed (Timing is off unless the profiler is turned on, so that it costs nothing when it isn't being used)
+        self.enabled = False
+
+        # Attribute which determines whether the overlay with the timings is drawn onto the screen
+        self.show_overlay = False
+
+        # The number of frames kept inside the rolling window of timings
+        self.window_size = window_size
+
+        # Dictionary used to hold the durations (in nanoseconds) of each phase in the rolling window, the key is the name of the phase
+        self.phase_durations_dict = {}
+
+        # The durations of the whole frames in the rolling window (in nanoseconds)
+        self.frame_durations = deque(maxlen = self.window_size)
+
+        # The events of every phase in the rolling window, in the Chrome trace event format (Times are in microseconds)
+        # Note: A frame has at most 20 phases
+        self.trace_events = deque(maxlen = self.window_size * 20)
+
+        # The start times of the current frame and phase
+        self.frame_start_time = None
+        self.phase_start_time = None
+        self.phase_name = None
+
+        # The time that the profiler was created, so that the times in the trace start from 0
+        self.creation_time = time.perf_counter_ns()
+
+        # Font used to draw the overlay (Created when the overlay is first drawn)
+        self.overlay_font = None
+
+    # --------------------------------------------------------------------------------------
+    # Timing methods
+
+    def toggle(self):
+
+        # Turn the profiler and the overlay on or off
+        self.enabled = not self.enabled
+        self.show_overlay = self.enabled
+
+    def start_frame(self):
+
+        if self.enabled == True:
+            self.frame_start_time = time.perf_counter_ns()
+
+    def end_frame(self):
+
+        if self.enabled == True and self.frame_start_time != None:
+
+            # End the last phase of the frame if it hasn't been ended yet
+            self.end_phase()
+
+            # Record the duration of the frame
+            frame_end_time = time.perf_counter_ns()
+            self.frame_durations.append(frame_end_time - self.frame_start_time)
+            self.add_trace_event(name = "Frame", start_time = self.frame_start_time, end_time = frame_end_time)
+            self.frame_start_time = None
+
+    def start_phase(self, phase_name):
+
+        if self.enabled == True:
+
+            # End the previous phase (Phases are one after another, so starting a phase ends the previous one)
+            self.end_phase()
+
+            # Start the new phase
+            self.phase_name = phase_name
+            self.phase_start_time = time.perf_counter_ns()
+
+    def end_phase(self):
+
+        if self.enabled == True and self.phase_start_time != None:
+
+            phase_end_time = time.perf_counter_ns()
+
+            # If this is the first time that this phase has been timed, create a rolling window for it
+            if self.phase_name not in self.phase_durations_dict:
+                self.phase_durations_dict[self.phase_name] = deque(maxlen = self.window_size)
+
+            # Record the duration of the phase
+            self.phase_durations_dict[self.phase_name].append(phase_end_time - self.phase_start_time)
+            self.add_trace_event(name = self.phase_name, start_time = self.phase_start_time, end_time = phase_end_time)
+
+            self.phase_start_time = None
+            self.phase_name = None
+
+    def add_trace_event(self, name, start_time, end_time):
+
+        # Add a complete event (i.e. an event with a start time and a duration) to the trace
+        self.trace_events.append({"name": name, "ph": "X", "ts": (start_time - self.creation_time) / 1000, "dur": (end_time - start_time) / 1000, "pid": 0, "tid": 0})
+
+    # --------------------------------------------------------------------------------------
+    # Output methods
+
+    def find_summary(self, durations):
+
+        # Returns the mean and maximum of the durations in the rolling window (in milliseconds)
+        if len(durations) == 0:
+            return 0, 0
+
+        return (sum(durations) / len(durations)) / 1_000_000, max(durations) / 1_000_000
+
+    def draw_overlay(self, surface):
+
+        if self.show_overlay == True:
+
+            # Create the font if it hasn't been created yet
+            if self.overlay_font == None:
+                self.overlay_font = pygame.font.Font(None, 24)
+
+            # Create one line of text for the whole frame and one for each phase
+            frame_mean, frame_max = self.find_summary(self.frame_durations)
+            lines = [f"Frame: {frame_mean:.2f} ms (max {frame_max:.2f} ms)"]
+
+            for phase_name, phase_durations in self.phase_durations_dict.items():
+                phase_mean, phase_max = self.find_summary(phase_durations)
+                lines.append(f"{phase_name}: {phase_mean:.2f} ms (max {phase_max:.2f} ms)")
+
+            # Draw a background behind the text so that it can be read over the level
+            line_height = self.overlay_font.get_linesize()
+            pygame.draw.rect(surface, "black", (10, 10, 400, (line_height * len(lines)) + 10), 0)
+
+            # Draw each line of text
+            for line_number, line in enumerate(lines):
+                surface.blit(self.overlay_font.render(line, True, "white"), (15, 15 + (line_number * line_height)))
+
+    def export_chrome_trace(self, file_path):
+
+        # Write the events in the rolling window to a JSON file, which can be opened with chrome://tracing or Perfetto
+        with open(file_path, "w") as trace_file:
+            json.dump({"traceEvents": list(self.trace_events), "displayTimeUnit": "ms"}, trace_file)
@@ -0,0 +1,104 @@
+import pygame, os, json
+
+class AnimationAtlas:
+    def __init__(self, animations_directory, animation_states, load_image = pygame.image.load):
+
+        # Packs all of the frames of a set of animations (e.g. all of the player's "Ice" animations) into a single image, so that the frames are loaded and converted once, and drawn from one surface
+
+        # The directory which holds a folder of numbered frames for each animation state (e.g. "graphics/Player/Ice/Idle/0.png")
+        self.animations_directory = animations_directory
+        self.animation_states = animation_states
+
+        # The function used to load each image from its path (e.g. the asset manager's load_image method, so that images which have been preloaded aren't loaded again, and are already converted to the display's pixel format)
+        self.load_image = load_image
+
+        # The paths of the prebuilt atlas image and the file which holds the position of each frame inside the atlas image
+        self.atlas_image_path = os.path.join(self.animations_directory, "atlas.png")
+        self.atlas_frames_path = os.path.join(self.animations_directory, "atlas.json")
+
+        # The atlas image and a dictionary used to hold the rects of each frame inside the atlas image, the key is the animation state (Both are created when the atlas is loaded or built)
+        self.atlas_image = None
+        self.frame_rects_dict = {}
+
+        # The atlas image flipped horizontally (Used for the animations facing left)
+        self.flipped_atlas_image = None
+
+    def load(self):
+
+        # Load the prebuilt atlas if there is one (The atlas image is used as it is returned by load_image, e.g. already converted by the asset manager)
+        if os.path.exists(self.atlas_image_path) and os.path.exists(self.atlas_frames_path):
+            self.load_prebuilt_atlas()
+
+        # Otherwise build the atlas from the animation frames
+        else:
+            self.build()
+
+            # Convert the built atlas image to the same pixel format as the display, so that drawing the frames doesn't need to convert them every time
+            # Note: This can only be done once the display has been set up
+            if pygame.display.get_surface() != None:
+                self.atlas_image = self.atlas_image.convert_alpha()
+
+        # Create the flipped atlas image
+        self.flipped_atlas_image = pygame.transform.flip(self.atlas_image, True, False)
+
+    def find_frame_paths(self):
+
+        # Returns a dictionary holding a list of the paths of the frames of each animation state (Each state's frames are numbered from 0)
+        return {animation_state: [os.path.join(self.animations_directory, animation_state, f"{i}.png") for i in range(len(os.listdir(os.path.join(self.animations_directory, animation_state))))] for animation_state in self.animation_states}
+
+    def build(self):
+
+        # Load the frames of each animation state
+        frames_dict = {animation_state: [self.load_image(frame_path) for frame_path in frame_paths] for animation_state, frame_paths in self.find_frame_paths().items()}
+
+        # Each animation state is placed on its own row of the atlas image, so the atlas is as wide as the widest row and as tall as all of the rows put together
+        atlas_width = max(sum(frame.get_width() for frame in frames) for frames in frames_dict.values())
+        atlas_height = sum(max(frame.get_height() for frame in frames) for frames in frames_dict.values())
+        self.atlas_image = pygame.Surface((atlas_width, atlas_height), flags = pygame.SRCALPHA)
+
+        # Draw each frame onto the atlas image, saving the rect of each frame
+        self.frame_rects_dict = {}
+        row_y = 0
+
+        for animation_state, frames in frames_dict.items():
+            frame_x = 0
+            self.frame_rects_dict[animation_state] = []
+
+            for frame in frames:
+                self.atlas_image.blit(frame, (frame_x, row_y))
+                self.frame_rects_dict[animation_state].append(pygame.Rect(frame_x, row_y, frame.get_width(), frame.get_height()))
+                frame_x += frame.get_width()
+
+            row_y += max(frame.get_height() for frame in frames)
+
+    def save(self):
+
+        # Save the atlas image and the rects of each frame, so that the atlas can be loaded without loading every frame
+        pygame.image.save(self.atlas_image, self.atlas_image_path)
+
+        with open(self.atlas_frames_path, "w") as atlas_frames_file:
+            json.dump({animation_state: [list(frame_rect) for frame_rect in frame_rects] for animation_state, frame_rects in self.frame_rects_dict.items()}, atlas_frames_file, indent = 4)
+
+    def load_prebuilt_atlas(self):
+
+        # Load the atlas image and the rects of each frame
+        self.atlas_image = self.load_image(self.atlas_image_path)
+
+        with open(self.atlas_frames_path, "r") as atlas_frames_file:
+            self.frame_rects_dict = {animation_state: [pygame.Rect(frame_rect) for frame_rect in frame_rects] for animation_state, frame_rects in json.load(atlas_frames_file).items()}
+
+    def find_animation_frames(self, flipped = False):
+
+        # Returns a dictionary holding a list of the frames of each animation state, where each frame is part of the atlas image (i.e. no pixels are copied)
+        # Note: If flipped is True, the frames are flipped horizontally (i.e. facing left), which are taken from the flipped atlas image at the mirrored position of each frame
+        if flipped == False:
+            return {animation_state: [self.atlas_image.subsurface(frame_rect) for frame_rect in frame_rects] for animation_state, frame_rects in self.frame_rects_dict.items()}
+        else:
+            return {animation_state: [self.flipped_atlas_image.subsurface((self.atlas_image.get_width() - frame_rect.right, frame_rect.y, frame_rect.width, frame_rect.height)) for frame_rect in frame_rects] for animation_state, frame_rects in self.frame_rects_dict.items()}
+
+
+if __name__ == "__main__":
+    # Build and save the atlas of the player's animations (Run from the root folder of the game, e.g. "python Files/Global/animation_atlas.py")
+    animation_atlas = AnimationAtlas(animations_directory = "graphics/Player/Ice", animation_states = ["Idle", "Run", "Jump", "Fall", "Land", "PowerJump"])
+    animation_atlas.build()
+    animation_atlas.save()
@@ -0,0 +1,103 @@
+import pygame, os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from Global.animation_atlas import AnimationAtlas
+
+class AssetManager:
+    def __init__(self):
+
+        # Loads each asset once and hands out the same surface / atlas every time it is asked for again, so that an image used in more than one place (e.g. the "Controls" button in the main menu and the paused menu) is only read from the disk and decoded once
+        # Note: The surfaces are shared, so they should never be drawn onto
+
+        # Dictionary used to hold all of the loaded images, the key is (the path of the image, whether the image has transparent pixels)
+        self.images_dict = {}
+
+        # The keys of the images that were loaded before the display was set up, which still need to be converted to the display's pixel format
+        self.unconverted_image_keys = set()
+
+        # Dictionary used to hold all of the loaded animation atlases, the key is the directory of the animations
+        self.animation_atlases_dict = {}
+
+    def convert_image(self, image, alpha):
+
+        # Convert the image to the same pixel format as the display, so that drawing the image doesn't need to convert it every time
+        # Note: Images with transparent pixels keep their transparency
+        if alpha == True:
+            return image.convert_alpha()
+        else:
+            return image.convert()
+
+    def load_image(self, path, alpha = False):
+
+        # Returns the image at the path, loading and converting it if it hasn't been loaded yet
+        image_key = (path, alpha)
+
+        # If the image hasn't been loaded yet
+        if image_key not in self.images_dict:
+            self.images_dict[image_key] = pygame.image.load(path)
+            self.unconverted_image_keys.add(image_key)
+
+        # Convert the image if it hasn't been converted yet (This can only be done once the display has been set up)
+        if image_key in self.unconverted_image_keys and pygame.display.get_surface() != None:
+            self.images_dict[image_key] = self.convert_image(self.images_dict[image_key], alpha)
+            self.unconverted_image_keys.remove(image_key)
+
+        return self.images_dict[image_key]
+
+    def load_animation_atlas(self, animations_directory, animation_states):
+
+        # Returns the atlas of the animations inside the directory, building / loading it if it hasn't been loaded yet (e.g. so that the player's animations are only loaded once, even when the player is created again)
+        if animations_directory not in self.animation_atlases_dict:
+            animation_atlas = AnimationAtlas(animations_directory = animations_directory, animation_states = animation_states, load_image = lambda path: self.load_image(path, alpha = True))
+            animation_atlas.load()
+            self.animation_atlases_dict[animations_directory] = animation_atlas
+
+        return self.animation_atlases_dict[animations_directory]
+
+    # --------------------------------------------------------------------------------------
+    # Preloading
+
+    def find_image_keys(self, directory, alpha = False):
+
+        # Returns the keys of all of the images inside the directory and its subdirectories, which can be passed to the preload_images method
+        # Note: If a folder has a prebuilt animation atlas inside of it, only the atlas image is included (as the frames are never loaded)
+        image_keys = []
+
+        for folder_path, subfolder_names, file_names in os.walk(directory):
+
+            if "atlas.png" in file_names and "atlas.json" in file_names:
+                image_keys.append((os.path.join(folder_path, "atlas.png"), alpha))
+                subfolder_names.clear()
+                continue
+
+            # Sort the subfolders and files so that the images are always loaded in the same order
+            subfolder_names.sort()
+            image_keys.extend((os.path.join(folder_path, file_name), alpha) for file_name in sorted(file_names) if file_name.endswith(".png"))
+
+        return image_keys
+
+    def preload_images(self, image_keys, progress_callback = None, max_workers = None):
+
+        # Loads all of the images at once, where the images are decoded on a pool of threads and then converted on the main thread as each one finishes
+        # Note: progress_callback is called with (the number of images loaded, the number of images) each time an image has been loaded (e.g. to draw a loading bar)
+
+        # Only load the images which haven't been loaded yet
+        image_keys = [image_key for image_key in dict.fromkeys(image_keys) if image_key not in self.images_dict]
+
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+
+            # Start decoding each image on the thread pool
+            futures_dict = {executor.submit(pygame.image.load, image_key[0]): image_key for image_key in image_keys}
+
+            # As each image finishes decoding, add it to the loaded images and convert it (Converting uses the display, so it is done on the main thread)
+            for number_of_images_loaded, future in enumerate(as_completed(futures_dict), start = 1):
+                image_key = futures_dict[future]
+                self.images_dict[image_key] = future.result()
+                self.unconverted_image_keys.add(image_key)
+                self.load_image(*image_key)
+
+                if progress_callback != None:
+                    progress_callback(number_of_images_loaded, len(image_keys))
+
+
+# The asset manager shared by the whole game
+asset_manager = AssetManager()
@@ -3,4 +3,9 @@ screen_width = 1920
 screen_height = 1080
 
 # Tile size
-TILE_SIZE = 16
\ No newline at end of file
+TILE_SIZE = 16
+
+# Fixed timestep
+FIXED_TIMESTEP = False # Determines whether the player's physics are run using a fixed timestep, or once per frame using the frame's delta time (This can also be turned on with the --fixed-timestep option, e.g. "python Files/main.py --fixed-timestep")
+PHYSICS_TIMESTEP = 1 / 120 # The length of time of each physics step (in seconds)
+MAX_PHYSICS_STEPS_PER_FRAME = 8 # The maximum number of physics steps in a single frame (so that one slow frame doesn't cause even more slow frames)
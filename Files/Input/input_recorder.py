@@ -0,0 +1,68 @@
+import struct, atexit
+
+"""
+Binary input recording format (All numbers are little-endian):
+    - Header:
+        - Magic bytes "INPT" (4 bytes)
+        - Format version (uint16)
+        - The number of the level that was played (uint16)
+    - For each frame of the game that was played, in order:
+        - Delta time of the frame, in seconds (float64)
+        - Number of keys held down (uint8)
+        - Number of keys pressed since the last frame (uint8)
+        - Number of keys released since the last frame (uint8)
+        - The held keys, then the pressed keys, then the released keys (uint32 each, as pygame key constants)
+"""
+INPUT_RECORDING_MAGIC = b"INPT"
+INPUT_RECORDING_VERSION = 1
+INPUT_RECORDING_HEADER_FORMAT = "<4sHH"
+INPUT_FRAME_FORMAT = "<dBBB"
+
+class InputRecorder:
+    def __init__(self, file_path):
+
+        # Records the input snapshot and delta time of every frame of the game, so that the play session can be replayed exactly (e.g. with the input replayer)
+
+        # The path of the file that the recording is written to
+        self.file_path = file_path
+
+        # The recording file (Opened when the recording is started)
+        self.recording_file = None
+
+        # The number of frames that have been recorded
+        self.number_of_frames = 0
+
+        # Make sure that the recording is saved when the game is closed (Registered once, however many levels are recorded)
+        atexit.register(self.close)
+
+    def start(self, level_number):
+
+        # Start a new recording of the level (This is called once the level has been loaded)
+        self.close()
+        self.recording_file = open(self.file_path, "wb")
+        self.recording_file.write(struct.pack(INPUT_RECORDING_HEADER_FORMAT, INPUT_RECORDING_MAGIC, INPUT_RECORDING_VERSION, level_number))
+        self.number_of_frames = 0
+
+    def record_frame(self, delta_time, input_snapshot):
+
+        # Write the delta time and the keys of a single frame (Only if the recording has been started)
+        if self.recording_file != None:
+
+            # Sort the keys so that the same snapshot is always written in the same way
+            held_keys = sorted(input_snapshot.held_keys)
+            pressed_keys = sorted(input_snapshot.pressed_keys)
+            released_keys = sorted(input_snapshot.released_keys)
+
+            all_keys = held_keys + pressed_keys + released_keys
+
+            # Write the frame header, followed by all of the keys
+            self.recording_file.write(struct.pack(INPUT_FRAME_FORMAT, delta_time, len(held_keys), len(pressed_keys), len(released_keys)))
+            self.recording_file.write(struct.pack(f"<{len(all_keys)}I", *all_keys))
+            self.number_of_frames += 1
+
+    def close(self):
+
+        # Finish writing the recording
+        if self.recording_file != None:
+            self.recording_file.close()
+            self.recording_file = None
@@ -0,0 +1,44 @@
+import pygame
+from Input.input_snapshot import InputSnapshot
+
+class InputSampler:
+    def __init__(self):
+
+        # Tracks the state of the keyboard from the key events in the event loop, so that the keyboard doesn't need to be polled (e.g. with pygame.key.get_pressed) every time a key is checked
+
+        # Set of the keys that are currently being held down
+        self.held_keys = set()
+
+        # Sets of the keys that have been pressed / released since the last snapshot was taken
+        self.pressed_keys = set()
+        self.released_keys = set()
+
+    def handle_event(self, event):
+
+        # Update the state of the keyboard from a single event (Events which aren't key events are ignored)
+        match event.type:
+
+            # A key was pressed down
+            case pygame.KEYDOWN:
+                self.held_keys.add(event.key)
+                self.pressed_keys.add(event.key)
+
+            # A key was released
+            case pygame.KEYUP:
+                self.held_keys.discard(event.key)
+                self.released_keys.add(event.key)
+
+            # The window lost focus, so any keys released while the window didn't have focus will never send a KEYUP event
+            case pygame.WINDOWFOCUSLOST:
+                self.released_keys.update(self.held_keys)
+                self.held_keys.clear()
+
+    def take_snapshot(self):
+
+        # Returns the state of the keyboard for this frame, and starts tracking the keys pressed / released for the next frame
+        snapshot = InputSnapshot(held_keys = self.held_keys, pressed_keys = self.pressed_keys, released_keys = self.released_keys)
+
+        self.pressed_keys = set()
+        self.released_keys = set()
+
+        return snapshot
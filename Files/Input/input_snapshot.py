@@ -0,0 +1,21 @@
+class InputSnapshot:
+
+    # The names of the only attributes of an input snapshot (So that no other attributes can be added to a snapshot)
+    __slots__ = ("held_keys", "pressed_keys", "released_keys")
+
+    def __init__(self, held_keys = frozenset(), pressed_keys = frozenset(), released_keys = frozenset()):
+
+        # The state of the keyboard during a single frame, which is taken once per frame and never changed (so that it can be read many times per frame, or recorded and replayed)
+        # Note: The keys are pygame key constants (e.g. pygame.K_a)
+
+        self.held_keys = frozenset(held_keys) # The keys being held down during the frame
+        self.pressed_keys = frozenset(pressed_keys) # The keys that were pressed down since the last frame (The same as pygame.KEYDOWN events)
+        self.released_keys = frozenset(released_keys) # The keys that were released since the last frame (The same as pygame.KEYUP events)
+
+    def is_held(self, key):
+        # Returns True if the key is being held down
+        return key in self.held_keys
+
+    def was_pressed(self, key):
+        # Returns True if the key was pressed down since the last frame
+        return key in self.pressed_keys
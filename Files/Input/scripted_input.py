@@ -0,0 +1,31 @@
+import pygame
+from Input.input_sampler import InputSampler
+
+class ScriptedInput(InputSampler):
+    def __init__(self):
+
+        # An input source which can be used in place of the keyboard (e.g. when running without a display), where the keys are pressed and released by a script instead of the keyboard
+        # Note: The keys are pressed and released with the same key events that the input sampler receives from the event loop, so this creates the same input snapshots as the input sampler does
+        InputSampler.__init__(self)
+
+    def press_key(self, key):
+        # Start holding down the key
+        self.handle_event(pygame.event.Event(pygame.KEYDOWN, key = key))
+
+    def release_key(self, key):
+        # Stop holding down the key
+        self.handle_event(pygame.event.Event(pygame.KEYUP, key = key))
+
+    def tap_key(self, key):
+        # Press and release the key within the same frame
+        # Note: If the key is already being held down, it is only pressed (The keyboard can't release a key that is still being held down)
+
+        if key in self.held_keys:
+            self.pressed_keys.add(key)
+        else:
+            self.press_key(key)
+            self.release_key(key)
+
+    def set_held_keys(self, keys):
+        # Replace all of the keys that are being held down (without pressing or releasing any keys)
+        self.held_keys = set(keys)
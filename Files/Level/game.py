@@ -1,20 +1,55 @@
 import pygame, os
+import numpy as np
 from Global.settings import *
-from Level.world_tile import WorldTile
+from Global.asset_manager import asset_manager
+from Input.input_snapshot import InputSnapshot
+from Level.tile_grid import TileGrid
+from Level.tile_render_cache import TileRenderCache
 from Level.player import Player
+from Debug.frame_profiler import FrameProfiler
+from Level.screen_presenter import ScreenPresenter
 
 class Game:
-    def __init__(self):
+    def __init__(self, screen = None):
 
-        # Screen
-        self.screen = pygame.display.get_surface()  
+        # Screen (The display surface, unless another surface is passed in, e.g. an offscreen surface when running without a display)
+        self.screen = screen if screen != None else pygame.display.get_surface()
+
+        # Attribute which determines whether the scaled surface is drawn onto the screen at the end of each frame (This is turned off when running without a display and nothing needs to be shown)
+        self.draw_to_screen = True
+
+        # The state of the keyboard for the current frame (This is set every frame before the game is run, by the game states controller or a scripted input source when running without a display)
+        self.input_snapshot = InputSnapshot()
 
         # Create a surface for which all objects will be drawn onto. This surface is then scaled and drawn onto the main screen
         self.scaled_surface = pygame.Surface((screen_width / 4, screen_height / 4))
 
+        # Used to scale the scaled surface up to the size of the screen each frame (Scales into surfaces which are created once here, instead of creating a new surface every frame)
+        self.screen_presenter = ScreenPresenter(source_surface = self.scaled_surface, destination_size = (screen_width, screen_height))
+
         # Attribute which is monitored by the game states controller
         self.running = False
 
+        # The areas of the screen that have changed this frame (The whole scaled surface is redrawn and scaled onto the screen every frame, so this is always the entire screen)
+        self.dirty_rects = [self.screen.get_rect()]
+
+        # Fixed timestep
+        """
+        - When using a fixed timestep, the player's physics are run in steps which are always the same length of time, no matter how long each frame takes
+            - This means that the player moves in the same way at any frame rate (e.g. the player won't move through tiles at low frame rates)
+            - The player is drawn in between their positions at the last two physics steps, depending on how much time is left over
+        """
+        self.fixed_timestep = FIXED_TIMESTEP # Attribute which determines whether the player's physics are run using a fixed timestep, or once per frame using the frame's delta time (Set inside the settings)
+        self.physics_timestep = PHYSICS_TIMESTEP # The length of time of each physics step (in seconds)
+        self.max_physics_steps_per_frame = MAX_PHYSICS_STEPS_PER_FRAME # The maximum number of physics steps in a single frame (so that one slow frame doesn't cause even more slow frames)
+        self.physics_time_accumulator = 0 # The time that has passed which hasn't been simulated by a physics step yet
+        self.physics_time_tolerance = 1e-9 # The amount of time that the accumulator can be short of a full timestep, which is still counted as a full timestep (The sum of the delta times has floating point errors, e.g. 48 frames at 144 frames per second add up to slightly less than 40 steps of 1 / 120 seconds)
+        self.previous_player_position = None # The position of the player before the last physics step
+        self.unhandled_pressed_keys = set() # The keys that were pressed since the last physics step (These are handled at the start of the next physics step, as there may not be a physics step every frame)
+
+        # Profiler used to time each phase of the frame (Turned on / off by the game states controller)
+        self.frame_profiler = FrameProfiler()
+
         # Delta time attribute is created
         # self.delta_time = None
 
@@ -34,20 +69,36 @@ class Game:
 
         # --------------------------------------------------------------------------------------
         # Groups
-        self.all_tile_map_objects_group = pygame.sprite.Group() # Group for all tile map objects, including the player
-        self.world_tiles_dict = {} # Dictionary used to hold all the world tiles 
+        self.active_entities = [] # List of the tile map objects which change every frame and need to be updated with the delta time (e.g. the player). Static objects such as the world tiles are never added to this, so the cost of updating the objects doesn't grow with the size of the level
+        self.tile_chunk_streaming_distance = 1 # The number of chunks (each one scaled screen wide) either side of the screen which are baked and kept in memory, so that only the part of the level near the camera is baked (None = The whole level is baked when it is created)
+        self.tile_grid = TileGrid(tile_size = self.tile_size) # Grid used to hold the ID of the world tile inside each cell, which is also used to find the world tiles near a position without checking every world tile (This is filled inside the create_objects_tile_map method)
         # self.player_group = pygame.sprite.GroupSingle(self.player) This was created inside the create_objects_tile_map method
 
     # --------------------------------------------------------------------------------------
     # Misc methods
 
     def update_objects_delta_time(self, delta_time):
-        # Used to update the delta time attributes of all objects within the tile map
+        # Used to update the delta time attributes of all active objects within the tile map
+
+        # For all active entities
+        for active_entity in self.active_entities:
+            # Update the entity's delta time
+            active_entity.delta_time = delta_time
+
+    def add_active_entity(self, entity):
+        # Used to register an object which needs to be updated every frame (i.e. an object which moves or is animated)
 
-        # For all objects
-        for tile_map_object in self.all_tile_map_objects_group:
-            # Update the object's delta time
-            tile_map_object.delta_time = delta_time
+        # Add the entity to the list of active entities (if it hasn't been added already)
+        if entity not in self.active_entities:
+            self.active_entities.append(entity)
+
+    def draw_scaled_surface_onto_screen(self):
+
+        # Scale the scaled surface up to the size of the screen and draw it onto the screen
+        self.screen_presenter.present(self.screen)
+
+        # The entire screen has changed (The screen may have changed size, e.g. when changing from full screen to windowed mode)
+        self.dirty_rects = [self.screen.get_rect()]
 
     # --------------------------------------------------------------------------------------
     # Camera methods
@@ -67,22 +118,28 @@ class Game:
 
     def update_camera_position(self):   
         # Moves the camera's position depending on what mode the camera has been set tow
+
+        # The x position of the centre of the player (When the game uses a fixed timestep, this is the centre of where the player is drawn, which is in between the player's positions at the last two physics steps)
+        if self.player.interpolated_position == None:
+            player_centre_x = self.player.rect.centerx
+        else:
+            player_centre_x = self.player.interpolated_position[0] + (self.player.rect.width / 2)
         
         # If the camera mode is set to "Follow"
         if self.camera_mode == "Follow":
 
             # If the player is in half the width of the scaled screen from the first tile in the tile map
-            if 0 <= self.player.rect.centerx <= (self.scaled_surface.get_width() / 2):
+            if 0 <= player_centre_x <= (self.scaled_surface.get_width() / 2):
                 # Don't move the camera
                 camera_position_x = 0
 
             # If the player is in between half of the size of the scaled screen width from the first tile in the tile map and half the width of the scaled screen from the last tile in the tile map
-            elif 0+ (self.scaled_surface.get_width() / 2) < self.player.rect.centerx < self.last_tile_position[0] - (self.scaled_surface.get_width() / 2):
+            elif 0+ (self.scaled_surface.get_width() / 2) < player_centre_x < self.last_tile_position[0] - (self.scaled_surface.get_width() / 2):
                 # Set the camera to always follow the player
-                camera_position_x = self.player.rect.centerx - (self.scaled_surface.get_width() / 2)
+                camera_position_x = player_centre_x - (self.scaled_surface.get_width() / 2)
 
             # If the player is half the scaled screen width away from the last tile in the tile mapsw
-            elif self.player.rect.centerx >= self.last_tile_position[0] - (self.scaled_surface.get_width() / 2):
+            elif player_centre_x >= self.last_tile_position[0] - (self.scaled_surface.get_width() / 2):
                 # Set the camera to stop moving and be locked at half the size of the scaled screen width from the last tile in the tile map
                 camera_position_x = self.last_tile_position[0] - self.scaled_surface.get_width() 
 
@@ -109,62 +166,84 @@ class Game:
 
     def load_tile_map_images(self):
 
-        # Create a dictionary filled with all of the tiles' images
+        # Create a dictionary filled with all of the tiles' images (Loaded and converted through the asset manager, so they are only loaded once)
         # Note: Start at index 1 because the "0" tile represents nothing. 
-        self.tile_images = {i + 1: pygame.image.load(f"graphics/Tiles/{i + 1}.png").convert() for i in range(0, len(os.listdir("graphics/Tiles")))} 
+        self.tile_images = {i + 1: asset_manager.load_image(f"graphics/Tiles/{i + 1}.png") for i in range(0, len(os.listdir("graphics/Tiles")))} 
+
+    def prepare_tile_map(self, non_transformed_tile_map):
+        # Finds where each type of tile map object is inside the tile map, returning the (number of columns, number of rows) of the tile map, the (column, row) of the player and the tile IDs of the world tiles
+        # Note: This doesn't create any surfaces or change any attributes, so it can be run on the level loading thread while the menu is still being drawn
+
+        # Create an array of the tile map, so that the positions of each type of tile map object can be found without looping over every cell in Python
+        tile_map = np.asarray(non_transformed_tile_map)
+
+        # Find the position of the player in the tile map (The first row and column where the tile map object is 1)
+        player_rows, player_columns = np.nonzero(tile_map == 1)
+
+        # Find the world tiles, where the ID of each world tile is the number of its image (i.e. 1)
+        # Note: The boolean array of the world tiles is viewed as bytes, so that the tile grid doesn't need another copy of the tile map (i.e. True = 1, False = 0)
+        world_tile_ids = (tile_map == 2).view(np.uint8)
+
+        return (tile_map.shape[1], tile_map.shape[0]), (int(player_columns[0]), int(player_rows[0])), world_tile_ids
 
     def create_objects_tile_map(self, non_transformed_tile_map):
-        # Note: The objects tile map is created by the gamestates controller within the load_level method
 
-        # Counter used as the key in self.world_tiles_dict, (e.g. Tile 1, Tile 2, Tile 3...)
-        world_tile_counter = 1 
+        # Prepare the tile map and create the level's objects from it
+        self.create_objects_from_prepared_tile_map(self.prepare_tile_map(non_transformed_tile_map))
 
-        # For all rows of objects in the tile map
-        for row_index, row in enumerate(non_transformed_tile_map):
-            # For each item in each row
-            for column_index, tile_map_object in enumerate(row):
+    def create_objects_from_prepared_tile_map(self, prepared_tile_map):
+        # Note: The objects tile map is created by the gamestates controller once the level has been loaded (The tile map is prepared on the level loading thread, but the objects need to be created on the main thread as they create surfaces)
 
-                # Identify the tile map object
-                match tile_map_object:
+        # Remove the active entities from a previous tile map
+        self.active_entities = []
 
-                    # Player
-                    case 1:
-                        # Create the player
-                        self.player = Player(x = (column_index * self.tile_size), y = (row_index * self.tile_size), surface = self.scaled_surface)
+        tile_map_size, (player_column, player_row), world_tile_ids = prepared_tile_map
 
-                        # Add the player to its group
-                        self.player_group = pygame.sprite.GroupSingle(self.player)
+        # ---------------------------------------------
+        # Player
 
-                        # Add the player to the group of all tile map objects
-                        self.all_tile_map_objects_group.add(self.player)
+        # Create the player
+        self.player = Player(x = (player_column * self.tile_size), y = (player_row * self.tile_size), surface = self.scaled_surface)
 
-                    # World tile 1
-                    case 2:
-                        # Create a world tile
-                        world_tile = WorldTile(x = (column_index * self.tile_size), y = (row_index * self.tile_size), image = pygame.transform.smoothscale(self.tile_images[1], (self.tile_size, self.tile_size)))
+        # Add the player to its group
+        self.player_group = pygame.sprite.GroupSingle(self.player)
 
-                        # Add the world tile to the world tiles dictionary
-                        # The key is the world tile because we use pygame.rect.collidedict in other areas of the code, the value is the number of the world tile
+        # Register the player as an active entity, so that its delta time is updated every frame
+        self.add_active_entity(self.player)
 
-                        #self.world_tiles_dict[world_tile_counter] = world_tile
-                        self.world_tiles_dict[world_tile] = world_tile_counter
+        # ---------------------------------------------
+        # World tile 1
 
-                        # Add it to the group of all tile map objects
-                        self.all_tile_map_objects_group.add(world_tile)
+        # Scale the world tile image once, so that all of the world tiles share the same image
+        world_tile_image = pygame.transform.smoothscale(self.tile_images[1], (self.tile_size, self.tile_size))
 
-                        # Increment the world tile counter
-                        world_tile_counter += 1
+        # Fill the tile grid with the world tiles
+        # Note: No object is created for each world tile, the rects of the world tiles are only created when they are needed (e.g. for collisions with the player)
+        self.tile_grid.set_tiles(tile_ids = world_tile_ids, tile_images = {1: world_tile_image})
 
         # Save the last tile position so that we can update the camera and limit the player's movement
-        self.last_tile_position = [len(non_transformed_tile_map[0]) * self.tile_size, len(non_transformed_tile_map) * self.tile_size]
+        self.last_tile_position = [tile_map_size[0] * self.tile_size, tile_map_size[1] * self.tile_size]
         self.player.last_tile_position = self.last_tile_position
 
-        # Save a copy of the world tiles dict for the player, this is so that we can control the gravity strength when at greater heights
-        self.player.world_tiles_dict = self.world_tiles_dict
+        # Give the player the tile grid, so that the player can find the tiles it would hit when moving
+        self.player.tile_grid = self.tile_grid
+
+        # Draw all of the world tiles onto chunks which are one scaled screen wide, so that only the chunks on the screen need to be drawn each frame (The world tiles never move)
+        # Note: If streaming, the chunks are only baked once they are near the camera, and are removed once they are far away from the camera
+        self.tile_render_cache = TileRenderCache(chunk_width = self.scaled_surface.get_width(), chunk_height = self.last_tile_position[1], streaming_distance = self.tile_chunk_streaming_distance)
+        self.tile_render_cache.bake_tiles(self.tile_grid)
 
         # Set the camera mode 
         self.set_camera_mode()
 
+        # Start the fixed timestep from the player's spawning position
+        self.physics_time_accumulator = 0
+        self.previous_player_position = self.player.rect.topleft
+        self.unhandled_pressed_keys.clear()
+
+        # Start the camera at the player's spawning position (When the game uses a fixed timestep, the physics steps are run before the camera is updated each frame)
+        self.update_camera_position()
+
     def draw_tile_map_objects(self):
 
         # Calls the draw methods of all objects in the level
@@ -172,35 +251,50 @@ class Game:
         # ---------------------------------------------
         # World tiles
 
-        for world_tile in self.world_tiles_dict.keys():
+        # Draw the chunks of world tiles that are on the screen
+        self.tile_render_cache.draw(surface = self.scaled_surface, camera_position = self.camera_position)
 
-            # Check the x co-ordinate of the camera
-            match self.camera_position[0]:
+    # --------------------------------------------------------------------------------------
+    # Gameplay methods
 
-                # If the camera is positioned at the start of the tile map and the object is within the boundaries of the screen
-                case 0 if world_tile.rect.x <= self.scaled_surface.get_width():
+    def find_neighbouring_tiles_to_player(self):
 
-                    # Draw all tile objects on the screen
-                    world_tile.draw(surface = self.scaled_surface, x = (world_tile.rect.x - self.camera_position[0]), y = (world_tile.rect.y - self.camera_position[1]))
+        # Used to find the closest tiles to the player to check for collisions (Used for greater performance, as we are only checking for collisions with tiles near the player)
+        
+        # Create a rect which covers all of the cells that a neighbouring tile could be in (i.e. within 1 tile of the player horizontally, 2 tiles above and 1 tile below the player)
+        neighbouring_cells_rect = pygame.Rect(self.player.rect.left - self.tile_size, self.player.rect.top - (self.tile_size * 2), self.player.rect.width + (self.tile_size * 2), self.player.rect.height + (self.tile_size * 3))
 
-                # If the camera is positioned at the end of the tile map and the tile object is within the boundaries of the screen
-                case _ if (self.last_tile_position[0] - self.scaled_surface.get_width()) == self.camera_position[0] and world_tile.rect.x >= self.camera_position[0]:
+        # Empty the player's neighbouring tiles dictionary, as the player may have moved away from the previous neighbouring tiles
+        self.player.neighbouring_tiles_dict.clear()
 
-                    # Draw all tile objects on the screen
-                    world_tile.draw(surface = self.scaled_surface, x = (world_tile.rect.x - self.camera_position[0]), y = (world_tile.rect.y - self.camera_position[1]))
+        # For each world tile inside the cells near the player
+        for world_tile_cell, world_tile_rect in self.tile_grid.find_tiles_in_rect(neighbouring_cells_rect).items():
 
-                # If the camera is neither at the start or the end of the tile map and the object is within the boundaries of the screen
-                case _ if self.player.rect.left - ((self.scaled_surface.get_width() / 2) + self.tile_size)  <= world_tile.rect.x <= self.player.rect.right + (self.scaled_surface.get_width() / 2): 
+            # If the world tile is within 1 tiles of the player (horizontally and vertically)
+            if (self.player.rect.left  - (self.tile_size) <= world_tile_rect.centerx <= self.player.rect.right + (self.tile_size)) and (self.player.rect.top - (self.tile_size * 2) <= world_tile_rect.centery <= (self.player.rect.bottom + self.tile_size * 1)):
 
-                    # Draw the tile object at the camera position
-                    world_tile.draw(surface = self.scaled_surface, x = (world_tile.rect.x - self.camera_position[0]), y = (world_tile.rect.y - self.camera_position[1]))
+                # Add its rect to the player's neighbouring tiles dictionary
+                # Note: The key is the cell of the world tile and the value is the world tile's rect, as rects can't be used as keys (pygame.Rect.collidedict is used with the values instead)
+                self.player.neighbouring_tiles_dict[world_tile_cell] = world_tile_rect
 
-    # --------------------------------------------------------------------------------------
-    # Gameplay methods
+    def find_closest_ground_tile_to_player(self):
 
-    def find_neighbouring_tiles_to_player(self):
+        # Used to find the closest ground tile to the player, so that we can control the strength of gravity
+        
+        # Find the rects of the closest tiles below and above the player, in each of the columns that the player is inside of
+        closest_ground_tile = self.tile_grid.find_closest_tile_below(self.player.rect)
+        closest_ceiling_tile = self.tile_grid.find_closest_tile_above(self.player.rect)
 
-        # Used to find the closest tiles to the player to check for collisions (Used for greater performance, as we are only checking for collisions with tiles near the player)
+        # Set the player's closest ground tile (This will be None if there is no closest ground tile, i.e. the player is floating in mid-air)
+        self.player.closest_ground_tile = closest_ground_tile
+
+        # Set the player's closest ceiling tile (This will be None if there is no closest ceiling tile)
+        self.player.closest_ceiling_tile = closest_ceiling_tile
+
+    def draw_tile_lookup_debug_overlay(self):
+
+        # Draws the areas that the player's neighbouring tiles are found in and the player's closest ground and ceiling tiles
+        # Note: This is drawn once per frame after the world tiles, so it isn't drawn over when the game uses a fixed timestep (where the tiles are found once per physics step)
 
         # Grid lines to show neighbouring tiles
         pygame.draw.line(self.scaled_surface, "white", (0 - self.camera_position[0], self.player.rect.top), (screen_width, self.player.rect.top))
@@ -214,60 +308,61 @@ class Game:
 
 
         pygame.draw.rect(self.scaled_surface, "purple", (self.player.rect.x - self.camera_position[0], self.player.rect.y - self.camera_position[1], self.player.rect.width, self.player.rect.height), 0)
-        
-        # For each world tile in the world tiles
-        for world_tile, world_tile_number in self.world_tiles_dict.items():
 
-            # If the world tile is within 1 tiles of the player (horizontally and vertically)
-            if (self.player.rect.left  - (self.tile_size) <= world_tile.rect.centerx <= self.player.rect.right + (self.tile_size)) and (self.player.rect.top - (self.tile_size * 2) <= world_tile.rect.centery <= (self.player.rect.bottom + self.tile_size * 1)):
+        # If there is a closest ground tile
+        if self.player.closest_ground_tile != None:
+            pygame.draw.rect(self.scaled_surface, "white", pygame.Rect(self.player.closest_ground_tile.x - self.camera_position[0], self.player.closest_ground_tile.y - self.camera_position[1], self.player.closest_ground_tile.width, self.player.closest_ground_tile.height))
 
-                # Add it to the player's neighbouring tiles dictionary
-                self.player.neighbouring_tiles_dict[world_tile] = world_tile_number
+        # If there is a closest ceiling tile
+        if self.player.closest_ceiling_tile != None:
+            pygame.draw.rect(self.scaled_surface, "white", pygame.Rect(self.player.closest_ceiling_tile.x - self.camera_position[0], self.player.closest_ceiling_tile.y - self.camera_position[1], self.player.closest_ceiling_tile.width, self.player.closest_ceiling_tile.height))
+    
+    def run_fixed_timestep_physics(self, delta_time):
+        # Runs the player's physics in steps of a fixed length of time, for all of the time that has passed since the last frame
 
-            # If the world tile is not within 1 tiles of the player (horizontally and vertically)
-            else:
-                # If the world tile is inside the neighbouring tiles dict's values
-                if world_tile_number in self.player.neighbouring_tiles_dict.values():
-                    # Remove the world tile from the neighbouring tiles dictionary
-                    self.player.neighbouring_tiles_dict.pop(world_tile)
+        # Add the time that has passed since the last frame
+        self.physics_time_accumulator += delta_time
 
-    def find_closest_ground_tile_to_player(self):
+        # Run a physics step for every full timestep that has passed
+        number_of_physics_steps = 0
 
-        # Used to find the closest ground tile to the player, so that we can control the strength of gravity
-        
-        # Create a rect used for finding the closest ground tile, which starts from the bottom of the player to the bottom of the screen
-        finding_closest_ground_tile_rect = pygame.Rect(self.player.rect.x, self.player.rect.bottom, self.player.image.get_width(), self.scaled_surface.get_height() - self.player.rect.bottom)
-        #pygame.draw.rect(self.scaled_surface, "red", (finding_closest_ground_tile_rect.x - self.camera_position[0], finding_closest_ground_tile_rect.y - self.camera_position[1], finding_closest_ground_tile_rect.width, finding_closest_ground_tile_rect.height))
+        while self.physics_time_accumulator >= self.physics_timestep - self.physics_time_tolerance and number_of_physics_steps < self.max_physics_steps_per_frame:
 
-        finding_closest_ceiling_tile_rect = pygame.Rect(self.player.rect.x, 0, self.player.image.get_width(), self.player.rect.top)
-        pygame.draw.rect(self.scaled_surface, "red", (finding_closest_ceiling_tile_rect.x - self.camera_position[0], finding_closest_ceiling_tile_rect.y - self.camera_position[1], finding_closest_ceiling_tile_rect.width, finding_closest_ceiling_tile_rect.height))
+            # Save the player's position before the step, so that the player can be drawn in between the positions before and after the step
+            self.previous_player_position = self.player.rect.topleft
 
-        # Check for tiles inside the world tiles dictionary for collisions 
-        closest_ground_tile = finding_closest_ground_tile_rect.collidedict(self.world_tiles_dict)
-        closest_ceiling_tile = finding_closest_ceiling_tile_rect.collidedict(self.world_tiles_dict)
+            # The player's physics use the length of the timestep instead of the frame's delta time
+            self.player.delta_time = self.physics_timestep
+
+            # Handle the keys that were pressed since the last physics step (e.g. jumping), so that the player only moves in between saving its position and the end of the step
+            if len(self.unhandled_pressed_keys) > 0:
+                self.player.input_snapshot = InputSnapshot(held_keys = self.input_snapshot.held_keys, pressed_keys = self.unhandled_pressed_keys)
+                self.player.handle_pressed_keys()
+                self.player.input_snapshot = self.input_snapshot
+                self.unhandled_pressed_keys.clear()
+
+            # Find the player's neighbouring tiles and closest ground tile at the player's current position, then move the player
+            self.find_neighbouring_tiles_to_player()
+            self.find_closest_ground_tile_to_player()
+            self.player.update_physics()
+
+            self.physics_time_accumulator -= self.physics_timestep
+            number_of_physics_steps += 1
+
+        # If the maximum number of physics steps was reached, drop the time that couldn't be simulated (otherwise the physics would fall further and further behind)
+        if self.physics_time_accumulator >= self.physics_timestep - self.physics_time_tolerance:
+            self.physics_time_accumulator %= self.physics_timestep
+
+        # Find how far the player is in between the last two physics steps (0 = At the position before the last step, 1 = At the position after the last step)
+        # Note: The accumulator can be slightly less than 0 after a step which was counted as a full timestep
+        interpolation_amount = max(self.physics_time_accumulator / self.physics_timestep, 0)
+
+        # Set the position that the player is drawn at
+        self.player.interpolated_position = (
+                                            self.previous_player_position[0] + ((self.player.rect.x - self.previous_player_position[0]) * interpolation_amount),
+                                            self.previous_player_position[1] + ((self.player.rect.y - self.previous_player_position[1]) * interpolation_amount)
+                                            )
 
-        # If there is no closest ground tile, i.e. the player is floating in mid-air
-        if closest_ground_tile == None:
-            # Set the player's closest ground tile as None
-            self.player.closest_ground_tile = None
-        
-        # If there is a closest ground tile
-        if closest_ground_tile != None:
-            # Set that players closest ground tile as the closest ground tile found (closest_ground_tile[0] = The world tile, closest_ground_tile[1] = The world tile number)
-            self.player.closest_ground_tile = closest_ground_tile[0]
-            pygame.draw.rect(self.scaled_surface, "white", pygame.Rect(closest_ground_tile[0].rect.x - self.camera_position[0], closest_ground_tile[0].rect.y- self.camera_position[1], closest_ground_tile[0].rect.width, closest_ground_tile[0].rect.height))
-
-        # If there is no closest ceiling tile
-        if closest_ceiling_tile == None:
-            # Set the player's closest ceiling tile as None
-            self.player.closest_ceiling_tile = None
-        
-        # If there is a closest ceiling tile
-        if closest_ceiling_tile != None:
-            # Set that players closest ceiling tile as the closest ceiling tile found (closest_ceiling_tile[0] = The world tile, closest_ceiling_tile[1] = The world tile number)
-            self.player.closest_ceiling_tile = closest_ceiling_tile[0]
-            pygame.draw.rect(self.scaled_surface, "white", pygame.Rect(closest_ceiling_tile[0].rect.x - self.camera_position[0], closest_ceiling_tile[0].rect.y- self.camera_position[1], closest_ceiling_tile[0].rect.width, closest_ceiling_tile[0].rect.height))
-    
     def handle_collisions(self):
         
         # Save for later (for enemies, etc.)
@@ -281,29 +376,87 @@ class Game:
 
     def run(self, delta_time):
 
+        # Start timing the frame (Only if the frame profiler is turned on)
+        self.frame_profiler.start_frame()
+
+        # Give the player the state of the keyboard for this frame, and handle the keys that were pressed since the last frame (e.g. jumping)
+        self.frame_profiler.start_phase("Input")
+        self.player.input_snapshot = self.input_snapshot
+
+        # If the player's physics are run using a fixed timestep, the pressed keys are handled at the start of the next physics step
+        if self.fixed_timestep == True:
+            self.unhandled_pressed_keys.update(self.input_snapshot.pressed_keys)
+        else:
+            self.player.handle_pressed_keys()
+
         # Update the delta time of all objects 
+        self.frame_profiler.start_phase("Delta time")
         self.update_objects_delta_time(delta_time)
         
         # Fill the scaled surface with a colour
+        self.frame_profiler.start_phase("Fill")
         self.scaled_surface.fill("darkolivegreen")
 
+        # If the player's physics are run using a fixed timestep
+        if self.fixed_timestep == True:
+            # Run the physics steps for the time that has passed since the last frame
+            # Note: This is done before the camera is updated, so that the camera follows the position that the player is drawn at this frame
+            self.frame_profiler.start_phase("Physics steps")
+            self.run_fixed_timestep_physics(delta_time)
+
+        # If the player's physics are run once per frame, the player is drawn at the position of its rect (The interpolated position may have been left over from when the game used a fixed timestep)
+        elif self.player.interpolated_position != None:
+            self.player.interpolated_position = None
+
         # Update the camera position 
+        self.frame_profiler.start_phase("Camera")
         self.update_camera_position()
 
         # Draw all objects inside the tile map / level
+        self.frame_profiler.start_phase("Tile drawing")
         self.draw_tile_map_objects()
 
         # # Handle collisions between all objects in the level
         # self.handle_collisions()
 
-        # Find the player's neighbouring tiles
-        self.find_neighbouring_tiles_to_player()
+        # If the player's physics are run using a fixed timestep
+        if self.fixed_timestep == True:
+
+            # Draw the tiles found during the last physics step
+            self.frame_profiler.start_phase("Debug overlay")
+            self.draw_tile_lookup_debug_overlay()
+
+            # Play the player's animations (using the frame's delta time), drawing the player at the interpolated position
+            self.frame_profiler.start_phase("Player")
+            self.player.delta_time = delta_time
+            self.player.play_animations()
+
+        # If the player's physics are run once per frame, using the frame's delta time
+        else:
+            # Find the player's neighbouring tiles
+            self.frame_profiler.start_phase("Neighbouring tiles")
+            self.find_neighbouring_tiles_to_player()
         
-        # Find the closest ground tile to the player
-        self.find_closest_ground_tile_to_player()
+            # Find the closest ground tile to the player
+            self.frame_profiler.start_phase("Ground and ceiling tiles")
+            self.find_closest_ground_tile_to_player()
+
+            # Draw the tiles that were found
+            self.frame_profiler.start_phase("Debug overlay")
+            self.draw_tile_lookup_debug_overlay()
 
-        # Run the player methods
-        self.player.run()
+            # Run the player methods
+            self.frame_profiler.start_phase("Player")
+            self.player.run()
 
         # Draw the scaled surface onto the screen
-        self.screen.blit(pygame.transform.scale(self.scaled_surface, (screen_width, screen_height)), (0, 0))
\ No newline at end of file
+        if self.draw_to_screen == True:
+            self.frame_profiler.start_phase("Scale and blit")
+            self.draw_scaled_surface_onto_screen()
+
+        # Stop timing the frame
+        self.frame_profiler.end_frame()
+
+        # Draw the frame profiler's overlay onto the screen (if it is being shown)
+        if self.draw_to_screen == True:
+            self.frame_profiler.draw_overlay(self.screen)
@@ -0,0 +1,115 @@
+import struct, sys, zlib
+from array import array
+
+"""
+Binary level file format (All numbers are little-endian):
+    - Header:
+        - Magic bytes "LVLS" (4 bytes)
+        - Format version (uint16)
+        - Number of levels (uint16)
+        - CRC-32 checksum of the text file that the levels were compiled from (uint32), so that the loader can tell if the text file has been edited since it was compiled
+    - Level index, so that a level can be read without reading the levels before it. For each level, in order:
+        - The position of the level from the start of the file, in bytes (uint32)
+        - The length of the level, in bytes (uint32)
+    - For each level, in order:
+        - Number of columns (uint16)
+        - Number of rows (uint16)
+        - Bytes per tile number (uint8), which is 1 if all tile numbers in the level fit inside a uint8, otherwise 2
+        - The tile numbers of the level, row by row (columns * rows * bytes per tile number bytes)
+"""
+LEVEL_FILE_MAGIC = b"LVLS"
+LEVEL_FILE_VERSION = 3
+LEVEL_FILE_HEADER_FORMAT = "<4sHHI"
+LEVEL_INDEX_ENTRY_FORMAT = "<II"
+LEVEL_HEADER_FORMAT = "<HHB"
+
+class LevelCompiler:
+    def __init__(self, text_file_path, binary_file_path):
+
+        # The paths of the level tile maps text file (the source) and the binary file that it is compiled into
+        self.text_file_path = text_file_path
+        self.binary_file_path = binary_file_path
+
+    def read_text_file(self):
+        # Returns the contents of the text file and its checksum
+        # Note: The text file is read with universal newlines, so the checksum is the same whichever line endings the text file was checked out with
+
+        with open(self.text_file_path, "r") as level_tile_maps_file:
+            level_tile_maps = level_tile_maps_file.read()
+
+        return level_tile_maps, zlib.crc32(level_tile_maps.encode())
+
+    def find_text_file_checksum(self):
+        # Returns the checksum of the text file (Used to check that the binary file was compiled from the current text file)
+        return self.read_text_file()[1]
+
+    def parse_tile_map(self, tile_map):
+        # Converts a single tile map from the text file (e.g. "?0!0!2!,0!1!2!,") into a list of rows of tile numbers
+
+        # Remove the "?" separator and the "\n" line break at the start and end of the tile map
+        tile_map = tile_map.strip().lstrip("?")
+
+        # Each row ends with a "," separator and each tile number inside the row ends with a "!" separator (So the last item after splitting is always empty)
+        non_transformed_tile_map = [[int(tile_number) for tile_number in row.split("!")[:-1]] for row in tile_map.split(",")[:-1]]
+
+        # All rows in the tile map must be the same length, as the level is stored as a grid
+        if len(non_transformed_tile_map) == 0 or any(len(row) != len(non_transformed_tile_map[0]) for row in non_transformed_tile_map):
+            raise ValueError("Tile maps must have at least one row and all rows must be the same length")
+
+        return non_transformed_tile_map
+
+    def compile_level(self, non_transformed_tile_map):
+        # Converts a tile map (a list of rows of tile numbers) into the bytes of a single level in the binary file
+
+        # Find the size of the level
+        number_of_columns = len(non_transformed_tile_map[0])
+        number_of_rows = len(non_transformed_tile_map)
+
+        # Use the smallest type that can hold all of the tile numbers in the level
+        if max(max(row) for row in non_transformed_tile_map) <= 255:
+            tile_numbers = array("B")
+        else:
+            tile_numbers = array("H")
+
+        # Add all of the tile numbers, row by row
+        for row in non_transformed_tile_map:
+            tile_numbers.extend(row)
+
+        # The binary file is little-endian
+        if tile_numbers.itemsize > 1 and sys.byteorder == "big":
+            tile_numbers.byteswap()
+
+        return struct.pack(LEVEL_HEADER_FORMAT, number_of_columns, number_of_rows, tile_numbers.itemsize) + tile_numbers.tobytes()
+
+    def compile(self):
+        # Compiles all of the tile maps inside the text file into the binary file
+
+        # Read all of the tile maps in the text file (One tile map per line)
+        level_tile_maps, text_file_checksum = self.read_text_file()
+        tile_maps = [tile_map for tile_map in level_tile_maps.split("\n") if tile_map.strip() != ""]
+
+        # Compile each level
+        compiled_levels = [self.compile_level(self.parse_tile_map(tile_map)) for tile_map in tile_maps]
+
+        # Create the level index (The first level starts straight after the header and the level index)
+        level_index = b""
+        level_offset = struct.calcsize(LEVEL_FILE_HEADER_FORMAT) + (len(compiled_levels) * struct.calcsize(LEVEL_INDEX_ENTRY_FORMAT))
+
+        for compiled_level in compiled_levels:
+            level_index += struct.pack(LEVEL_INDEX_ENTRY_FORMAT, level_offset, len(compiled_level))
+            level_offset += len(compiled_level)
+
+        # Write the header and the level index, followed by all of the levels
+        with open(self.binary_file_path, "wb") as level_tile_maps_binary_file:
+            level_tile_maps_binary_file.write(struct.pack(LEVEL_FILE_HEADER_FORMAT, LEVEL_FILE_MAGIC, LEVEL_FILE_VERSION, len(compiled_levels), text_file_checksum))
+            level_tile_maps_binary_file.write(level_index)
+
+            for compiled_level in compiled_levels:
+                level_tile_maps_binary_file.write(compiled_level)
+
+
+if __name__ == "__main__":
+    # Compile the level tile maps text file into the binary file (Run from the root folder of the game, e.g. "python Files/Level/level_compiler.py")
+    # Note: This must be run after editing the text file, as the game only reads the binary file (and won't load levels from a binary file that is out of date)
+    level_compiler = LevelCompiler(text_file_path = "Files/Level/level_tile_maps.txt", binary_file_path = "Files/Level/level_tile_maps.bin")
+    level_compiler.compile()
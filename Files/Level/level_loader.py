@@ -0,0 +1,59 @@
+import os, struct
+import numpy as np
+from Level.level_compiler import LevelCompiler, LEVEL_FILE_MAGIC, LEVEL_FILE_VERSION, LEVEL_FILE_HEADER_FORMAT, LEVEL_INDEX_ENTRY_FORMAT, LEVEL_HEADER_FORMAT
+
+class LevelLoader:
+    def __init__(self, text_file_path = "Files/Level/level_tile_maps.txt", binary_file_path = "Files/Level/level_tile_maps.bin"):
+
+        # The paths of the level tile maps text file and the binary file that the levels are loaded from
+        # Note: The levels are only ever read from the binary file, which is compiled from the text file with the level compiler (i.e. "python Files/Level/level_compiler.py")
+        self.text_file_path = text_file_path
+        self.binary_file_path = binary_file_path
+
+    def find_level_location(self, chosen_level_number):
+        # Returns the position and length (in bytes) of the chosen level inside the binary file (Levels are numbered from 1)
+
+        # The binary file is never compiled while the game is running, so it must have been compiled already
+        if os.path.exists(self.binary_file_path) == False:
+            raise FileNotFoundError(f"{self.binary_file_path} does not exist, compile the levels with \"python Files/Level/level_compiler.py\"")
+
+        with open(self.binary_file_path, "rb") as level_tile_maps_binary_file:
+
+            # Read the header
+            magic, version, number_of_levels, text_file_checksum = struct.unpack(LEVEL_FILE_HEADER_FORMAT, level_tile_maps_binary_file.read(struct.calcsize(LEVEL_FILE_HEADER_FORMAT)))
+
+            if magic != LEVEL_FILE_MAGIC or version != LEVEL_FILE_VERSION:
+                raise ValueError(f"{self.binary_file_path} is not a version {LEVEL_FILE_VERSION} level file, compile the levels with \"python Files/Level/level_compiler.py\"")
+
+            # If the text file has been edited since the binary file was compiled (The checksum is used instead of the time that the files were modified, which can be in any order after checking out the files)
+            if os.path.exists(self.text_file_path) and text_file_checksum != LevelCompiler(text_file_path = self.text_file_path, binary_file_path = self.binary_file_path).find_text_file_checksum():
+                raise ValueError(f"{self.binary_file_path} is out of date with {self.text_file_path}, compile the levels with \"python Files/Level/level_compiler.py\"")
+
+            if not (1 <= chosen_level_number <= number_of_levels):
+                raise ValueError(f"Level {chosen_level_number} does not exist, there are {number_of_levels} levels")
+
+            # Find the position and length of the chosen level from the level index
+            level_tile_maps_binary_file.seek(struct.calcsize(LEVEL_FILE_HEADER_FORMAT) + ((chosen_level_number - 1) * struct.calcsize(LEVEL_INDEX_ENTRY_FORMAT)))
+            return struct.unpack(LEVEL_INDEX_ENTRY_FORMAT, level_tile_maps_binary_file.read(struct.calcsize(LEVEL_INDEX_ENTRY_FORMAT)))
+
+    def load_level_grid(self, chosen_level_number):
+        # Returns the tile map of the chosen level as a 2D array of tile numbers, indexed by [row, column] (Levels are numbered from 1)
+        # Note: Only the chosen level is read from the binary file, and the file is closed as soon as the level has been read
+        """
+        - The level used to be memory-mapped (np.memmap), but a memory map keeps the binary file open for as long as the level's array is alive, which stops the binary file from being replaced (e.g. by the level compiler)
+        - Every tile number is read when the tile map is prepared anyway, so reading the level straight into an array costs the same as the memory map, without keeping the file open
+        """
+
+        # Find the position of the chosen level
+        level_offset, level_length = self.find_level_location(chosen_level_number)
+
+        with open(self.binary_file_path, "rb") as level_tile_maps_binary_file:
+
+            # Read the header of the level
+            level_tile_maps_binary_file.seek(level_offset)
+            number_of_columns, number_of_rows, bytes_per_tile_number = struct.unpack(LEVEL_HEADER_FORMAT, level_tile_maps_binary_file.read(struct.calcsize(LEVEL_HEADER_FORMAT)))
+
+            # Read the tile numbers after the header straight into an array (The binary file is little-endian)
+            tile_numbers = np.fromfile(level_tile_maps_binary_file, dtype = "<u1" if bytes_per_tile_number == 1 else "<u2", count = number_of_columns * number_of_rows)
+
+        return tile_numbers.reshape(number_of_rows, number_of_columns)
@@ -1,5 +1,7 @@
 import pygame, os
 from Global.generic import Generic
+from Global.asset_manager import asset_manager
+from Input.input_snapshot import InputSnapshot
 from Global.settings import *
 
 class Player(Generic, pygame.sprite.Sprite):
@@ -8,6 +10,12 @@ class Player(Generic, pygame.sprite.Sprite):
         # Surface that the player is drawn onto
         self.surface = surface
 
+        # The state of the keyboard for the current frame, which the player's input is read from (This is updated by "Game" every frame)
+        self.input_snapshot = InputSnapshot()
+
+        # The delta time of the current frame (This is updated by "Game" every frame, but the player can jump on the first frame before it has been updated, so it starts at 0)
+        self.delta_time = 0
+
         # ---------------------------------------------------------------------------------
         # Movement
 
@@ -20,7 +28,7 @@ class Player(Generic, pygame.sprite.Sprite):
         self.load_animations()
 
         # Inherit from the Generic class, which has basic attributes and methods.
-        Generic.__init__(self, x = x, y = y, image = self.animations_dict[self.current_player_element][self.current_animation_state][self.animation_index])
+        Generic.__init__(self, x = x, y = y, image = self.animations_dict[self.current_player_element]["Right"][self.current_animation_state][self.animation_index])
 
         # Inherit from pygame's sprite class
         pygame.sprite.Sprite.__init__(self) 
@@ -30,12 +38,15 @@ class Player(Generic, pygame.sprite.Sprite):
         """
         self.camera_position = None # Position of the camera. This is updated inside "Game" class
         self.last_tile_position = None # Position of the last tile that the player can be on. This will be updated by "Game" when the level is created
-        self.closest_ground_tile = None # Used to hold the closest ground tile to the player.
 
         """
-        self.neighbouring_tiles_dict = {} # Used to hold the neighbouring tiles near the player (i.e. within 1 tile of the player, horizontally and vertically)
+        self.closest_ground_tile = None # Used to hold the rect of the closest ground tile to the player (This is updated by "Game" before the player moves)
+        self.closest_ceiling_tile = None # Used to hold the rect of the closest ceiling tile to the player (This is updated by "Game" before the player moves)
+        self.tile_grid = None # The tile grid of the level, used to find the tiles that the player would hit when moving. This will be updated by "Game" when the level is created
+        self.neighbouring_tiles_dict = {} # Used to hold the rects of the neighbouring tiles near the player (i.e. within 1 tile of the player, horizontally and vertically), the key is the (column, row) of the tile
         self.dx = 0 # The distance the player can move based on if there were any collisions
         self.dy = 0 # The distance the player can move based on if there were any collisions
+        self.interpolated_position = None # The position that the player is drawn at when the game uses a fixed timestep (This is updated by "Game" after each frame's physics steps, otherwise the player is drawn at the position of its rect)
         # ---------------------------------------------------------------------------------
         # Additional movement 
         
@@ -84,14 +95,16 @@ class Player(Generic, pygame.sprite.Sprite):
         self.current_player_element = "Ice" # ["Combined", "Fire", "Ice"]
         self.current_animation_state = "Idle"
 
-        # A dictionary that will hold all of the animations
-        self.animations_dict = {"Ice": {"Idle": [pygame.image.load(f"graphics/Player/Ice/Idle/{i}.png") for i in range(len(os.listdir("graphics/Player/Ice/Idle")))],
-                                        "Run": [pygame.image.load(f"graphics/Player/Ice/Run/{i}.png") for i in range(len(os.listdir("graphics/Player/Ice/Run")))],
-                                        "Jump": [pygame.image.load(f"graphics/Player/Ice/Jump/{i}.png") for i in range(len(os.listdir("graphics/Player/Ice/Jump")))],
-                                        "Fall": [pygame.image.load(f"graphics/Player/Ice/Fall/{i}.png") for i in range(len(os.listdir("graphics/Player/Ice/Fall")))],
-                                        "Land": [pygame.image.load(f"graphics/Player/Ice/Land/{i}.png") for i in range(len(os.listdir("graphics/Player/Ice/Land")))],
-                                        "PowerJump": [pygame.image.load(f"graphics/Player/Ice/PowerJump/{i}.png") for i in range(len(os.listdir("graphics/Player/Ice/PowerJump")))]
-                                        }}
+        # A dictionary that will hold the atlas of the animations for each player element (Each atlas holds every frame of the element's animations in a single image, which is converted to the display's pixel format)
+        # Note: A prebuilt atlas ("atlas.png" and "atlas.json" inside the element's folder) is loaded if there is one, otherwise the atlas is built from the animation frames
+        # Note: The atlases are loaded through the asset manager, so they are only loaded once (even if the player is created again)
+        self.animation_atlases_dict = {"Ice": asset_manager.load_animation_atlas(animations_directory = "graphics/Player/Ice", animation_states = ["Idle", "Run", "Jump", "Fall", "Land", "PowerJump"])}
+
+        # A dictionary that will hold all of the animations, for both directions that the player can face (e.g. self.animations_dict["Ice"]["Left"]["Idle"])
+        # Note: The animations facing left are taken from a flipped copy of the atlas, which is created once when the atlas is loaded instead of flipping the current animation image every frame
+        self.animations_dict = {player_element: {"Right": animation_atlas.find_animation_frames(), 
+                                                 "Left": animation_atlas.find_animation_frames(flipped = True)
+                                                 } for player_element, animation_atlas in self.animation_atlases_dict.items()}
 
         # Create attributes used for the animations
         self.animation_index = 0 # Tracks which animation frame to show
@@ -101,9 +114,9 @@ class Player(Generic, pygame.sprite.Sprite):
         # Values are in ms
         self.animation_frame_cooldowns_dict = {"Idle": 80,
                                             "Run": 50, 
-                                            "Jump": (self.desired_time_to_reach_jump_height * 1000) / len(self.animations_dict[self.current_player_element]["Jump"]),
-                                            "Fall": (self.desired_time_to_reach_fall_height * 1000) / len(self.animations_dict[self.current_player_element]["Fall"]),
-                                            "Land": (400 / len(self.animations_dict[self.current_player_element]["Land"])),
+                                            "Jump": (self.desired_time_to_reach_jump_height * 1000) / len(self.animations_dict[self.current_player_element]["Right"]["Jump"]),
+                                            "Fall": (self.desired_time_to_reach_fall_height * 1000) / len(self.animations_dict[self.current_player_element]["Right"]["Fall"]),
+                                            "Land": (400 / len(self.animations_dict[self.current_player_element]["Right"]["Land"])),
                                             "PowerJump": 80
           }
 
@@ -134,7 +147,7 @@ class Player(Generic, pygame.sprite.Sprite):
                 self.animation_index = 0
 
         # If the player has double jumped
-        elif pygame.key.get_pressed()[pygame.K_SPACE] and (self.allowed_to_jump == False and self.allowed_to_double_jump == False):
+        elif self.input_snapshot.is_held(pygame.K_SPACE) and (self.allowed_to_jump == False and self.allowed_to_double_jump == False):
             # If the current animation state has not been set to "Jump" yet
             if self.current_animation_state != "Jump":
                 # Set the current animation state to "Jump"
@@ -145,7 +158,7 @@ class Player(Generic, pygame.sprite.Sprite):
                 self.animation_index = 0
 
         # If the player is charging up a power jump
-        elif pygame.key.get_pressed()[pygame.K_SPACE] and (self.allowed_to_jump == True and self.allowed_to_double_jump == False):
+        elif self.input_snapshot.is_held(pygame.K_SPACE) and (self.allowed_to_jump == True and self.allowed_to_double_jump == False):
 
             # If the current animation state has not been set to "PowerJump" yet
             if self.current_animation_state != "PowerJump":
@@ -157,7 +170,7 @@ class Player(Generic, pygame.sprite.Sprite):
                 self.animation_index = 0
 
         # If the player is running left or right
-        elif pygame.key.get_pressed()[pygame.K_a] or pygame.key.get_pressed()[pygame.K_d]:
+        elif self.input_snapshot.is_held(pygame.K_a) or self.input_snapshot.is_held(pygame.K_d):
 
             """ 
             Don't play the run animation and play the idle animation:
@@ -166,7 +179,7 @@ class Player(Generic, pygame.sprite.Sprite):
                 - If the player moving will collide with the a neighbouring tile
             """
             if (self.rect.x == 0 or self.rect.right == self.last_tile_position[0]) or \
-                (pygame.Rect(self.rect.x - 1, self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict) != None or pygame.Rect(self.rect.x + 1, self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict) != None):
+                (pygame.Rect(self.rect.x - 1, self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict, True) != None or pygame.Rect(self.rect.x + 1, self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict, True) != None):
                 
                 # If the current animation state has not been set to "Idle" yet
                 if self.current_animation_state != "Idle":
@@ -191,7 +204,7 @@ class Player(Generic, pygame.sprite.Sprite):
                         self.animation_index = 0
 
         # If the player has stopped running left or right
-        elif pygame.key.get_pressed()[pygame.K_a] == False and pygame.key.get_pressed()[pygame.K_d] == False:
+        elif self.input_snapshot.is_held(pygame.K_a) == False and self.input_snapshot.is_held(pygame.K_d) == False:
             # If the current animation state has not been set to "Idle" yet
             if self.current_animation_state != "Idle":
                 
@@ -205,31 +218,26 @@ class Player(Generic, pygame.sprite.Sprite):
                     self.animation_index = 0
 
     def play_animations(self):
-        
+
         # Check whether we need to change the player's animation state based on what the player is doing
         self.change_players_animation_state()
 
         # Increment the animation frame counter based on time
         self.animation_frame_counter += 1000 * self.delta_time
 
+        # The direction that the player is facing
+        facing_direction = "Right" if self.facing_right == True else "Left"
+
         """ Temporary variables to store the: 
-            - Current player animation state's list, e.g. The list containing the images of the "Idle" animation
+            - Current player animation state's list (facing the same direction as the player), e.g. The list containing the images of the "Idle" animation
             - The current animation image
             """
-        current_player_state_animation_list = self.animations_dict[self.current_player_element][self.current_animation_state]
-        current_animation_image = self.animations_dict[self.current_player_element][self.current_animation_state][self.animation_index]
+        current_player_state_animation_list = self.animations_dict[self.current_player_element][facing_direction][self.current_animation_state]
+        current_animation_image = current_player_state_animation_list[self.animation_index]
 
         # ---------------------------------------------------------------------------------
-        # Set the image to be this animation frame
-
-        # If the player is facing right
-        if self.facing_right == True:
-            # Set the player image as facing right
-            self.image = current_animation_image
-        # If the player is facing left
-        else:
-            # Set the player image as facing left
-            self.image = pygame.transform.flip(current_animation_image, True, False)
+        # Set the image to be this animation frame (The animation images facing left have already been flipped)
+        self.image = current_animation_image
 
         # ---------------------------------------------------------------------------------
         # Changing the animation frame
@@ -300,7 +308,7 @@ class Player(Generic, pygame.sprite.Sprite):
                         self.animation_frame_counter = 0
 
                     # If the player is colliding with the closest ground tile after falling
-                    if self.closest_ground_tile != None and pygame.Rect(self.rect.x, self.rect.y + (TILE_SIZE * (0.75)), self.rect.width, self.rect.height).colliderect(self.closest_ground_tile.rect):
+                    if self.closest_ground_tile != None and pygame.Rect(self.rect.x, self.rect.y + (TILE_SIZE * (0.75)), self.rect.width, self.rect.height).colliderect(self.closest_ground_tile):
                         # Set the current animation state to "Land"
                         self.current_animation_state = "Land"
 
@@ -344,8 +352,9 @@ class Player(Generic, pygame.sprite.Sprite):
                         # Reset the animation frame counter
                         self.animation_frame_counter = 0
         # ---------------------------------------------------------------------------------
-        # Draw the player onto the main screen
-        self.draw(surface = self.surface, x = (self.rect.x - self.camera_position[0]), y = (self.rect.y - self.camera_position[1]))
+        # Draw the player onto the main screen (At the interpolated position if the game uses a fixed timestep)
+        draw_position = self.rect.topleft if self.interpolated_position == None else self.interpolated_position
+        self.draw(surface = self.surface, x = (draw_position[0] - self.camera_position[0]), y = (draw_position[1] - self.camera_position[1]))
 
     # ---------------------------------------------------------------------------------
     # Movement       
@@ -449,7 +458,7 @@ class Player(Generic, pygame.sprite.Sprite):
 
         # Once the player is back on the ground, the following attributes need to be reset
         # If the player is colliding with the closest ground tile and
-        if self.closest_ground_tile != None and pygame.Rect(self.rect.x, self.rect.y + 1, self.rect.width, self.rect.height).colliderect(self.closest_ground_tile.rect):
+        if self.closest_ground_tile != None and pygame.Rect(self.rect.x, self.rect.y + 1, self.rect.width, self.rect.height).colliderect(self.closest_ground_tile):
 
             # If the player has just landed on the ground after falling or has landed after jumping
             if (self.falling_suvat_u <= 0 and self.falling == True) or (self.jumping_suvat_u <= 0):
@@ -476,16 +485,62 @@ class Player(Generic, pygame.sprite.Sprite):
                 # Set the falling speed back to 0
                 self.falling_suvat_u = 0
 
+    def handle_pressed_keys(self):
+
+        # Note: This is called by "Game" at the start of each frame, so that the player only jumps once each time a key is pressed (This is so the player doesn't hold down the "w" key, which will cause the player to keep jumping)
+
+        # If the "w" key was pressed since the last frame
+        if self.input_snapshot.was_pressed(pygame.K_w):
+            # Make the player jump (if the player is allowed to jump)
+            self.perform_initial_jump()
+
+        # If the "Space" key was pressed since the last frame
+        if self.input_snapshot.was_pressed(pygame.K_SPACE):
+            # Make the player double jump (if the player has already jumped)
+            self.perform_double_jump()
+
+    def perform_initial_jump(self):
+
+        # Note: This is called when the "w" key is pressed
+
+        # If the player is allowed to jump (i.e. pressed the "w" key when on the ground )
+        if self.allowed_to_jump == True:
+
+            # Don't allow the player to jump
+            self.allowed_to_jump = False
+
+            # Allow the player to double jump
+            self.allowed_to_double_jump = True
+
+            # Make the player jump
+            self.jump()
+
+    def perform_double_jump(self):
+
+        # Note: This is called when the "space" key is pressed
+
+        # If the player has already jumped (i.e. has pressed the "space" key during the initial jump)
+        if self.allowed_to_jump == False and self.allowed_to_double_jump == True:
+
+            # Don't allow the player to double jump
+            self.allowed_to_double_jump = False
+            
+            # Set the acceleration of the double jump 
+            self.jumping_suvat_a = - ((2 * self.desired_double_jump_height) / (self.desired_time_to_reach_double_jump_height ** 2))
+
+            # Set the initial velocity of the double jump
+            self.jumping_suvat_u = (2 * self.desired_double_jump_height) / self.desired_time_to_reach_double_jump_height
+
+            # Make the player double jump
+            self.jump()
+
     def jump(self):
 
         # The method used to move the player when jumping, double jumping or power jumping
-        new_position = self.rect.y 
-
         self.jumping_suvat_s = (self.jumping_suvat_u * self.delta_time) + (0.5 * self.jumping_suvat_a * (self.delta_time ** 2))
 
-        # Move the player up / down based on the displacement
-        new_position -= self.dy
-        self.rect.y = round(new_position)
+        # Move the player up / down based on the displacement (stopping at the first tile in the way)
+        self.move_vertically(round(self.rect.y - self.dy) - self.rect.y)
 
         # Set the new value for v based on the delta time  
         self.jumping_suvat_u += (self.jumping_suvat_a * self.delta_time)
@@ -495,10 +550,10 @@ class Player(Generic, pygame.sprite.Sprite):
         # The method used to check if the player can power jump, and if they are entering the correct input, perform the power jump
 
         # If the player is on the ground
-        if self.closest_ground_tile != None and pygame.Rect(self.rect.x, self.rect.y + 1, self.rect.width, self.rect.height).colliderect(self.closest_ground_tile.rect):
+        if self.closest_ground_tile != None and pygame.Rect(self.rect.x, self.rect.y + 1, self.rect.width, self.rect.height).colliderect(self.closest_ground_tile):
             
             # If the player is holding the spacebar button
-            if pygame.key.get_pressed()[pygame.K_SPACE]:
+            if self.input_snapshot.is_held(pygame.K_SPACE):
 
                 # Set the attribute that the player is performing a power jump to True
                 if self.performing_power_jump != True:
@@ -513,7 +568,7 @@ class Player(Generic, pygame.sprite.Sprite):
                     self.jump_power += 112 * self.delta_time # Add 112 every second
 
             # If the player has released the spacebar button
-            if (pygame.key.get_pressed()[pygame.K_SPACE] == False and self.jump_power > 0):
+            if (self.input_snapshot.is_held(pygame.K_SPACE) == False and self.jump_power > 0):
 
                 # Set the desired power jump height
 
@@ -669,14 +724,11 @@ class Player(Generic, pygame.sprite.Sprite):
         # The method used to move the player when falling
 
         # Equation used: s = vt + 1/2(a)(t^2) 
-        # Note: Limit the amount the player can move down by, this is because at low frame rates, the fall distance can be greater than the tile size
-        #self.falling_suvat_s = max((self.falling_suvat_u * self.delta_time) + (0.5 * self.falling_suvat_a * (self.delta_time ** 2)), -8) # -10 = Tested value which is good enough for both 60 FPS and below
+        # Note: At low frame rates, the fall distance can be greater than the tile size, but the player can't fall through the tiles as the tile collisions are found along the whole path the player moves along
         self.falling_suvat_s = (self.falling_suvat_u * self.delta_time) + (0.5 * self.falling_suvat_a * (self.delta_time ** 2))
 
-        # Move the player up / down based on the displacement
-        new_position = self.rect.y 
-        new_position -= self.dy
-        self.rect.y = round(new_position)
+        # Move the player up / down based on the displacement (stopping at the first tile in the way)
+        self.move_vertically(round(self.rect.y - self.dy) - self.rect.y)
 
         # Set the new value for v based on the delta time  
         self.falling_suvat_u += (self.falling_suvat_a * self.delta_time)
@@ -698,11 +750,8 @@ class Player(Generic, pygame.sprite.Sprite):
 
     def handle_horizontal_movement(self):
 
-        # (For floating point accuracy)
-        next_position = self.rect.x
-
         # If the "a" key is pressed
-        if pygame.key.get_pressed()[pygame.K_a] and pygame.key.get_pressed()[pygame.K_d] == False:
+        if self.input_snapshot.is_held(pygame.K_a) and self.input_snapshot.is_held(pygame.K_d) == False:
 
             # If the player is decelerating currently
             if self.decelerating == True:
@@ -724,19 +773,11 @@ class Player(Generic, pygame.sprite.Sprite):
                 # ---------------------------------------------------------------------------------
                 # Moving the player
 
-                # If moving left will place the player out of the screen
-                if self.rect.left - self.horizontal_suvat_s <= 0:
-                    # Set the player's x position to be at 0
-                    self.rect.left = 0
-
-                # Otherwise
-                elif self.rect.left - self.horizontal_suvat_s > 0:
-                    # Move the player left
-                    next_position -= self.dx
-                    self.rect.x = round(next_position)
+                # Move the player left (stopping at the first tile in the way and at the left edge of the tile map)
+                self.move_horizontally(round(self.rect.x - self.dx) - self.rect.x)
 
         # If the "d" key is pressed
-        elif pygame.key.get_pressed()[pygame.K_d] and pygame.key.get_pressed()[pygame.K_a] == False:
+        elif self.input_snapshot.is_held(pygame.K_d) and self.input_snapshot.is_held(pygame.K_a) == False:
 
             # If the player is decelerating currently
             if self.decelerating == True:
@@ -758,26 +799,14 @@ class Player(Generic, pygame.sprite.Sprite):
                 # ---------------------------------------------------------------------------------
                 # Moving the player
 
-                # If moving right will place the player out of the tile map / out of the screen
-                if self.rect.right + self.horizontal_suvat_s >= self.last_tile_position[0]:
-                    # Set the player's right position to be at the last tile position in the tile map
-                    self.rect.right = self.last_tile_position[0]
-
-                # Otherwise
-                elif self.rect.right + self.horizontal_suvat_s < self.last_tile_position[0]:
-                    # Move the player right
-                    next_position += self.dx
-                    self.rect.x = round(next_position)
+                # Move the player right (stopping at the first tile in the way and at the last tile position in the tile map)
+                self.move_horizontally(round(self.rect.x + self.dx) - self.rect.x)
 
         # ---------------------------------------------------------------------------------
         # Deceleration
 
         # If the player has let go of both horizontal movement input keys or if the deceleration has already started, but the player tried to stop it by going against the direction of deceleration
-        if ((pygame.key.get_pressed()[pygame.K_a] == False and pygame.key.get_pressed()[pygame.K_d] == False) and self.horizontal_suvat_u > 0) or self.decelerating == True:
-
-            # (For floating point accuracy)
-            # Note: This is declared here because self.rect.x may have changed 
-            next_position_2 = self.rect.x
+        if ((self.input_snapshot.is_held(pygame.K_a) == False and self.input_snapshot.is_held(pygame.K_d) == False) and self.horizontal_suvat_u > 0) or self.decelerating == True:
 
             # If the player is not charging a power jump
             if self.jump_power == 0:
@@ -813,30 +842,60 @@ class Player(Generic, pygame.sprite.Sprite):
                 # If the player was facing right 
                 if self.facing_right == True:
 
-                    # If moving right will place the player out of the tile map / out of the screen
-                    if self.rect.right + self.horizontal_suvat_s >= self.last_tile_position[0]:
-                        # Set the player's right position to be at the last tile position in the tile map
-                        self.rect.right = self.last_tile_position[0]
-
-                    # Otherwise
-                    elif self.rect.right + self.horizontal_suvat_s < self.last_tile_position[0]:
-                        # Move the player right
-                        next_position_2 += self.dx
-                        self.rect.x = round(next_position_2)
+                    # Move the player right (stopping at the first tile in the way and at the last tile position in the tile map)
+                    self.move_horizontally(round(self.rect.x + self.dx) - self.rect.x)
 
                 # If the player was facing left
                 elif self.facing_right == False:
         
-                    # If moving left will place the player out of the screen
-                    if self.rect.left - self.horizontal_suvat_s <= 0:
-                        # Set the player's x position to be at 0
-                        self.rect.left = 0
+                    # Move the player left (stopping at the first tile in the way and at the left edge of the tile map)
+                    self.move_horizontally(round(self.rect.x - self.dx) - self.rect.x)
+
+    def move_horizontally(self, displacement):
+
+        # Moves the player horizontally by the displacement (in pixels), stopping at the first tile in the way and at the edges of the tile map
+        # Note: The player is only moved after the tile collisions have been found, but the player may move in a different direction or by a different distance (e.g. after changing direction), so the player is swept again along the path it actually moves along
+
+        # Don't let the player move out of the tile map
+        displacement = min(max(displacement, - self.rect.left), self.last_tile_position[0] - self.rect.right)
+
+        # Find the first tile that the player would hit
+        impact = self.tile_grid.find_earliest_impact(self.rect, displacement, 0)
+
+        # If there isn't a tile in the way
+        if impact == None:
+            self.rect.x += displacement
+
+        # If the player is moving right
+        elif displacement > 0:
+            # The player's right should be the tile's left
+            self.rect.right = impact[1].left
+
+        # If the player is moving left
+        elif displacement < 0:
+            # The player's left should be the tile's right
+            self.rect.left = impact[1].right
+
+    def move_vertically(self, displacement):
+
+        # Moves the player vertically by the displacement (in pixels, a positive displacement is downwards), stopping at the first tile in the way
+
+        # Find the first tile that the player would hit
+        impact = self.tile_grid.find_earliest_impact(self.rect, 0, displacement)
 
-                    # Otherwise
-                    elif self.rect.left - self.horizontal_suvat_s > 0:
-                        # Move the player left
-                        next_position_2 -= self.dx
-                        self.rect.x = round(next_position_2)
+        # If there isn't a tile in the way
+        if impact == None:
+            self.rect.y += displacement
+
+        # If the player is moving downwards
+        elif displacement > 0:
+            # The player's bottom should be the tile's top
+            self.rect.bottom = impact[1].top
+
+        # If the player is moving upwards
+        elif displacement < 0:
+            # The player's top should be the tile's bottom
+            self.rect.top = impact[1].bottom
 
     def handle_player_movement(self):
         
@@ -875,7 +934,7 @@ class Player(Generic, pygame.sprite.Sprite):
         # Falling
 
         # If the player isn't colliding with any of its neighbouring tiles, it means that the player is floating
-        if pygame.Rect(self.rect.x, self.rect.y, self.rect.width, self.rect.height + 1).collidedict(self.neighbouring_tiles_dict) == None:
+        if pygame.Rect(self.rect.x, self.rect.y, self.rect.width, self.rect.height + 1).collidedict(self.neighbouring_tiles_dict, True) == None:
 
             """
             1st check: Player hasn't been set to falling and the player has not jumped yet
@@ -918,7 +977,7 @@ class Player(Generic, pygame.sprite.Sprite):
         # # If there is a closest ground tile
         # if self.closest_ground_tile != None:
         #     # Calculate the number of tiles away the player is from the ground
-        #     num_of_tiles_away_from_closest_ground_tile = abs(self.rect.bottom - (self.rect.bottom % TILE_SIZE)- self.closest_ground_tile.rect.top) / (TILE_SIZE)
+        #     num_of_tiles_away_from_closest_ground_tile = abs(self.rect.bottom - (self.rect.bottom % TILE_SIZE)- self.closest_ground_tile.top) / (TILE_SIZE)
         pass
 
     # ---------------------------------------------------------------------------------
@@ -926,95 +985,92 @@ class Player(Generic, pygame.sprite.Sprite):
                           
     def handle_tile_collisions(self):
 
-        # ---------------------------------------------------------------------------------
-        # Vertical collisions
-
-        # Vertical collisions when jumping
-        if self.falling == False:
-
-            # If the player is at the stage of the jump where they are traveling upwards
-            if self.jumping_suvat_u >= 0:
-                # If the top of the player will be past / colliding with the bottom of the closest ceiling tile
-                if self.closest_ceiling_tile != None and (round(self.rect.top - self.jumping_suvat_s) <= self.closest_ceiling_tile.rect.bottom):
-
-                    # Set the top of the player to be the bottom of the closest ceiling tile
-                    self.rect.top = self.closest_ceiling_tile.rect.bottom
-                    # The player should now start traveling downwards
-                    self.jumping_suvat_u = 0
-                    self.dy = 0
+        # Finds how far the player can move this frame without moving into any tiles (i.e. dx and dy)
+        """
+        - The player is swept along the whole path that it would move along, so it can't move past a tile at low frame rates or during a power jump (when it moves further than the tile size in a single frame)
+        - If the player would hit a tile, it is moved to the tile straight away and won't move any further along that axis this frame
+        - The player is swept again when it actually moves (see move_horizontally and move_vertically), as it may move in a different direction or by a different distance
+        """
 
-                # Set dy to the current distance the player can move when jumping
-                else:
-                    self.dy = self.jumping_suvat_s
-            
-            # If the player is at the stage of the jump where they are traveling downwards
-            elif self.jumping_suvat_u <= 0: 
-            
-                # If the bottom of the player will be past / colliding with the top of the closest ground tile
-                if self.closest_ground_tile != None and round(self.rect.bottom - self.jumping_suvat_s) >= self.closest_ground_tile.rect.top:
-                    # Set the bottom of the player to be the top of the closest ground tile
-                    self.rect.bottom = self.closest_ground_tile.rect.top
-                    self.dy = 0
-
-                # If the bottom of the player will not collide with the top of the closest ground tile
-                else:
-                    # Set dy to the current distance the player can move when jumping
-                    self.dy = self.jumping_suvat_s
-
-        # Vertical collisions when falling
-        elif self.falling == True:
-            
-            # If the bottom of the player will be past / colliding with the top of the closest ground tile
-            if self.closest_ground_tile != None and round(self.rect.bottom - self.falling_suvat_s) >= self.closest_ground_tile.rect.top:
-                # Set the bottom of the player to be the top of the closest ground tile
-                self.rect.bottom = self.closest_ground_tile.rect.top
-                self.dy = 0
+        # Vertical collisions
+        self.handle_vertical_tile_collisions()
 
-            # If the bottom of the player will not collide with the top of the closest ground tile
-            else: 
-                # Set dy to the current distance the player can move when falling
-                self.dy = self.falling_suvat_s
+        # Horizontal collisions (found after the player may have been moved onto a tile vertically)
+        self.handle_horizontal_tile_collisions()
 
-        # ---------------------------------------------------------------------------------
-        # Horizontal collisions
+    def handle_horizontal_tile_collisions(self):
 
-        # If the player is facing right (i.e. moving right)
+        # Find the number of pixels the player will move by horizontally (The player moves right if it is facing right, otherwise left)
         if self.facing_right == True:
-            x_collisions = pygame.Rect(round(self.rect.x + self.horizontal_suvat_s), self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)
-        # If the player is facing left (i.e. moving left)
+            displacement = round(self.rect.x + self.horizontal_suvat_s) - self.rect.x
         elif self.facing_right == False:
-            x_collisions = pygame.Rect(round(self.rect.x - self.horizontal_suvat_s), self.rect.y, self.rect.width, self.rect.height).collidedict(self.neighbouring_tiles_dict)
+            displacement = round(self.rect.x - self.horizontal_suvat_s) - self.rect.x
+
+        # Find the first tile that the player would hit when moving horizontally
+        impact = self.tile_grid.find_earliest_impact(self.rect, displacement, 0)
 
         # If there is a horizontal collision
-        if x_collisions != None:
-            #pygame.draw.rect(self.surface, "green", (x_collisions[0].rect.x - self.camera_position[0], x_collisions[0].rect.y - self.camera_position[1], x_collisions[0].rect.width, x_collisions[0].rect.height))
+        if impact != None:
+            #pygame.draw.rect(self.surface, "green", (impact[1].x - self.camera_position[0], impact[1].y - self.camera_position[1], impact[1].width, impact[1].height))
 
-            # If the player is facing right (i.e. moving right)
-            if self.facing_right == True:
+            # If the player is moving right
+            if displacement > 0:
                 # The player's right should be the tile's left
-                self.rect.right = x_collisions[0].rect.left
-            # If the player is facing left (i.e. moving left)
-            elif self.facing_right == False:
+                self.rect.right = impact[1].left
+            # If the player is moving left
+            elif displacement < 0:
                 # The player's left should be the tile's right
-                self.rect.left = x_collisions[0].rect.right
-            
+                self.rect.left = impact[1].right
+
             # Set dx to be 0, so that the player does not move
             self.dx = 0
 
         # If there is no horizontal collision
-        elif x_collisions == None:
+        elif impact == None:
             # Move the player by the horizontal distance
             self.dx = self.horizontal_suvat_s
 
-    def run(self):
-        pygame.draw.line(self.surface, "white", (self.surface.get_width() / 2, 0), (self.surface.get_width() / 2, self.surface.get_height()))
+    def handle_vertical_tile_collisions(self):
 
-        # Play animations
-        self.play_animations()
+        # Find the distance the player will move vertically, which depends on whether the player is jumping or falling (A positive distance is upwards)
+        if self.falling == False:
+            vertical_suvat_s = self.jumping_suvat_s
+        elif self.falling == True:
+            vertical_suvat_s = self.falling_suvat_s
 
-        # TEMPORARY
-        # for tile in self.neighbouring_tiles_dict.keys():
-        #     pygame.draw.rect(self.surface, "green", (tile.rect.x - self.camera_position[0], tile.rect.y - self.camera_position[1], tile.rect.width, tile.rect.height))
+        # Find the number of pixels the player will move by vertically (A positive displacement is downwards)
+        displacement = round(self.rect.y - vertical_suvat_s) - self.rect.y
+
+        # Find the first tile that the player would hit when moving vertically
+        impact = self.tile_grid.find_earliest_impact(self.rect, 0, displacement)
+
+        # If there is no vertical collision
+        if impact == None:
+            # Set dy to the current distance the player can move when jumping / falling
+            self.dy = vertical_suvat_s
+
+        # If there is a vertical collision
+        elif impact != None:
+
+            # If the player is moving upwards (i.e. jumping into a ceiling tile)
+            if displacement < 0:
+                # Set the top of the player to be the bottom of the ceiling tile
+                self.rect.top = impact[1].bottom
+
+                # If the player is jumping, the player should now start traveling downwards
+                if self.falling == False:
+                    self.jumping_suvat_u = 0
+
+            # If the player is moving downwards (i.e. landing on a ground tile)
+            elif displacement > 0:
+                # Set the bottom of the player to be the top of the ground tile
+                self.rect.bottom = impact[1].top
+
+            # Set dy to be 0, so that the player does not move
+            self.dy = 0
+
+    def update_physics(self):
+        # Moves the player by one step (Called once per frame, or once per physics step when the game uses a fixed timestep)
 
         # Handle tile collisions (affects player movement)
         self.handle_tile_collisions()
@@ -1025,5 +1081,18 @@ class Player(Generic, pygame.sprite.Sprite):
         # Reset the movement attributes if the conditions are met
         self.reset_movement_attributes()
 
+    def run(self):
+        pygame.draw.line(self.surface, "white", (self.surface.get_width() / 2, 0), (self.surface.get_width() / 2, self.surface.get_height()))
+
+        # Play animations
+        self.play_animations()
+
+        # TEMPORARY
+        # for tile_rect in self.neighbouring_tiles_dict.values():
+        #     pygame.draw.rect(self.surface, "green", (tile_rect.x - self.camera_position[0], tile_rect.y - self.camera_position[1], tile_rect.width, tile_rect.height))
+
+        # Handle tile collisions, track player movement and reset the movement attributes
+        self.update_physics()
+
         # # Create / update a mask for pixel - perfect collisions (Uncomment later when adding collisions with objects other than tiles)
         # self.mask = pygame.mask.from_surface(self.image)
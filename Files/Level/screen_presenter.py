@@ -0,0 +1,63 @@
+import pygame
+
+class ScreenPresenter:
+    def __init__(self, source_surface, destination_size):
+
+        # Scales the surface that the game is drawn onto (the scaled surface) up to the size of the screen each frame, without creating any new surfaces during the frame
+
+        self.source_surface = source_surface
+        self.destination_size = destination_size
+
+        # Surface that the source surface is scaled into when it can't be scaled straight onto the screen (e.g. when the screen is a different size)
+        self.destination_surface = pygame.Surface(self.destination_size, 0, self.source_surface)
+
+        # ---------------------------------------------
+        # Integer scaling
+
+        # Find the scale factor if the destination is a whole number of times bigger than the source in both directions (otherwise it is None)
+        if self.destination_size[0] % self.source_surface.get_width() == 0 and self.destination_size[0] // self.source_surface.get_width() == self.destination_size[1] // self.source_surface.get_height() and self.destination_size[1] % self.source_surface.get_height() == 0:
+            self.scale_factor = self.destination_size[0] // self.source_surface.get_width()
+        else:
+            self.scale_factor = None
+
+        # Surfaces used when the scale factor is a power of two (e.g. 4 with the current settings), which are each double the size of the last
+        """
+        - pygame.transform.scale uses nearest-neighbour scaling, so doubling the size of the surface twice gives exactly the same pixels as making it four times bigger at once
+        - Doubling in steps is faster, as each step reads from a smaller surface
+        """
+        self.doubling_surfaces = []
+
+        if self.scale_factor != None and self.scale_factor > 2 and (self.scale_factor & (self.scale_factor - 1)) == 0:
+            doubling_size = self.source_surface.get_size()
+
+            # Create a surface for every step apart from the last one (which is the destination)
+            while (doubling_size[0] * 2) < self.destination_size[0]:
+                doubling_size = (doubling_size[0] * 2, doubling_size[1] * 2)
+                self.doubling_surfaces.append(pygame.Surface(doubling_size, 0, self.source_surface))
+
+    def has_same_pixel_format(self, surface):
+
+        # pygame.transform.scale can only scale into a surface with the same pixel format as the source surface
+        return surface.get_bitsize() == self.source_surface.get_bitsize() and surface.get_masks() == self.source_surface.get_masks()
+
+    def scale_into(self, destination_surface):
+
+        # Scale the source surface into the destination surface, doubling the size in steps if the scale factor is a power of two
+        scaled_surface = self.source_surface
+
+        for doubling_surface in self.doubling_surfaces:
+            pygame.transform.scale(scaled_surface, doubling_surface.get_size(), doubling_surface)
+            scaled_surface = doubling_surface
+
+        pygame.transform.scale(scaled_surface, self.destination_size, destination_surface)
+
+    def present(self, screen):
+
+        # If the screen is the same size and pixel format as the destination, scale the source surface straight onto the screen
+        if screen.get_size() == self.destination_size and self.has_same_pixel_format(screen):
+            self.scale_into(screen)
+
+        # Otherwise, scale into the destination surface and then draw it onto the screen
+        else:
+            self.scale_into(self.destination_surface)
+            screen.blit(self.destination_surface, (0, 0))
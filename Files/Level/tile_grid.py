@@ -0,0 +1,242 @@
+import pygame, bisect
+import numpy as np
+from Global.settings import *
+
+class TileGrid:
+    def __init__(self, tile_size = TILE_SIZE):
+
+        # The size of each cell in the grid (The same as the size of the world tiles, so that each world tile occupies exactly one cell)
+        self.tile_size = tile_size
+
+        # Array used to hold the ID of the tile inside each cell, indexed by [row, column] (0 = No tile)
+        """
+        - Each tile only takes up one byte, instead of a separate object with its own rect and image for every tile
+        - The rects of the tiles are only created when they are needed (e.g. for collisions with the player)
+        """
+        self.tile_ids = np.zeros((0, 0), dtype = np.uint8)
+
+        # Dictionary used to hold the image of each type of tile, the key is the tile ID (All of the tiles with the same ID share the same image)
+        self.tile_images = {}
+
+        # The number of columns and rows in the grid
+        self.number_of_columns = 0
+        self.number_of_rows = 0
+
+        # Sorted rows that have a tile in them for each column, used to find the closest ground / ceiling tiles without checking every cell in the column
+        """
+        - The rows of all of the columns are held in one list, column by column, and the rows of a column are between column_tile_starts[column] and column_tile_starts[column + 1]
+        - The closest tile is found with a binary search of the column's rows, instead of a scan over the whole column
+        """
+        self.column_tile_rows = []
+        self.column_tile_starts = [0]
+
+    def set_tiles(self, tile_ids, tile_images):
+
+        # Replaces all of the tiles in the grid with the tile IDs (a 2D array indexed by [row, column]) and the images of each tile ID
+        self.tile_ids = np.ascontiguousarray(tile_ids, dtype = np.uint8)
+        self.tile_images = tile_images
+
+        # Update the dimensions of the grid
+        self.number_of_rows, self.number_of_columns = self.tile_ids.shape
+
+        # Find the rows that have a tile in them for each column (np.nonzero of the transposed grid returns the cells column by column, from top to bottom)
+        columns, rows = np.nonzero(self.tile_ids.T)
+        self.column_tile_rows = rows.tolist()
+        self.column_tile_starts = np.searchsorted(columns, np.arange(self.number_of_columns + 1)).tolist()
+
+    def find_number_of_tiles(self):
+
+        # Returns the number of cells in the grid which have a tile inside of them
+        return int(np.count_nonzero(self.tile_ids))
+
+    def find_tile_rect(self, column, row):
+
+        # Returns the rect of the tile inside the cell
+        return pygame.Rect(column * self.tile_size, row * self.tile_size, self.tile_size, self.tile_size)
+
+    def find_cells_in_rect(self, rect):
+
+        # Returns the (first column, last column, first row, last row) of the cells that a rect overlaps, clamped to the boundaries of the grid
+
+        # A rect with a negative width or height is flipped so that it has a positive size (This is the same as pygame.Rect.colliderect)
+        rect = pygame.Rect(rect)
+        rect.normalize()
+
+        # A rect with no width or height does not overlap any cells
+        if rect.width == 0 or rect.height == 0:
+            return None
+
+        first_column = max(rect.left // self.tile_size, 0)
+        last_column = min((rect.right - 1) // self.tile_size, self.number_of_columns - 1)
+        first_row = max(rect.top // self.tile_size, 0)
+        last_row = min((rect.bottom - 1) // self.tile_size, self.number_of_rows - 1)
+
+        # If the rect is completely outside of the grid
+        if first_column > last_column or first_row > last_row:
+            return None
+
+        return first_column, last_column, first_row, last_row
+
+    def find_tiles_in_rect(self, rect):
+
+        # Returns a dictionary of all the tiles that overlap the rect, the key is the (column, row) of the tile and the value is the tile's rect
+        # Note: The tiles are added in the same order as they appear in the tile map (row by row, from left to right), so that the results are the same as iterating over the whole tile map
+
+        tiles_in_rect = {}
+
+        # Find the cells that the rect overlaps
+        cells = self.find_cells_in_rect(rect)
+
+        # If the rect does not overlap any cells
+        if cells == None:
+            return tiles_in_rect
+
+        first_column, last_column, first_row, last_row = cells
+
+        # Find the cells that the rect overlaps which have a tile inside of them (np.nonzero returns the cells row by row, from left to right)
+        rows, columns = np.nonzero(self.tile_ids[first_row:last_row + 1, first_column:last_column + 1])
+
+        # Create the rect of each tile
+        for row, column in zip((rows + first_row).tolist(), (columns + first_column).tolist()):
+            tiles_in_rect[(column, row)] = self.find_tile_rect(column, row)
+
+        return tiles_in_rect
+
+    def find_columns_in_rect(self, rect):
+
+        # Returns the range of columns inside the grid that the rect overlaps (The rect can be above or below the grid, e.g. when the player jumps above the top of the tile map)
+        # Note: Only the columns are needed, so the cells are found for the rect moved onto the first row of the grid
+        cells = self.find_cells_in_rect(pygame.Rect(rect.x, 0, rect.width, 1))
+
+        # If the rect doesn't overlap any columns
+        if cells == None:
+            return range(0)
+
+        return range(cells[0], cells[1] + 1)
+
+    def find_closest_tile_below(self, rect):
+
+        # Returns the rect of the closest tile below the bottom of the rect, within the columns that the rect overlaps (or None if there are no tiles below the rect)
+        # Note: If more than one column has a tile at the closest row, the tile in the left-most column is returned
+
+        closest_column = None
+        closest_row = None
+
+        # The first row that can hold a tile below the rect (i.e. the row that the bottom of the rect is inside of)
+        first_row = max(rect.bottom // self.tile_size, 0)
+
+        # For each column that the rect overlaps
+        for column in self.find_columns_in_rect(rect):
+
+            # Find the first row in the column which has a tile in it, that is on or below the first row
+            column_end = self.column_tile_starts[column + 1]
+            row_index = bisect.bisect_left(self.column_tile_rows, first_row, self.column_tile_starts[column], column_end)
+
+            # If there is a tile below the rect in this column, and it is closer than the closest tile found so far
+            if row_index < column_end and (closest_row == None or self.column_tile_rows[row_index] < closest_row):
+                closest_column = column
+                closest_row = self.column_tile_rows[row_index]
+
+        if closest_row == None:
+            return None
+
+        return self.find_tile_rect(closest_column, closest_row)
+
+    def find_closest_tile_above(self, rect):
+
+        # Returns the rect of the closest tile above the top of the rect, within the columns that the rect overlaps (or None if there are no tiles above the rect)
+        # Note: If more than one column has a tile at the closest row, the tile in the left-most column is returned
+
+        closest_column = None
+        closest_row = None
+
+        # The first row that is completely below the top of the rect (Tiles above the rect must be in a row before this one)
+        last_row = max(-(-rect.top // self.tile_size), 0)
+
+        # For each column that the rect overlaps
+        for column in self.find_columns_in_rect(rect):
+
+            # Find the last row in the column which has a tile in it, that is before the last row
+            column_start = self.column_tile_starts[column]
+            row_index = bisect.bisect_left(self.column_tile_rows, last_row, column_start, self.column_tile_starts[column + 1]) - 1
+
+            # If there is a tile above the rect in this column, and it is closer than the closest tile found so far
+            if row_index >= column_start and (closest_row == None or self.column_tile_rows[row_index] > closest_row):
+                closest_column = column
+                closest_row = self.column_tile_rows[row_index]
+
+        if closest_row == None:
+            return None
+
+        return self.find_tile_rect(closest_column, closest_row)
+
+    def find_earliest_impact(self, rect, dx, dy):
+
+        # Returns the (time of impact, tile rect) of the first tile that the rect would hit when moving by (dx, dy), or None if the rect can move without hitting any tiles
+        """
+        - The time of impact is the fraction of the movement that the rect can complete before it touches the tile (0 = The rect is already touching the tile, 1 = The rect touches the tile at the end of the movement)
+        - All of the cells that the rect passes through along its path are checked, so the rect can't move past a tile, however far it moves (e.g. at low frame rates)
+        - Tiles that the rect is already overlapping are ignored, so that the rect can always move out of a tile
+        """
+
+        # A rect that doesn't move can't hit any tiles
+        if dx == 0 and dy == 0:
+            return None
+
+        # Find the cells along the path of the rect, including the cells that the rect would be touching at the end of the movement
+        swept_rect = rect.union(rect.move(dx + ((dx > 0) - (dx < 0)), dy + ((dy > 0) - (dy < 0))))
+        cells = self.find_cells_in_rect(swept_rect)
+
+        # If the path is completely outside of the grid
+        if cells == None:
+            return None
+
+        first_column, last_column, first_row, last_row = cells
+
+        # Find the cells along the path which have a tile inside of them
+        rows, columns = np.nonzero(self.tile_ids[first_row:last_row + 1, first_column:last_column + 1])
+
+        # If there aren't any tiles along the path
+        if len(rows) == 0:
+            return None
+
+        rows += first_row
+        columns += first_column
+
+        # Find the time at which the rect starts and stops overlapping each tile, on each axis
+        entry_times = []
+        exit_times = []
+        for movement, rect_start, rect_end, tile_starts in ((dx, rect.left, rect.right, columns * self.tile_size), (dy, rect.top, rect.bottom, rows * self.tile_size)):
+
+            tile_ends = tile_starts + self.tile_size
+
+            # If the rect moves along this axis
+            if movement > 0:
+                entry_times.append((tile_starts - rect_end) / movement)
+                exit_times.append((tile_ends - rect_start) / movement)
+
+            elif movement < 0:
+                entry_times.append((tile_ends - rect_start) / movement)
+                exit_times.append((tile_starts - rect_end) / movement)
+
+            # If the rect doesn't move along this axis, it only overlaps the tiles that it is already overlapping on this axis for the whole movement
+            else:
+                overlapping = (rect_start < tile_ends) & (rect_end > tile_starts)
+                entry_times.append(np.where(overlapping, -np.inf, np.inf))
+                exit_times.append(np.where(overlapping, np.inf, -np.inf))
+
+        # The rect overlaps a tile once it is overlapping the tile on both axes
+        entry_times = np.maximum(entry_times[0], entry_times[1])
+        exit_times = np.minimum(exit_times[0], exit_times[1])
+
+        # Find the tiles that the rect starts overlapping during the movement (Tiles that the rect only touches the corner of are not hit)
+        hits = np.flatnonzero((entry_times >= 0) & (entry_times <= 1) & (entry_times < exit_times))
+
+        # If the rect doesn't hit any tiles
+        if len(hits) == 0:
+            return None
+
+        # Find the tile that is hit first
+        first_hit = hits[np.argmin(entry_times[hits])]
+
+        return float(entry_times[first_hit]), self.find_tile_rect(int(columns[first_hit]), int(rows[first_hit]))
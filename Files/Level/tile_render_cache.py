@@ -0,0 +1,124 @@
+import pygame, math
+import numpy as np
+
+class TileRenderCache:
+    def __init__(self, chunk_width, chunk_height, streaming_distance = None):
+
+        # The size of each chunk (Each chunk is a surface with all of the tiles inside of it drawn onto it)
+        self.chunk_width = chunk_width
+        self.chunk_height = chunk_height
+
+        # Dictionary used to hold all of the chunk surfaces, the key is the chunk number (i.e. the x position of the chunk divided by the chunk width)
+        # Note: When streaming, chunks which have been baked but have no tiles inside of them are saved as None, so that they aren't baked again
+        self.chunks = {}
+
+        # The tile grid that the chunks are baked from (Set when the tiles are baked)
+        self.tile_grid = None
+
+        # Streaming
+        """
+        - If the streaming distance is None, all of the chunks are baked when the tile map is created
+        - Otherwise, only the chunks on the screen and within the streaming distance (in chunks) either side of the screen are baked, as the camera moves
+            - Chunks that are further away than this are removed, so the memory used by the chunks doesn't grow with the size of the level
+            - The surfaces of removed chunks are reused for the next chunks that are baked
+        """
+        self.streaming_distance = streaming_distance
+        self.spare_chunk_surfaces = []
+
+    def bake_tiles(self, tile_grid):
+        # Draws all of the tiles inside the tile grid onto the chunks that they are inside of. This should only be called once the tile map has been created, as the tiles never move.
+        # Note: When streaming, this only saves the tile grid, as the chunks are baked when they are near the camera
+
+        # Remove any chunks from a previous tile map
+        self.chunks = {}
+        self.spare_chunk_surfaces = []
+        self.tile_grid = tile_grid
+
+        # If all of the chunks should be baked now
+        if self.streaming_distance == None:
+
+            # Bake every chunk in the tile map, only keeping the chunks that have tiles inside of them
+            for chunk_number in range(0, self.find_number_of_chunks()):
+                self.bake_chunk(chunk_number)
+
+                if self.chunks[chunk_number] == None:
+                    del self.chunks[chunk_number]
+
+    def find_number_of_chunks(self):
+
+        # Returns the number of chunks needed to cover the whole tile map
+        return -(-(self.tile_grid.number_of_columns * self.tile_grid.tile_size) // self.chunk_width)
+
+    def bake_chunk(self, chunk_number):
+        # Draws all of the tiles inside the chunk onto the chunk's surface (The chunk is saved as None if there are no tiles inside of it)
+
+        tile_size = self.tile_grid.tile_size
+
+        # Find the columns of the tile grid which are inside the chunk (A tile can be inside of two chunks if it is on the boundary between them)
+        first_column = max((chunk_number * self.chunk_width) // tile_size, 0)
+        last_column = (((chunk_number + 1) * self.chunk_width) - 1) // tile_size
+
+        # Find the tiles inside the chunk
+        rows, columns = np.nonzero(self.tile_grid.tile_ids[:, first_column:last_column + 1])
+
+        # If there are no tiles inside the chunk
+        if len(rows) == 0:
+            self.chunks[chunk_number] = None
+            return
+
+        # Find the ID of each tile and its position relative to the chunk
+        tile_ids = self.tile_grid.tile_ids[rows, columns + first_column].tolist()
+        tile_xs = (((columns + first_column) * tile_size) - (chunk_number * self.chunk_width)).tolist()
+        tile_ys = (rows * tile_size).tolist()
+
+        # Create the chunk surface, or reuse the surface of a removed chunk (Transparent, so that the background colour of the level is still shown)
+        if len(self.spare_chunk_surfaces) > 0:
+            chunk_surface = self.spare_chunk_surfaces.pop()
+            chunk_surface.fill((0, 0, 0, 0))
+        else:
+            chunk_surface = pygame.Surface((self.chunk_width, self.chunk_height), flags = pygame.SRCALPHA)
+
+        # Draw all of the tiles onto the chunk at once
+        chunk_surface.blits([(self.tile_grid.tile_images[tile_id], (tile_x, tile_y)) for tile_id, tile_x, tile_y in zip(tile_ids, tile_xs, tile_ys)], doreturn = False)
+        self.chunks[chunk_number] = chunk_surface
+
+    def update_streamed_chunks(self, first_chunk_number, last_chunk_number):
+        # Bakes the chunks within the streaming distance of the chunks on the screen, and removes all other chunks
+
+        first_streamed_chunk_number = first_chunk_number - self.streaming_distance
+        last_streamed_chunk_number = last_chunk_number + self.streaming_distance
+
+        # Remove the chunks that are too far away from the screen, saving their surfaces so that they can be reused
+        for chunk_number in [chunk_number for chunk_number in self.chunks if not (first_streamed_chunk_number <= chunk_number <= last_streamed_chunk_number)]:
+            if self.chunks[chunk_number] != None:
+                self.spare_chunk_surfaces.append(self.chunks[chunk_number])
+            del self.chunks[chunk_number]
+
+        # Bake the chunks near the screen which haven't been baked yet
+        for chunk_number in range(max(first_streamed_chunk_number, 0), min(last_streamed_chunk_number, self.find_number_of_chunks() - 1) + 1):
+            if chunk_number not in self.chunks:
+                self.bake_chunk(chunk_number)
+
+    def draw(self, surface, camera_position):
+        # Draws all of the chunks that are visible from the camera's position onto the surface
+
+        # Round the camera position up to whole pixels, so that the tiles are drawn at the same positions as when they are drawn individually (i.e. the tile position minus the camera position, rounded down)
+        camera_x = math.ceil(camera_position[0])
+        camera_y = math.ceil(camera_position[1])
+
+        # Find the first and last chunks that are on the screen
+        first_chunk_number = camera_x // self.chunk_width
+        last_chunk_number = (camera_x + surface.get_width() - 1) // self.chunk_width
+
+        # If streaming, make sure that the chunks near the screen have been baked
+        if self.streaming_distance != None:
+            self.update_streamed_chunks(first_chunk_number, last_chunk_number)
+
+        # For each chunk on the screen
+        for chunk_number in range(first_chunk_number, last_chunk_number + 1):
+
+            # If there is a chunk here (Chunks with no tiles inside of them are never created)
+            if self.chunks.get(chunk_number) != None:
+
+                # Draw the chunk at the camera position
+                surface.blit(self.chunks[chunk_number], ((chunk_number * self.chunk_width) - camera_x, 0 - camera_y))
@@ -35,12 +35,16 @@ class Button(Generic):
         self.border_animation_current_point = random.randrange(0, 4)
         self.border_animation_rect = pygame.Rect(self.button_points[self.border_animation_current_point][0], self.button_points[self.border_animation_current_point][1], self.border_animation_radius, self.border_animation_radius)
 
+        # The area of the surface that the border animation was last drawn onto
+        self.border_animation_drawn_rect = None
+
     def play_border_animations(self):
 
         # ------------------------------------------------------------------------
         # Updating the border animation rect
 
-        pygame.draw.circle(surface = self.surface, color = "gray32", center = (self.border_animation_rect.x, self.border_animation_rect.y), radius = self.border_animation_radius)
+        # Draw the border animation, saving the area of the surface that it was drawn onto (Used to only update the parts of the screen that have changed)
+        self.border_animation_drawn_rect = pygame.draw.circle(surface = self.surface, color = "gray32", center = (self.border_animation_rect.x, self.border_animation_rect.y), radius = self.border_animation_radius)
 
         # Identify the current point on the button that the animation is on 
         match self.border_animation_current_point:
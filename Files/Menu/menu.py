@@ -1,12 +1,13 @@
-import pygame, sys
+import pygame
 from Menu.button import Button
+from Global.asset_manager import asset_manager
 from Global.settings import * 
 
 class Menu:
-    def __init__(self):
+    def __init__(self, screen = None):
 
-        # Screen
-        self.screen = pygame.display.get_surface()
+        # Screen (The display surface, unless another surface is passed in, e.g. an offscreen surface when running without a display)
+        self.screen = screen if screen != None else pygame.display.get_surface()
 
         # ------------------------------------------------------------------------------------------------------------------------------------------------
         # Buttons
@@ -22,6 +23,10 @@ class Menu:
         self.show_main_menu = True 
         self.show_controls_menu = False 
         self.show_paused_menu = False 
+        self.show_loading_menu = False # Shown while the level is being loaded in the background
+
+        # Attribute which is monitored by the game states controller, which closes the program when a "Quit" button is clicked
+        self.quit_requested = False
         
         # Store the previous menu so that we can go back to previous menus when the "Back" button is clicked
         self.previous_menu = None 
@@ -45,7 +50,20 @@ class Menu:
         # Mouse
         self.left_mouse_button_released = True # Attribute used to track if the left mouse button is released so that 
 
+        # ------------------------------------------------------------------------------------------------------------------------------------------------
+        # Dirty rects (Used to only update the parts of the screen that have changed, instead of the entire screen)
+        self.drawn_rects = [] # The areas of the screen that were drawn onto this frame
+        self.previous_drawn_rects = [] # The areas of the screen that were drawn onto last frame (These need to be updated so that the old drawings are erased)
+        self.dirty_rects = [] # The areas of the screen that have changed this frame
+
+        # ------------------------------------------------------------------------------------------------------------------------------------------------
+        # Loading menu
+
+        self.loading_font = None # Font used to draw the loading text (Created when the loading menu is first shown)
+        self.loading_time = 0 # The time that the loading menu has been shown for, used to animate the loading text
+
     def create_buttons(self):
+        # Note: The button images are loaded through the asset manager, so that the images used by more than one menu are only loaded once (and every image is converted to the display's pixel format)
 
         # Create lists for all menus in the game
         self.main_menu_buttons = []
@@ -54,9 +72,9 @@ class Menu:
 
         # ------------------------------------------------------------------------
         # Main menu
-        play_button = Button((screen_width / 2) - 200 , 200 , pygame.image.load("graphics/MenuButtons/play_button.png"), surface = self.screen)
-        controls_button = Button((screen_width / 2) - 200, 400, pygame.image.load("graphics/MenuButtons/controls_button.png"), surface = self.screen)
-        quit_button = Button((screen_width / 2) - 200, 600, pygame.image.load("graphics/MenuButtons/quit_button.png"), surface = self.screen)
+        play_button = Button((screen_width / 2) - 200 , 200 , asset_manager.load_image("graphics/MenuButtons/play_button.png"), surface = self.screen)
+        controls_button = Button((screen_width / 2) - 200, 400, asset_manager.load_image("graphics/MenuButtons/controls_button.png"), surface = self.screen)
+        quit_button = Button((screen_width / 2) - 200, 600, asset_manager.load_image("graphics/MenuButtons/quit_button.png"), surface = self.screen)
         
         # Add the buttons to the main menu buttons list
         self.main_menu_buttons.append(play_button)
@@ -65,16 +83,16 @@ class Menu:
 
         # ------------------------------------------------------------------------
         # Controls menu
-        self.back_button = Button((screen_width / 2) - 200, 600, pygame.image.load("graphics/MenuButtons/back_button.png"), surface = self.screen)
+        self.back_button = Button((screen_width / 2) - 200, 600, asset_manager.load_image("graphics/MenuButtons/back_button.png"), surface = self.screen)
 
         # Add the buttons to the controls menu buttons list
         self.controls_menu_buttons.append(self.back_button)
 
         # ------------------------------------------------------------------------
         # Paused menu
-        continue_button = Button((screen_width / 2) - 200, 200, pygame.image.load("graphics/MenuButtons/continue_button.png"), surface = self.screen)
-        controls_button_2 = Button((screen_width / 2) - 200, 400, pygame.image.load("graphics/MenuButtons/controls_button.png"), surface = self.screen)
-        quit_button_2 = Button((screen_width / 2) - 200, 600, pygame.image.load("graphics/MenuButtons/quit_button.png"), surface = self.screen)
+        continue_button = Button((screen_width / 2) - 200, 200, asset_manager.load_image("graphics/MenuButtons/continue_button.png"), surface = self.screen)
+        controls_button_2 = Button((screen_width / 2) - 200, 400, asset_manager.load_image("graphics/MenuButtons/controls_button.png"), surface = self.screen)
+        quit_button_2 = Button((screen_width / 2) - 200, 600, asset_manager.load_image("graphics/MenuButtons/quit_button.png"), surface = self.screen)
 
         # Add the buttons to the paused menu buttons list
         self.paused_menu_buttons.append(continue_button)
@@ -97,7 +115,7 @@ class Menu:
 
         for red_arc, arc_info in self.red_arc_dictionary.items():
             # Draw red arcs onto the screen
-            pygame.draw.arc(self.screen, "red", (arc_info[0], arc_info[1], arc_info[2], arc_info[3]), arc_info[4], arc_info[5])
+            self.drawn_rects.append(pygame.draw.arc(self.screen, "red", (arc_info[0], arc_info[1], arc_info[2], arc_info[3]), arc_info[4], arc_info[5]))
 
             # If the starting angle is not equal to the finishing angle
             if arc_info[4] != arc_info[5]:
@@ -115,7 +133,7 @@ class Menu:
 
         for white_arc, arc_info in self.white_arc_dictionary.items():
             # Draw red arcs onto the screen
-            pygame.draw.arc(self.screen, "white", (arc_info[0], arc_info[1], arc_info[2], arc_info[3]), arc_info[4], arc_info[5])
+            self.drawn_rects.append(pygame.draw.arc(self.screen, "white", (arc_info[0], arc_info[1], arc_info[2], arc_info[3]), arc_info[4], arc_info[5]))
 
             # Spinning the arcs
             # If the starting angle is not equal to the finishing angle
@@ -148,12 +166,33 @@ class Menu:
 
                 # Play the button's border animation
                 button.play_border_animations()
+
+                # Save the area of the screen that the border animation was drawn onto
+                # Note: The button itself is drawn in the same place every frame, so it only changes where the background animation or the border animation is drawn
+                self.drawn_rects.append(button.border_animation_drawn_rect)
     
+    def draw_loading_text(self):
+
+        # Create the font if it hasn't been created yet
+        if self.loading_font == None:
+            self.loading_font = pygame.font.Font(None, 100)
+
+        # Add a dot to the end of the loading text three times a second, up to three dots
+        self.loading_time += self.delta_time
+        loading_text_surface = self.loading_font.render("Loading" + ("." * (int(self.loading_time * 3) % 4)), True, "white")
+
+        # Draw the loading text in the centre of the screen
+        self.drawn_rects.append(self.screen.blit(loading_text_surface, loading_text_surface.get_rect(center = (screen_width / 2, screen_height / 2))))
+
     def run(self, delta_time):
 
         # Update delta time 
         self.delta_time = delta_time
 
+        # Start recording the areas of the screen that are drawn onto this frame
+        self.previous_drawn_rects = self.drawn_rects
+        self.drawn_rects = []
+
         # Retrieve the mouse position and update the mouse rect
         self.mouse_position_updating()
 
@@ -202,9 +241,8 @@ class Menu:
                         
                         # If the mouse collided with the "Quit" button 
                         case 2:
-                            # Exit the program
-                            pygame.quit()
-                            sys.exit()
+                            # Exit the program (This is detected by the game states controller)
+                            self.quit_requested = True
 
         # ---------------------------------------------
         # Controls menu
@@ -281,6 +319,16 @@ class Menu:
 
                     # If the mouse collided with the "Quit" button 
                     case 2:
-                        # Exit the program
-                        pygame.quit()
-                        sys.exit()
\ No newline at end of file
+                        # Exit the program (This is detected by the game states controller)
+                        self.quit_requested = True
+
+        # ---------------------------------------------
+        # Loading menu
+
+        elif self.show_loading_menu == True:
+
+            # Draw the loading text (The background keeps animating while the level is being loaded)
+            self.draw_loading_text()
+
+        # The areas of the screen that have changed this frame are the areas drawn onto this frame and last frame
+        self.dirty_rects = self.previous_drawn_rects + self.drawn_rects
\ No newline at end of file
@@ -0,0 +1,70 @@
+import pygame, os
+from Global.settings import *
+from Input.scripted_input import ScriptedInput
+from Level.game import Game
+
+class HeadlessSimulation:
+    def __init__(self, non_transformed_tile_map, render_target = None, null_render_target = False):
+
+        # Runs the game without a window, using a scripted input source instead of the keyboard (e.g. for benchmarks and automated playtesting)
+
+        # If the display hasn't been set up yet (i.e. the game is not already running in a window)
+        if pygame.display.get_init() == False or pygame.display.get_surface() == None:
+
+            # Use SDL's dummy video driver, so that no window is opened
+            # Note: This must be set before the display is initialised
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pygame.init()
+
+            # A display mode must be set so that images can be converted to the display's pixel format
+            pygame.display.set_mode((1, 1))
+
+        # The surface that the game is drawn onto (An offscreen surface with the same size as the screen, unless another surface is passed in)
+        self.render_target = render_target if render_target != None else pygame.Surface((screen_width, screen_height))
+
+        # The scripted input source which the player reads its input from
+        self.input = ScriptedInput()
+
+        # Create the game and the level
+        self.game = Game(screen = self.render_target)
+
+        # If there is a null render target, the game is still drawn onto the scaled surface, but the scaled surface is never drawn onto the render target (the slowest part of each frame)
+        self.game.draw_to_screen = not null_render_target
+        self.game.create_objects_tile_map(non_transformed_tile_map)
+        self.game.running = True
+
+        # The number of frames that have been simulated
+        self.frame_number = 0
+
+    def step(self, delta_time, held_keys = None, pressed_keys = ()):
+        # Simulates a single frame of the game
+        # held_keys = The keys being held down during this frame (None to keep holding the same keys as the previous frame)
+        # pressed_keys = The keys that were pressed down at the start of this frame (The same as pygame.KEYDOWN events)
+
+        # Update the keys being held down
+        if held_keys != None:
+            self.input.set_held_keys(held_keys)
+
+        # Press (and release) the keys that were pressed down this frame
+        for key in pressed_keys:
+            self.input.tap_key(key)
+
+        # Run the game with the state of the keys for this frame
+        self.run_frame(delta_time, self.input.take_snapshot())
+
+    def run_frame(self, delta_time, input_snapshot):
+        # Simulates a single frame of the game with an input snapshot that has already been taken (e.g. one that was recorded while playing the game)
+
+        # Give the game the state of the keys for this frame
+        self.game.input_snapshot = input_snapshot
+
+        # Run the game
+        self.game.run(delta_time)
+
+        # Increment the frame number
+        self.frame_number += 1
+
+    def run(self, number_of_frames, delta_time = 1 / 60):
+        # Simulates a number of frames at a fixed delta time, holding down the same keys
+        for _ in range(number_of_frames):
+            self.step(delta_time)
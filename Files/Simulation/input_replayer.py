@@ -0,0 +1,109 @@
+import time, json, struct
+from Input.input_snapshot import InputSnapshot
+from Input.input_recorder import INPUT_RECORDING_MAGIC, INPUT_RECORDING_VERSION, INPUT_RECORDING_HEADER_FORMAT, INPUT_FRAME_FORMAT
+from Level.level_loader import LevelLoader
+from Simulation.headless_simulation import HeadlessSimulation
+
+class InputReplayer:
+    def __init__(self, recording_file_path, null_render_target = True, fixed_timestep = False):
+
+        # Replays a recording made by the input recorder without a window, running the frames as fast as possible
+        """
+        - The level that was played is loaded from the compiled level tile maps file, and every frame is run with the recorded delta time and input snapshot
+        - This can be used as a benchmark of a real play session, and to check that changes to the player's physics haven't changed where the player moves (by comparing the player's trajectory with a previous replay)
+        """
+
+        # The number of the level that was played and the (delta time, input snapshot) of every frame
+        self.level_number, self.frames = self.load_recording(recording_file_path)
+
+        # Whether the scaled surface is drawn onto the render target (Not drawing it means that mostly the game's logic is being timed)
+        self.null_render_target = null_render_target
+
+        # Whether the player's physics are run using a fixed timestep (This must be the same as when the recording was made, for the player to move in the same way)
+        self.fixed_timestep = fixed_timestep
+
+        # The position of the player's rect at the end of each frame
+        self.trajectory = []
+
+    def load_recording(self, recording_file_path):
+
+        # Returns the level number and the list of (delta time, input snapshot) for every frame of the recording
+        with open(recording_file_path, "rb") as recording_file:
+            recording = recording_file.read()
+
+        # Check that the file is an input recording, which was written in the version of the format that this replayer reads
+        magic, version, level_number = struct.unpack_from(INPUT_RECORDING_HEADER_FORMAT, recording, 0)
+        if magic != INPUT_RECORDING_MAGIC:
+            raise ValueError(f"{recording_file_path} is not an input recording")
+        if version != INPUT_RECORDING_VERSION:
+            raise ValueError(f"{recording_file_path} has input recording version {version}, expected version {INPUT_RECORDING_VERSION}")
+
+        frames = []
+        offset = struct.calcsize(INPUT_RECORDING_HEADER_FORMAT)
+        frame_header_size = struct.calcsize(INPUT_FRAME_FORMAT)
+
+        while offset < len(recording):
+
+            # Read the delta time and the number of each type of key
+            delta_time, number_of_held_keys, number_of_pressed_keys, number_of_released_keys = struct.unpack_from(INPUT_FRAME_FORMAT, recording, offset)
+            offset += frame_header_size
+
+            # Read the keys, which are written as the held keys, then the pressed keys, then the released keys
+            number_of_keys = number_of_held_keys + number_of_pressed_keys + number_of_released_keys
+            keys = struct.unpack_from(f"<{number_of_keys}I", recording, offset)
+            offset += 4 * number_of_keys
+
+            input_snapshot = InputSnapshot(
+                held_keys = keys[:number_of_held_keys],
+                pressed_keys = keys[number_of_held_keys:number_of_held_keys + number_of_pressed_keys],
+                released_keys = keys[number_of_held_keys + number_of_pressed_keys:]
+                )
+            frames.append((delta_time, input_snapshot))
+
+        return level_number, frames
+
+    def run(self):
+
+        # Replays every frame of the recording, returning the results of the replay
+
+        # Create the level which was played (The time taken to create the level isn't included in the replay time)
+        simulation = HeadlessSimulation(LevelLoader().load_level_grid(self.level_number), null_render_target = self.null_render_target)
+        simulation.game.fixed_timestep = self.fixed_timestep
+        self.trajectory = []
+
+        start_time = time.perf_counter_ns()
+        for delta_time, input_snapshot in self.frames:
+            # Run the frame, then save where the player ended up
+            simulation.run_frame(delta_time, input_snapshot)
+            self.trajectory.append(simulation.game.player.rect.topleft)
+        replay_time = time.perf_counter_ns() - start_time
+
+        return {
+            "level_number": self.level_number,
+            "number_of_frames": len(self.frames),
+            "recorded_seconds": sum(delta_time for delta_time, input_snapshot in self.frames),
+            "replay_seconds": replay_time / 1_000_000_000,
+            "frames_per_second": len(self.frames) / max(replay_time / 1_000_000_000, 1e-9)
+            }
+
+    def save_trajectory(self, trajectory_file_path):
+
+        # Write the player's trajectory from the most recent replay to a JSON file
+        with open(trajectory_file_path, "w") as trajectory_file:
+            json.dump({"level_number": self.level_number, "trajectory": self.trajectory}, trajectory_file)
+
+    def find_first_trajectory_difference(self, trajectory_file_path):
+
+        # Returns the number of the first frame where the player's trajectory from the most recent replay differs from the trajectory saved in the JSON file (None if the trajectories are the same)
+        with open(trajectory_file_path, "r") as trajectory_file:
+            saved_trajectory = [tuple(position) for position in json.load(trajectory_file)["trajectory"]]
+
+        for frame_number, (position, saved_position) in enumerate(zip(self.trajectory, saved_trajectory)):
+            if position != saved_position:
+                return frame_number
+
+        # If one of the trajectories has more frames than the other
+        if len(self.trajectory) != len(saved_trajectory):
+            return min(len(self.trajectory), len(saved_trajectory))
+
+        return None
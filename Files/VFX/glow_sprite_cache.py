@@ -0,0 +1,38 @@
+import pygame
+
+class GlowSpriteCache:
+    def __init__(self, radius_step = 0.5):
+
+        # Holds the surface of each glowing circle (a "glow sprite"), so that all of the glowing particles share the same surfaces instead of creating new ones every frame
+
+        # The radius of each glow sprite is rounded down to a multiple of this (Circles with radii between two multiples of 0.5 are drawn with exactly the same pixels)
+        self.radius_step = radius_step
+
+        # Dictionary used to hold all of the glow sprites, the key is (the quantised radius, the colour of the circle)
+        self.glow_sprites_dict = {}
+
+    def quantise_radius(self, radius):
+
+        # Returns the radius rounded down to a multiple of the radius step
+        return int(radius / self.radius_step) * self.radius_step
+
+    def find_glow_sprite(self, radius, colour):
+
+        # Returns the glow sprite with the radius and colour, creating it if it hasn't been created yet
+        glow_sprite_key = (self.quantise_radius(radius), tuple(pygame.Color(colour)))
+
+        if glow_sprite_key not in self.glow_sprites_dict:
+            quantised_radius = glow_sprite_key[0]
+
+            # Create a surface which is slightly bigger than the circle, and draw the circle in the center of it
+            # Note: The rest of the surface is black, which doesn't change anything when the glow sprite is drawn with additive blending (i.e. pygame.BLEND_RGB_ADD)
+            glow_sprite = pygame.Surface(((quantised_radius * 2) + 5, (quantised_radius * 2) + 5))
+            pygame.draw.circle(surface = glow_sprite, color = colour, center = (quantised_radius, quantised_radius), radius = quantised_radius, width = 0)
+
+            self.glow_sprites_dict[glow_sprite_key] = glow_sprite
+
+        return self.glow_sprites_dict[glow_sprite_key]
+
+
+# The glow sprite cache shared by all of the glowing particles
+glow_sprite_cache = GlowSpriteCache()
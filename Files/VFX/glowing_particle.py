@@ -1,4 +1,5 @@
 import pygame
+from VFX.glow_sprite_cache import glow_sprite_cache
 
 class GlowingParticle:
     def __init__(self, surface, random_destination):
@@ -10,7 +11,8 @@ class GlowingParticle:
         self.destination = random_destination
 
         # For a single particle
-        self.particle_information = [ [radius, radius, pygame.Surface((radius * 2, radius * 2)), (20, 20, 20), 1] for radius in range(6, 20, 2)]
+        # Note: The particle surfaces are glow sprites from the glow sprite cache, which are shared by all of the glowing particles
+        self.particle_information = [ [radius, radius, glow_sprite_cache.find_glow_sprite(radius, (20, 20, 20)), (20, 20, 20), 1] for radius in range(6, 20, 2)]
 
 
     def draw(self):
@@ -42,17 +44,11 @@ class GlowingParticle:
             # Increase or decrease the radius, depending on the current radius
             self.particle_information[i][1] += 20 * self.particle_information[i][4] * self.delta_time
             
-            # Resize the particle's surface so that all surfaces are still centered
-            self.particle_information[i][2] = pygame.Surface(((self.particle_information[i][1] * 2) + 5,( self.particle_information[i][1] * 2) + 5))
+            # Find the glow sprite with the particle's new radius and colour, so that all surfaces are still centered (The glow sprite is only created the first time that this radius and colour are used)
+            self.particle_information[i][2] = glow_sprite_cache.find_glow_sprite(self.particle_information[i][1], self.particle_information[i][3])
 
             # -------------------------------------------------------------------------------------
             # Drawing the glowing particle onto the main screen
 
-            # Draw the circle in the center of the particle surface
-            pygame.draw.circle(surface = self.particle_information[i][2], color = self.particle_information[i][3], center = (self.particle_information[i][1], self.particle_information[i][1]), radius = self.particle_information[i][1], width = 0)
-
-            # Set the colour key of the surface to black
-            self.particle_information[i][2].set_colorkey("black")
-
             # Draw the particle surface onto the main screen at a random destination
             self.surface.blit(source = self.particle_information[i][2], dest = (self.destination[0] - self.particle_information[i][1] , self.destination[1] - self.particle_information[i][1]), special_flags = pygame.BLEND_RGB_ADD)
\ No newline at end of file
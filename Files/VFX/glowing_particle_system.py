@@ -0,0 +1,101 @@
+import pygame
+import numpy as np
+from VFX.glow_sprite_cache import glow_sprite_cache
+
+class GlowingParticleSystem:
+    def __init__(self, surface, ring_radii = range(6, 20, 2)):
+
+        # Updates and draws many glowing particles at once (i.e. an emitter), where the state of every particle is held in arrays instead of a separate object for each particle
+        """
+        - Each glowing particle is made of rings with different radii (the same as a GlowingParticle), where the radius of each ring grows and shrinks by up to 5 pixels
+        - All of the rings of all of the particles are updated together with array operations, so the cost of updating the particles doesn't depend on how many Python objects there are
+        - The rings are drawn using the glow sprites from the glow sprite cache, with a single call to draw all of them
+        """
+
+        # Draw the particles on the surface passed as a parameter
+        self.surface = surface
+
+        # The original radius of each ring of a particle
+        self.ring_radii = np.array(ring_radii, dtype = np.float64)
+
+        # The colours used by the particles (The colour of each particle is saved as its index in this list)
+        self.colours = []
+
+        # Arrays used to hold the state of every particle
+        self.destinations = np.zeros((0, 2), dtype = np.float64) # The (x, y) position of the center of each particle
+        self.original_radii = np.zeros((0, len(self.ring_radii)), dtype = np.float64) # The original radius of each ring of each particle
+        self.radii = np.zeros((0, len(self.ring_radii)), dtype = np.float64) # The current radius of each ring of each particle
+        self.radius_directions = np.zeros((0, len(self.ring_radii)), dtype = np.int8) # Whether the radius of each ring of each particle is growing (1) or shrinking (-1)
+        self.colour_indexes = np.zeros(0, dtype = np.int32) # The index of the colour of each particle inside self.colours
+
+    def find_number_of_particles(self):
+
+        # Returns the number of particles in the system
+        return len(self.destinations)
+
+    def add_particles(self, destinations, colour = (20, 20, 20)):
+
+        # Adds a glowing particle at each of the destinations, all with the same colour
+
+        # Find the index of the colour, adding it to the list of colours if it hasn't been used yet
+        colour = tuple(pygame.Color(colour))
+        if colour not in self.colours:
+            self.colours.append(colour)
+
+        destinations = np.asarray(destinations, dtype = np.float64).reshape(-1, 2)
+        number_of_new_particles = len(destinations)
+
+        # Add the state of the new particles to the end of the arrays
+        self.destinations = np.concatenate((self.destinations, destinations))
+        self.original_radii = np.concatenate((self.original_radii, np.tile(self.ring_radii, (number_of_new_particles, 1))))
+        self.radii = np.concatenate((self.radii, np.tile(self.ring_radii, (number_of_new_particles, 1))))
+        self.radius_directions = np.concatenate((self.radius_directions, np.ones((number_of_new_particles, len(self.ring_radii)), dtype = np.int8)))
+        self.colour_indexes = np.concatenate((self.colour_indexes, np.full(number_of_new_particles, self.colours.index(colour), dtype = np.int32)))
+
+    def clear(self):
+
+        # Removes all of the particles
+        self.destinations = self.destinations[:0]
+        self.original_radii = self.original_radii[:0]
+        self.radii = self.radii[:0]
+        self.radius_directions = self.radius_directions[:0]
+        self.colour_indexes = self.colour_indexes[:0]
+
+    def update(self, delta_time):
+
+        # -------------------------------------------------------------------------------------
+        # Dynamic radius
+
+        # If the radius of a ring is greater than or equal to its original radius + 5, start decrementing the radius
+        self.radius_directions[self.radii >= self.original_radii + 5] = -1
+
+        # If the radius of a ring is less than or equal to its original radius - 5, start incrementing the radius
+        self.radius_directions[self.radii <= self.original_radii - 5] = 1
+
+        # Increase or decrease the radius of every ring
+        self.radii += 20 * self.radius_directions * delta_time
+
+    def draw(self):
+
+        # If there aren't any particles to draw
+        if self.find_number_of_particles() == 0:
+            return
+
+        # Find the glow sprite of each ring of each particle
+        """
+        - Each ring's radius is rounded down in the same way as the glow sprite cache, and combined with the particle's colour into a single number
+        - The glow sprite is only found once for each different radius and colour, instead of once for each ring
+        """
+        radius_step_indexes = (self.radii / glow_sprite_cache.radius_step).astype(np.int64)
+        number_of_radius_steps = int(radius_step_indexes.max()) + 1
+        glow_sprite_numbers = (self.colour_indexes[:, np.newaxis] * number_of_radius_steps) + radius_step_indexes
+        unique_glow_sprite_numbers, glow_sprite_indexes = np.unique(glow_sprite_numbers, return_inverse = True)
+
+        unique_glow_sprites = [glow_sprite_cache.find_glow_sprite((glow_sprite_number % number_of_radius_steps) * glow_sprite_cache.radius_step, self.colours[glow_sprite_number // number_of_radius_steps]) for glow_sprite_number in unique_glow_sprite_numbers.tolist()]
+
+        # Find the position of the top left of each ring, so that all of the rings of a particle are centered on the particle's destination
+        ring_xs = (self.destinations[:, 0:1] - self.radii).ravel().tolist()
+        ring_ys = (self.destinations[:, 1:2] - self.radii).ravel().tolist()
+
+        # Draw all of the rings onto the surface with additive blending
+        self.surface.blits([(unique_glow_sprites[glow_sprite_index], (ring_x, ring_y), None, pygame.BLEND_RGB_ADD) for glow_sprite_index, ring_x, ring_y in zip(glow_sprite_indexes.ravel().tolist(), ring_xs, ring_ys)], doreturn = False)
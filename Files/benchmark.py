@@ -0,0 +1,13 @@
+import argparse
+from Benchmarks.frame_benchmark import FrameBenchmark
+
+
+if __name__ == "__main__":
+    # Run the frame time benchmarks without a window and write the results to a JSON file (Run from the root folder of the game, e.g. "python Files/benchmark.py")
+    argument_parser = argparse.ArgumentParser(description = "Benchmark Game.run and Menu.run on synthetic tile maps")
+    argument_parser.add_argument("--frames", type = int, default = 600, help = "Number of frames to simulate for each benchmark")
+    argument_parser.add_argument("--output", default = "benchmark_results.json", help = "Path of the JSON file that the results are written to")
+    arguments = argument_parser.parse_args()
+
+    frame_benchmark = FrameBenchmark(number_of_frames = arguments.frames)
+    frame_benchmark.run(output_file_path = arguments.output)
@@ -1,7 +1,10 @@
 import pygame, sys, string
+from concurrent.futures import ThreadPoolExecutor
 from Global.settings import *
 from Menu.menu import Menu
 from Level.game import Game
+from Level.level_loader import LevelLoader
+from Input.input_sampler import InputSampler
 
 class GameStatesController():
     def __init__(self):
@@ -17,70 +20,95 @@ class GameStatesController():
         # Attribute so that we only load the level once, and not every frame
         self.level_loaded = False
 
+        # Tracks the state of the keyboard from the key events in the event loop
+        self.input_sampler = InputSampler()
+
+        # Records the input snapshot and delta time of every frame of the game, so that the play session can be replayed (None if the game isn't being recorded)
+        self.input_recorder = None
+
+        # Loads the tile maps of the levels from the compiled level tile maps file
+        self.level_loader = LevelLoader()
+
+        # Thread used to load the level in the background, so that the window doesn't freeze while a large level is being loaded
+        self.level_loading_executor = ThreadPoolExecutor(max_workers = 1)
+        self.level_loading_future = None # The result of the level being loaded in the background (None if the level isn't being loaded)
+
+        # Dirty rects
+        self.dirty_rects = None # The areas of the screen that have changed this frame, which is None if the entire screen needs to be updated
+        self.previous_shown_state = None # The game state / menu that was shown last frame (The entire screen needs to be updated when changing between them)
+        self.full_screen_update_required = True # Attribute used to update the entire screen next frame (e.g. after changing between full screen and windowed mode)
+
+    def prepare_level(self, chosen_level_number):
+        # Loads the chosen level's tile map and prepares it for the game (This is run on the level loading thread, so it mustn't create any surfaces)
+
+        # ------------------------------------------------------------------------
+        # Loading the tile map from the level tile maps binary file 
+        # Note: The binary file is compiled from the level tile maps text file with the level compiler (which must be run again whenever the text file is edited), so the tile map doesn't need to be parsed character by character
+
+        # Holds the tile map of the tile's numbers (Read straight into an array from the binary file, without parsing the level character by character)
+        non_transformed_tile_map = self.level_loader.load_level_grid(chosen_level_number)
+
+        # Find where each type of tile map object is inside the tile map
+        return self.game.prepare_tile_map(non_transformed_tile_map)
+
+    def quit(self):
+        # Closes the program (Called when the exit button on the window is clicked or when a "Quit" button is clicked inside the menus)
+
+        # Stop the level loading thread (without waiting for a level that is still loading)
+        self.level_loading_executor.shutdown(wait = False, cancel_futures = True)
+
+        # Finish writing the input recording
+        if self.input_recorder != None:
+            self.input_recorder.close()
+
+        # Close the program
+        pygame.quit()
+        sys.exit()
+
     def load_level(self, chosen_level_number):
         # Note: Load level is here because in the future, a level select menu may be added (which will be inside the Menu class), so we need to retrieve the level selected from the Menu class and then pass it to the actual level (i.e. Game)
         
         # If we haven't loaded the level for the game yet
         if self.level_loaded == False:
 
-            # ------------------------------------------------------------------------
-            # Loading the tile map from the level tile maps text file
-
-            # Open the text file which holds 
-            with open("Files/Level/level_tile_maps.txt", "r") as level_tile_maps_file:
-                
-                for line_number, tile_map in enumerate(level_tile_maps_file.readlines()):
-                    # If the line number is equal to the chosen level minus one (This is because the tile maps are zero indexed in order)
-                    if line_number == (chosen_level_number - 1):
-                        # [1:-1] to get rid of the "?" separator and the "\n" line break for each tile map
-                        tile_map_to_convert = tile_map[1:-1]
-
-            # ----------------------------------------------------------------------------------------
-            # Convert the tile map into a series of tile numbers, so that inside the level, we can create objects 
+            # If the level hasn't started loading yet
+            if self.level_loading_future == None:
 
+                # Start loading the level in the background
+                self.level_loading_future = self.level_loading_executor.submit(self.prepare_level, chosen_level_number)
 
-            non_transformed_tile_map = [] # Holds the tile map of the tile's numbers
-            tile_number = "" # Used as some tiles may have double digit tile numbers
-            row_of_tiles_list = [] # Used to hold all the tiles in one row
+                # Show the loading menu until the level has loaded
+                self.menu.show_loading_menu = True
 
-            # For all characters in the tile map
-            for i in range(0, len(tile_map_to_convert)):
-                
-                # Identify what the character is
-                match tile_map_to_convert[i]:
+            # If the level has finished loading in the background
+            elif self.level_loading_future.done() == True:
 
-                    # Comma separator
-                    case ",":
-                    
-                        # Add the row of tiles to the final tile map
-                        non_transformed_tile_map.append(row_of_tiles_list)
+                # Retrieve the prepared tile map (If loading the level failed, this raises the error from the level loading thread)
+                prepared_tile_map = self.level_loading_future.result()
+                self.level_loading_future = None
 
-                        # Empty the row of tiles list
-                        row_of_tiles_list = []
+                # Create the level's object tile map, which is a tile map consisting of the objects (the actual game tile map)
+                # Note: This is done on the main thread, as the objects create surfaces
+                self.game.create_objects_from_prepared_tile_map(prepared_tile_map)
 
-                    # Exclamation mark separator
-                    case "!":
-                        # Add the tile number to the row of tiles 
-                        row_of_tiles_list.append(int(tile_number))
+                # Stop showing the loading menu
+                self.menu.show_loading_menu = False
 
-                        # Reset the tile number
-                        tile_number = ""
+                # Set the level loaded attribute to True
+                self.level_loaded = True
 
-                    # If it is neither a comma separator or an exclamation mark separator
-                    case _: # Can also be "case other"
-                        tile_number += tile_map_to_convert[i]
-
-            # Create the level's object tile map, which is a tile map consisting of the objects (the actual game tile map)
-            self.game.create_objects_tile_map(non_transformed_tile_map)
-
-            # Set the level loaded attribute to True
-            self.level_loaded = True
+                # If the game is being recorded, start recording the frames of the level
+                if self.input_recorder != None:
+                    self.input_recorder.start(chosen_level_number)
             
     def event_loop(self):
 
         # Event handler
         for event in pygame.event.get():
 
+            # Update the state of the keyboard (for the player's input)
+            self.input_sampler.handle_event(event)
+
             # Identify the type of event
             match event.type:
                 
@@ -89,9 +117,9 @@ class GameStatesController():
 
                     # If the exit button was pressed
                     if event.type == pygame.QUIT:
+
                         # Close the program
-                        pygame.quit()
-                        sys.exit()
+                        self.quit()
 
                 # Key presses
                 case pygame.KEYDOWN:
@@ -119,6 +147,19 @@ class GameStatesController():
                                 pygame.display.set_mode(flags = pygame.FULLSCREEN, depth = 32)
                                 self.full_screen = True
 
+                            # The entire screen needs to be updated after changing the display mode
+                            self.full_screen_update_required = True
+
+                        # "F3" key
+                        case pygame.K_F3:
+                            # Turn the frame profiler and its overlay on / off
+                            self.game.frame_profiler.toggle()
+
+                        # "F4" key
+                        case pygame.K_F4:
+                            # Save the frame profiler's timings of the most recent frames, so that they can be viewed in chrome://tracing
+                            self.game.frame_profiler.export_chrome_trace("frame_trace.json")
+
                     # ------------------------------------------------------------
                     # In-game / Level events
 
@@ -134,54 +175,34 @@ class GameStatesController():
                                 self.game.running = False
                                 self.menu.show_paused_menu = True
 
-                            # "w" key
-                            case pygame.K_w:
-                                
-                                # If the player is allowed to jump (i.e. pressed the "w" key when on the ground )
-                                if self.game.player.allowed_to_jump == True:
-
-                                    # Don't allow the player to jump
-                                    self.game.player.allowed_to_jump = False
-
-                                    # Allow the player to double jump
-                                    self.game.player.allowed_to_double_jump = True
-
-                                    # Make the player jump
-                                    self.game.player.jump()
-
-                            # "Space" key
-                            case pygame.K_SPACE:
-                                    
-                                # If the player has already jumped (i.e. has pressed the "space" key during the initial jump)
-                                if self.game.player.allowed_to_jump == False and self.game.player.allowed_to_double_jump == True:
-
-                                    # Don't allow the player to double jump
-                                    self.game.player.allowed_to_double_jump = False
-                                    
-                                    # Set the acceleration of the double jump 
-                                    self.game.player.jumping_suvat_a = - ((2 * self.game.player.desired_double_jump_height) / (self.game.player.desired_time_to_reach_double_jump_height ** 2))
-
-                                    # Set the initial velocity of the double jump
-                                    self.game.player.jumping_suvat_u = (2 * self.game.player.desired_double_jump_height) / self.game.player.desired_time_to_reach_double_jump_height
-
-                                    # Make the player double jump
-                                    self.game.player.jump()
+        # Take the state of the keyboard for this frame, which the player reads its input from
+        # Note: The snapshot is taken once per frame after all of the events have been handled, so the keyboard doesn't need to be polled every time a key is checked
+        self.game.input_snapshot = self.input_sampler.take_snapshot()
                                     
     def run(self, delta_time):
         
         # Run the event loop
         self.event_loop()
 
-        # If none of the menus are being shown
+        # If the game should be shown, load the level (Has conditions which will only perform this if the level hasn't been loaded into the game yet)
+        # Note: The level is loaded in the background, so the loading menu is shown until it has loaded
         if self.menu.show_main_menu == False and self.menu.show_controls_menu == False and self.menu.show_paused_menu == False:
+            self.load_level(chosen_level_number = 2)
+
+        # Find which game state / menu is being shown this frame
+        shown_state = (self.menu.show_main_menu, self.menu.show_controls_menu, self.menu.show_paused_menu, self.menu.show_loading_menu)
+
+        # If none of the menus are being shown
+        if self.menu.show_main_menu == False and self.menu.show_controls_menu == False and self.menu.show_paused_menu == False and self.menu.show_loading_menu == False:
 
             # If this attribute is False (This would be the case if the player went into the Paused menu and then clicked the "Continue" button)
             if self.game.running == False:
                 # Set the game's running attribute to True
                 self.game.running = True
 
-            # Load the level (Has conditions which will only perform this if the level hasn't been loaded into the game yet)
-            self.load_level(chosen_level_number = 2)
+            # If the game is being recorded, record the delta time and the input snapshot that the game is run with
+            if self.input_recorder != None:
+                self.input_recorder.record_frame(delta_time, self.game.input_snapshot)
 
             # Run the game
             self.game.run(delta_time)
@@ -192,4 +213,28 @@ class GameStatesController():
             # Run the menus
             self.menu.run(delta_time)
 
+            # If a "Quit" button was clicked inside the menus
+            if self.menu.quit_requested == True:
+                self.quit()
+
+        # ---------------------------------------------
+        # Dirty rects
+
+        # If the game state / menu being shown has changed or the entire screen needs to be updated for another reason
+        if shown_state != self.previous_shown_state or self.full_screen_update_required == True:
+            # Update the entire screen
+            self.dirty_rects = None
+            self.full_screen_update_required = False
+
+        # If the menus were shown this frame
+        elif True in shown_state:
+            # Only update the areas of the screen that the menu changed
+            self.dirty_rects = self.menu.dirty_rects
+
+        # If the game was shown this frame
+        else:
+            # Only update the areas of the screen that the game changed
+            self.dirty_rects = self.game.dirty_rects
 
+        # Save the game state / menu that was shown this frame
+        self.previous_shown_state = shown_state
@@ -1,6 +1,8 @@
-import pygame, time
+import pygame, time, argparse
 from Global.settings import *
+from Global.asset_manager import asset_manager
 from game_states_controller import GameStatesController
+from Input.input_recorder import InputRecorder
 
 
 class Main:
@@ -14,6 +16,9 @@ class Main:
 
         # Set the screen to be full screen 
         self.screen = pygame.display.set_mode(flags = pygame.FULLSCREEN, depth = 32)
+
+        # Load all of the images used by the menus and the game before they are created
+        self.preload_assets()
         
         # Create a game states controller
         self.game_states_controller = GameStatesController()
@@ -25,7 +30,35 @@ class Main:
         # Create an object to track time
         self.clock = pygame.time.Clock()
         self.chosen_framerate = 60
+
+        # Attribute which determines whether only the areas of the screen that have changed are updated each frame, instead of the entire screen
+        self.dirty_rect_rendering = True
         
+    def preload_assets(self):
+
+        # Find all of the images used by the menus and the game (The player's animations have transparent pixels)
+        image_keys = asset_manager.find_image_keys("graphics/MenuButtons") + asset_manager.find_image_keys("graphics/Tiles") + asset_manager.find_image_keys("graphics/Player", alpha = True)
+
+        # Show a loading bar while the images are being loaded
+        self.screen.fill("black")
+        pygame.display.update()
+
+        # Decode all of the images in parallel, converting each one as soon as it has been decoded
+        asset_manager.preload_images(image_keys, progress_callback = self.draw_preloading_progress)
+
+    def draw_preloading_progress(self, number_of_images_loaded, number_of_images):
+
+        # Keep the window responding while the images are being loaded
+        pygame.event.pump()
+
+        # Draw the loading bar in the centre of the screen, filled up to the fraction of the images that have been loaded
+        loading_bar_rect = pygame.Rect((screen_width / 2) - 400, (screen_height / 2) - 20, 800, 40)
+        pygame.draw.rect(self.screen, "white", (loading_bar_rect.x, loading_bar_rect.y, loading_bar_rect.width * (number_of_images_loaded / number_of_images), loading_bar_rect.height), 0)
+        pygame.draw.rect(self.screen, "white", loading_bar_rect, 2)
+
+        # Only update the area of the screen with the loading bar
+        pygame.display.update(loading_bar_rect)
+
     def run(self):
  
         while True:
@@ -43,10 +76,32 @@ class Main:
             
             # -------------------------------------
             # Update display
-            pygame.display.update() 
+            # If dirty rect rendering is turned on and the game states controller knows which areas of the screen have changed, only update those areas
+            if self.dirty_rect_rendering == True and self.game_states_controller.dirty_rects != None:
+                pygame.display.update(self.game_states_controller.dirty_rects)
+
+            # Otherwise, update the entire screen
+            else:
+                pygame.display.update() 
             
 
 if __name__ == "__main__":
-    # Instantiate main and run it
+    # Read the command line options (Run from the root folder of the game, e.g. "python Files/main.py")
+    argument_parser = argparse.ArgumentParser(description = "Play the game")
+    argument_parser.add_argument("--record", help = "Path of a file to record the input of every frame of the level to, which can be replayed with Files/replay.py")
+    argument_parser.add_argument("--fixed-timestep", action = "store_true", help = "Run the player's physics in steps of a fixed length of time (The length of each step is set inside Files/Global/settings.py)")
+    arguments = argument_parser.parse_args()
+
+    # Instantiate main
     main = Main()
+
+    # Run the player's physics using a fixed timestep if it was chosen (Otherwise the FIXED_TIMESTEP setting is used)
+    if arguments.fixed_timestep == True:
+        main.game_states_controller.game.fixed_timestep = True
+
+    # Record the input of every frame if a recording file was chosen
+    if arguments.record != None:
+        main.game_states_controller.input_recorder = InputRecorder(arguments.record)
+
+    # Run main
     main.run()
\ No newline at end of file
@@ -0,0 +1,31 @@
+import argparse, sys
+from Global.settings import *
+from Simulation.input_replayer import InputReplayer
+
+
+if __name__ == "__main__":
+    # Replay an input recording without a window as fast as possible (Run from the root folder of the game, e.g. "python Files/replay.py input_recording.bin")
+    # Note: Recordings are made by running the game with the --record option, e.g. "python Files/main.py --record input_recording.bin"
+    argument_parser = argparse.ArgumentParser(description = "Replay an input recording through Game.run and report the throughput")
+    argument_parser.add_argument("recording", help = "Path of the input recording to replay")
+    argument_parser.add_argument("--trajectory", help = "Path of a JSON file to write the player's position at the end of every frame to")
+    argument_parser.add_argument("--compare", help = "Path of a trajectory JSON file from a previous replay, which the player's positions must match")
+    argument_parser.add_argument("--render", action = "store_true", help = "Also draw the scaled surface onto an offscreen screen every frame")
+    argument_parser.add_argument("--fixed-timestep", action = "store_true", help = "Run the player's physics using a fixed timestep (For recordings made with the --fixed-timestep option)")
+    arguments = argument_parser.parse_args()
+
+    input_replayer = InputReplayer(arguments.recording, null_render_target = not arguments.render, fixed_timestep = arguments.fixed_timestep or FIXED_TIMESTEP)
+    results = input_replayer.run()
+    print(f"Level {results['level_number']}: {results['number_of_frames']} frames ({results['recorded_seconds']:.2f} s recorded) replayed in {results['replay_seconds']:.3f} s, {results['frames_per_second']:.1f} frames per second")
+
+    if arguments.trajectory != None:
+        input_replayer.save_trajectory(arguments.trajectory)
+
+    if arguments.compare != None:
+        first_difference = input_replayer.find_first_trajectory_difference(arguments.compare)
+
+        if first_difference != None:
+            print(f"Trajectory differs from {arguments.compare} at frame {first_difference}")
+            sys.exit(1)
+
+        print(f"Trajectory matches {arguments.compare}")
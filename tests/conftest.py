@@ -0,0 +1,12 @@
+import os, sys
+
+# The tests are run from the root folder of the game (e.g. "python -m pytest -q"), the same as the game itself
+"""
+- The game's modules are imported relative to the "Files" folder (e.g. "from Level.tile_grid import TileGrid")
+- The assets and the level files are loaded relative to the root folder (e.g. "graphics/Player/Ice"), so the working directory is set to the root folder
+- SDL's dummy video driver is used, so that no window is opened
+"""
+root_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(root_directory, "Files"))
+os.chdir(root_directory)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
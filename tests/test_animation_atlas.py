@@ -0,0 +1,37 @@
+import shutil, pygame
+from Global.animation_atlas import AnimationAtlas
+from Global.asset_manager import AssetManager
+
+ANIMATION_STATES = ["Idle", "Run", "Jump", "Fall", "Land", "PowerJump"]
+
+
+def test_prebuilt_atlas_matches_the_built_atlas(tmp_path):
+
+    # The atlas images are converted to the display's pixel format, so the display must be set up
+    if pygame.display.get_init() == False or pygame.display.get_surface() == None:
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    # Build the atlas from the frames of the player's animations (A copy is used, so that the atlas isn't saved inside the game's graphics folder)
+    animations_directory = tmp_path / "Ice"
+    shutil.copytree("graphics/Player/Ice", animations_directory)
+    built_atlas = AssetManager().load_animation_atlas(animations_directory = str(animations_directory), animation_states = ANIMATION_STATES)
+    built_atlas.save()
+
+    # Load the prebuilt atlas that was saved
+    asset_manager = AssetManager()
+    prebuilt_atlas = asset_manager.load_animation_atlas(animations_directory = str(animations_directory), animation_states = ANIMATION_STATES)
+
+    # The prebuilt atlas image is the surface that the asset manager loaded and converted (It isn't copied again)
+    assert prebuilt_atlas.atlas_image is asset_manager.load_image(str(animations_directory / "atlas.png"), alpha = True)
+
+    # The frames of both atlases must be the same, facing in both directions
+    for flipped in (False, True):
+        built_frames_dict = built_atlas.find_animation_frames(flipped = flipped)
+        prebuilt_frames_dict = prebuilt_atlas.find_animation_frames(flipped = flipped)
+        assert built_frames_dict.keys() == prebuilt_frames_dict.keys()
+
+        for animation_state in ANIMATION_STATES:
+            assert len(built_frames_dict[animation_state]) == len(prebuilt_frames_dict[animation_state])
+            for built_frame, prebuilt_frame in zip(built_frames_dict[animation_state], prebuilt_frames_dict[animation_state]):
+                assert pygame.image.tobytes(built_frame, "RGBA") == pygame.image.tobytes(prebuilt_frame, "RGBA")
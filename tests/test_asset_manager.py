@@ -0,0 +1,57 @@
+import pygame
+from Global.asset_manager import AssetManager
+
+
+def set_up_display():
+
+    # Loaded images are converted to the display's pixel format, so the display must be set up
+    if pygame.display.get_init() == False or pygame.display.get_surface() == None:
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+
+def test_loading_the_same_image_twice_returns_the_same_surface():
+
+    set_up_display()
+    asset_manager = AssetManager()
+
+    # The same key must return the same surface object
+    play_button_image = asset_manager.load_image("graphics/MenuButtons/play_button.png")
+    assert asset_manager.load_image("graphics/MenuButtons/play_button.png") is play_button_image
+    assert len(asset_manager.images_dict) == 1
+
+    # The same path with transparency is a different key, so it is loaded separately
+    play_button_alpha_image = asset_manager.load_image("graphics/MenuButtons/play_button.png", alpha = True)
+    assert play_button_alpha_image is not play_button_image
+    assert asset_manager.load_image("graphics/MenuButtons/play_button.png", alpha = True) is play_button_alpha_image
+    assert len(asset_manager.images_dict) == 2
+
+
+def test_preload_images_fills_the_cache():
+
+    set_up_display()
+    asset_manager = AssetManager()
+
+    # Find all of the menu button images
+    image_keys = asset_manager.find_image_keys("graphics/MenuButtons")
+    assert len(image_keys) > 0
+
+    # Preload them, recording the progress reported
+    progress = []
+    asset_manager.preload_images(image_keys, progress_callback = lambda number_of_images_loaded, number_of_images: progress.append((number_of_images_loaded, number_of_images)))
+    assert progress == [(number_of_images_loaded, len(image_keys)) for number_of_images_loaded in range(1, len(image_keys) + 1)]
+
+    # Every image must be loaded and converted
+    assert set(asset_manager.images_dict) == set(image_keys)
+    assert len(asset_manager.unconverted_image_keys) == 0
+
+    # Loading a preloaded image must return the cached surface
+    preloaded_images = dict(asset_manager.images_dict)
+    for path, alpha in image_keys:
+        assert asset_manager.load_image(path, alpha) is preloaded_images[(path, alpha)]
+
+    # Preloading again must not load anything new
+    progress = []
+    asset_manager.preload_images(image_keys, progress_callback = lambda number_of_images_loaded, number_of_images: progress.append((number_of_images_loaded, number_of_images)))
+    assert progress == []
+    assert asset_manager.images_dict == preloaded_images
@@ -0,0 +1,90 @@
+import pygame, pytest
+from Level.level_loader import LevelLoader
+from Simulation.headless_simulation import HeadlessSimulation
+
+# The keys held down and the keys pressed at the start of each third of a second (A third of a second is a whole number of frames at 15, 60 and 144 frames per second)
+INPUT_SCHEDULE = [
+    (set(), []),
+    ({pygame.K_d}, []),
+    ({pygame.K_d}, [pygame.K_w]),
+    ({pygame.K_d}, [pygame.K_SPACE]),
+    ({pygame.K_d}, []),
+    ({pygame.K_a}, [pygame.K_w]),
+    ({pygame.K_a}, []),
+    (set(), []),
+    ({pygame.K_d}, [pygame.K_w]),
+    ({pygame.K_d}, []),
+    ({pygame.K_d, pygame.K_a}, []),
+    (set(), []),
+    ]
+
+
+def run_scripted_input(frames_per_second):
+
+    # Runs the input schedule with a fixed timestep at the frame rate, returning the player's position after every physics step
+    simulation = HeadlessSimulation(LevelLoader().load_level_grid(2), null_render_target = True)
+    simulation.game.fixed_timestep = True
+    player = simulation.game.player
+
+    # Save the player's position after every physics step
+    trajectory = []
+    update_physics = player.update_physics
+    def update_physics_and_save_position():
+        update_physics()
+        trajectory.append(player.rect.topleft)
+    player.update_physics = update_physics_and_save_position
+
+    frames_per_schedule_entry = frames_per_second // 3
+    for held_keys, pressed_keys in INPUT_SCHEDULE:
+        for frame_number in range(frames_per_schedule_entry):
+            simulation.step(1 / frames_per_second, held_keys = held_keys, pressed_keys = pressed_keys if frame_number == 0 else [])
+
+    return trajectory
+
+
+def test_fixed_timestep_trajectory_is_the_same_at_any_frame_rate():
+
+    trajectories = {frames_per_second: run_scripted_input(frames_per_second) for frames_per_second in (15, 60, 144)}
+
+    # The player must have moved horizontally and vertically
+    assert len(set(x for x, y in trajectories[60])) > 1
+    assert len(set(y for x, y in trajectories[60])) > 1
+
+    # The same number of physics steps are run for the same amount of time, and the player moves in the same way during each step
+    assert trajectories[15] == trajectories[60]
+    assert trajectories[144] == trajectories[60]
+
+
+@pytest.mark.parametrize("frames_per_second", [15, 60, 144])
+def test_jumps_are_handled_inside_a_physics_step(frames_per_second):
+
+    # The player may only move during a physics step, so that it is always drawn in between its positions before and after the last step
+    simulation = HeadlessSimulation(LevelLoader().load_level_grid(2), null_render_target = True)
+    simulation.game.fixed_timestep = True
+    player = simulation.game.player
+
+    # Count the number of physics steps
+    physics_steps = []
+    update_physics = player.update_physics
+    def update_physics_and_count_step():
+        update_physics()
+        physics_steps.append(player.rect.topleft)
+    player.update_physics = update_physics_and_count_step
+
+    # Jump, then double jump while in the air
+    # Note: At 144 frames per second, every 6th frame doesn't have a physics step (as the physics steps are 1 / 120 seconds long), so the keys are pressed during those frames
+    for frame_number in range(2 * frames_per_second):
+        position_before_frame = player.rect.topleft
+        number_of_physics_steps_before_frame = len(physics_steps)
+        simulation.step(1 / frames_per_second, held_keys = set(), pressed_keys = {6: [pygame.K_w], 12: [pygame.K_SPACE]}.get(frame_number % 24, []))
+
+        # If no physics steps were run this frame, the player can't have moved (even if a key was pressed)
+        if len(physics_steps) == number_of_physics_steps_before_frame:
+            assert player.rect.topleft == position_before_frame
+
+        # The player is drawn in between its positions before and after the last physics step
+        for axis in (0, 1):
+            assert min(simulation.game.previous_player_position[axis], player.rect.topleft[axis]) <= player.interpolated_position[axis] <= max(simulation.game.previous_player_position[axis], player.rect.topleft[axis])
+
+    # The player must have jumped
+    assert min(y for x, y in physics_steps) < physics_steps[0][1]
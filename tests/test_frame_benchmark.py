@@ -0,0 +1,16 @@
+from Benchmarks.frame_benchmark import FrameBenchmark
+
+
+def test_game_benchmark_reports_every_phase_of_the_frame_profiler():
+
+    # Benchmark a small synthetic tile map for a few frames
+    frame_benchmark = FrameBenchmark(number_of_frames = 30)
+    frame_benchmark.benchmark_game(width_in_screens = 1, density = 0.25)
+    result = frame_benchmark.results[-1]
+
+    # The phases must be the same as the ones marked inside Game.run (i.e. the ones shown by the frame profiler's overlay), including the phases without a method of their own
+    assert list(result["phases"]) == ["Input", "Delta time", "Fill", "Camera", "Tile drawing", "Neighbouring tiles", "Ground and ceiling tiles", "Debug overlay", "Player", "Scale and blit"]
+
+    # Every phase must be timed once for every frame
+    for phase_name, phase_summary in result["phases"].items():
+        assert phase_summary["calls"] == 30, phase_name
@@ -0,0 +1,46 @@
+import threading, pygame, pytest
+from Input.input_recorder import InputRecorder
+from game_states_controller import GameStatesController
+
+
+@pytest.fixture
+def game_states_controller(monkeypatch):
+
+    # Create the game states controller without a window, and without actually closing pygame when the program is closed (so that the other tests can still use pygame)
+    if pygame.display.get_init() == False or pygame.display.get_surface() == None:
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+    monkeypatch.setattr(pygame, "quit", lambda: None)
+    return GameStatesController()
+
+
+def load_level_slowly(game_states_controller):
+
+    # Starts loading a level in the background which doesn't finish until the returned event is set
+    loading_finished = threading.Event()
+    game_states_controller.level_loading_future = game_states_controller.level_loading_executor.submit(loading_finished.wait)
+    return loading_finished
+
+
+@pytest.mark.parametrize("quit_from_menu", [False, True])
+def test_quitting_stops_loading_and_finishes_the_recording(game_states_controller, tmp_path, quit_from_menu):
+
+    game_states_controller.input_recorder = InputRecorder(tmp_path / "input_recording.bin")
+    game_states_controller.input_recorder.start(2)
+    loading_finished = load_level_slowly(game_states_controller)
+
+    with pytest.raises(SystemExit):
+        # Click the "Quit" button inside the menus or the exit button on the window
+        if quit_from_menu == True:
+            game_states_controller.menu.quit_requested = True
+            game_states_controller.run(1 / 60)
+        else:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+            game_states_controller.event_loop()
+
+    # The level loading thread must have been shut down and the recording must have been finished
+    with pytest.raises(RuntimeError):
+        game_states_controller.level_loading_executor.submit(print)
+    assert game_states_controller.input_recorder.recording_file == None
+
+    loading_finished.set()
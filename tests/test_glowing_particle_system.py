@@ -0,0 +1,47 @@
+import random, pygame
+from VFX.glowing_particle import GlowingParticle
+from VFX.glowing_particle_system import GlowingParticleSystem
+
+
+def test_glowing_particle_system_draws_the_same_as_glowing_particles():
+
+    # The glow sprites are converted to the display's pixel format, so the display must be set up
+    if pygame.display.get_init() == False or pygame.display.get_surface() == None:
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    # Random destinations for the particles and random delta times for each frame (The same for the particles and the particle system)
+    random_generator = random.Random(1)
+    destinations = [(random_generator.uniform(0, 480), random_generator.uniform(0, 270)) for _ in range(200)]
+    delta_times = [random_generator.uniform(0.005, 0.03) for _ in range(120)]
+
+    # A separate glowing particle object for each particle
+    glowing_particles_surface = pygame.Surface((480, 270))
+    glowing_particles = [GlowingParticle(glowing_particles_surface, destination) for destination in destinations]
+
+    # All of the particles inside one particle system (Added in two bursts)
+    glowing_particle_system_surface = pygame.Surface((480, 270))
+    glowing_particle_system = GlowingParticleSystem(glowing_particle_system_surface)
+    glowing_particle_system.add_particles(destinations[:100])
+    glowing_particle_system.add_particles(destinations[100:])
+    assert glowing_particle_system.find_number_of_particles() == 200
+
+    # Every frame must be drawn the same
+    for delta_time in delta_times:
+        glowing_particles_surface.fill("black")
+        for glowing_particle in glowing_particles:
+            glowing_particle.delta_time = delta_time
+            glowing_particle.draw()
+
+        glowing_particle_system_surface.fill("black")
+        glowing_particle_system.update(delta_time)
+        glowing_particle_system.draw()
+
+        assert pygame.image.tobytes(glowing_particle_system_surface, "RGB") == pygame.image.tobytes(glowing_particles_surface, "RGB")
+
+    # Nothing is drawn once the particles have been removed
+    glowing_particle_system.clear()
+    glowing_particle_system_surface.fill("black")
+    glowing_particle_system.update(delta_times[0])
+    glowing_particle_system.draw()
+    assert max(pygame.image.tobytes(glowing_particle_system_surface, "RGB")) == 0
@@ -0,0 +1,75 @@
+import pygame, pytest
+from Input.input_snapshot import InputSnapshot
+from Input.input_sampler import InputSampler
+from Input.scripted_input import ScriptedInput
+
+
+def snapshot_keys(snapshot):
+    # Returns the held, pressed and released keys of the snapshot
+    return snapshot.held_keys, snapshot.pressed_keys, snapshot.released_keys
+
+
+def test_input_snapshot():
+
+    held_keys = {pygame.K_a}
+    snapshot = InputSnapshot(held_keys = held_keys, pressed_keys = [pygame.K_w])
+
+    assert snapshot.is_held(pygame.K_a) == True and snapshot.is_held(pygame.K_d) == False
+    assert snapshot.was_pressed(pygame.K_w) == True and snapshot.was_pressed(pygame.K_a) == False
+
+    # The snapshot doesn't change when the keys it was taken from change, and no other attributes can be added to it
+    held_keys.add(pygame.K_d)
+    assert snapshot.is_held(pygame.K_d) == False
+    with pytest.raises(AttributeError):
+        snapshot.other_keys = set()
+
+
+def test_input_sampler():
+
+    input_sampler = InputSampler()
+
+    # Hold "a", and press and release "w" within the same frame (Events which aren't key events are ignored)
+    for event in (pygame.event.Event(pygame.KEYDOWN, key = pygame.K_a), pygame.event.Event(pygame.KEYDOWN, key = pygame.K_w), pygame.event.Event(pygame.KEYUP, key = pygame.K_w), pygame.event.Event(pygame.MOUSEMOTION, pos = (0, 0))):
+        input_sampler.handle_event(event)
+    assert snapshot_keys(input_sampler.take_snapshot()) == ({pygame.K_a}, {pygame.K_w, pygame.K_a}, {pygame.K_w})
+
+    # The pressed and released keys are only in the snapshot of the frame they were pressed / released in
+    assert snapshot_keys(input_sampler.take_snapshot()) == ({pygame.K_a}, set(), set())
+
+    # All keys are released when the window loses focus
+    input_sampler.handle_event(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+    assert snapshot_keys(input_sampler.take_snapshot()) == (set(), set(), {pygame.K_a})
+
+
+def test_scripted_input_creates_the_same_snapshots_as_the_input_sampler():
+
+    input_sampler = InputSampler()
+    scripted_input = ScriptedInput()
+
+    # The key events for each frame, and the same keys pressed / released by a script
+    frames = [
+        ([(pygame.KEYDOWN, pygame.K_d)], lambda: scripted_input.press_key(pygame.K_d)),
+        ([(pygame.KEYDOWN, pygame.K_w), (pygame.KEYUP, pygame.K_w)], lambda: scripted_input.tap_key(pygame.K_w)),
+        ([], lambda: None),
+        ([(pygame.KEYUP, pygame.K_d), (pygame.KEYDOWN, pygame.K_a)], lambda: (scripted_input.release_key(pygame.K_d), scripted_input.press_key(pygame.K_a))),
+        ([(pygame.KEYUP, pygame.K_a)], lambda: scripted_input.release_key(pygame.K_a)),
+        ]
+
+    for key_events, press_keys in frames:
+        for event_type, key in key_events:
+            input_sampler.handle_event(pygame.event.Event(event_type, key = key))
+        press_keys()
+
+        assert snapshot_keys(scripted_input.take_snapshot()) == snapshot_keys(input_sampler.take_snapshot())
+
+
+def test_tapping_a_held_key_does_not_release_it():
+
+    scripted_input = ScriptedInput()
+    scripted_input.set_held_keys({pygame.K_SPACE})
+    scripted_input.tap_key(pygame.K_SPACE)
+
+    snapshot = scripted_input.take_snapshot()
+    assert snapshot.is_held(pygame.K_SPACE) == True
+    assert snapshot.was_pressed(pygame.K_SPACE) == True
+    assert pygame.K_SPACE not in snapshot.released_keys
@@ -0,0 +1,94 @@
+import random, pygame, pytest
+from Input.input_recorder import InputRecorder
+from Input.scripted_input import ScriptedInput
+from Level.level_loader import LevelLoader
+from Simulation.headless_simulation import HeadlessSimulation
+from Simulation.input_replayer import InputReplayer
+
+
+def record_play_session(recording_file_path, level_number, number_of_frames, seed):
+
+    # Plays the level with random input and delta times while recording it, returning the recorded frames and the position of the player at the end of each frame
+    random_generator = random.Random(seed)
+    simulation = HeadlessSimulation(LevelLoader().load_level_grid(level_number), null_render_target = True)
+    scripted_input = ScriptedInput()
+    input_recorder = InputRecorder(recording_file_path)
+    input_recorder.start(level_number)
+
+    recorded_frames = []
+    trajectory = []
+    for _ in range(number_of_frames):
+
+        # Change which keys are held down now and again, and sometimes jump
+        if random_generator.random() < 0.1:
+            scripted_input.set_held_keys(random_generator.choice([{pygame.K_a}, {pygame.K_d}, set(), {pygame.K_d, pygame.K_SPACE}]))
+        if random_generator.random() < 0.05:
+            scripted_input.tap_key(pygame.K_w)
+
+        delta_time = random_generator.choice([1 / 60, 1 / 30, random_generator.uniform(1 / 144, 1 / 20)])
+        input_snapshot = scripted_input.take_snapshot()
+
+        input_recorder.record_frame(delta_time, input_snapshot)
+        simulation.run_frame(delta_time, input_snapshot)
+
+        recorded_frames.append((delta_time, input_snapshot))
+        trajectory.append(simulation.game.player.rect.topleft)
+
+    input_recorder.close()
+    return recorded_frames, trajectory
+
+
+def test_replay_matches_the_recorded_play_session(tmp_path):
+
+    recorded_frames, trajectory = record_play_session(tmp_path / "input_recording.bin", level_number = 2, number_of_frames = 300, seed = 0)
+
+    input_replayer = InputReplayer(tmp_path / "input_recording.bin")
+
+    # The recording must hold exactly the frames that were played
+    assert input_replayer.level_number == 2
+    assert len(input_replayer.frames) == len(recorded_frames)
+    for (delta_time, input_snapshot), (recorded_delta_time, recorded_input_snapshot) in zip(input_replayer.frames, recorded_frames):
+        assert delta_time == recorded_delta_time
+        assert (input_snapshot.held_keys, input_snapshot.pressed_keys, input_snapshot.released_keys) == (recorded_input_snapshot.held_keys, recorded_input_snapshot.pressed_keys, recorded_input_snapshot.released_keys)
+
+    # Replaying the recording must move the player along the same path
+    results = input_replayer.run()
+    assert results["number_of_frames"] == len(recorded_frames)
+    assert input_replayer.trajectory == trajectory
+
+    # A saved trajectory matches the replay that it was saved from
+    input_replayer.save_trajectory(tmp_path / "trajectory.json")
+    assert input_replayer.find_first_trajectory_difference(tmp_path / "trajectory.json") == None
+
+    # A different trajectory is found to be different at the first frame that differs
+    input_replayer.trajectory[120] = (-1, -1)
+    assert input_replayer.find_first_trajectory_difference(tmp_path / "trajectory.json") == 120
+
+
+def test_recording_can_be_restarted(tmp_path):
+
+    # Starting the recording again (e.g. when the level is loaded again) replaces the frames recorded before
+    input_recorder = InputRecorder(tmp_path / "input_recording.bin")
+    input_snapshot = ScriptedInput().take_snapshot()
+
+    input_recorder.start(1)
+    for _ in range(5):
+        input_recorder.record_frame(1 / 60, input_snapshot)
+
+    input_recorder.start(2)
+    for _ in range(3):
+        input_recorder.record_frame(1 / 30, input_snapshot)
+    input_recorder.close()
+
+    input_replayer = InputReplayer(tmp_path / "input_recording.bin")
+    assert input_replayer.level_number == 2
+    assert [delta_time for delta_time, input_snapshot in input_replayer.frames] == [1 / 30, 1 / 30, 1 / 30]
+
+
+def test_other_files_are_not_replayed(tmp_path):
+
+    with open(tmp_path / "not_a_recording.bin", "wb") as not_a_recording_file:
+        not_a_recording_file.write(b"LVLS\x02\x00\x01\x00")
+
+    with pytest.raises(ValueError):
+        InputReplayer(tmp_path / "not_a_recording.bin")
@@ -0,0 +1,91 @@
+import os, pytest
+import numpy as np
+from Level.level_compiler import LevelCompiler
+from Level.level_loader import LevelLoader
+
+
+def write_tile_maps(text_file_path, tile_maps):
+
+    # Writes the tile maps (lists of rows of tile numbers) into a level tile maps text file, in the same format as "level_tile_maps.txt"
+    with open(text_file_path, "w") as level_tile_maps_file:
+        for tile_map in tile_maps:
+            level_tile_maps_file.write("?" + "".join("".join(f"{tile_number}!" for tile_number in row) + "," for row in tile_map) + "\n")
+
+
+def test_compiled_levels_load_the_same_tile_maps(tmp_path):
+
+    # The second level has a tile number that doesn't fit inside a uint8, so it is stored with 2 bytes per tile number
+    tile_maps = [
+        [[0, 0, 2, 0], [0, 1, 2, 0], [2, 2, 2, 2]],
+        [[0, 300, 0], [2, 2, 2]]
+        ]
+    write_tile_maps(tmp_path / "level_tile_maps.txt", tile_maps)
+    LevelCompiler(text_file_path = tmp_path / "level_tile_maps.txt", binary_file_path = tmp_path / "level_tile_maps.bin").compile()
+
+    level_loader = LevelLoader(text_file_path = tmp_path / "level_tile_maps.txt", binary_file_path = tmp_path / "level_tile_maps.bin")
+
+    for level_number, tile_map in enumerate(tile_maps, start = 1):
+        level_grid = level_loader.load_level_grid(level_number)
+        assert level_grid.tolist() == tile_map
+
+    # Levels are numbered from 1
+    with pytest.raises(ValueError):
+        level_loader.load_level_grid(3)
+    with pytest.raises(ValueError):
+        level_loader.load_level_grid(0)
+
+
+def test_levels_are_only_loaded_from_an_up_to_date_binary_file(tmp_path):
+
+    text_file_path = tmp_path / "level_tile_maps.txt"
+    binary_file_path = tmp_path / "level_tile_maps.bin"
+    level_compiler = LevelCompiler(text_file_path = text_file_path, binary_file_path = binary_file_path)
+    level_loader = LevelLoader(text_file_path = text_file_path, binary_file_path = binary_file_path)
+
+    # The loader never compiles the levels itself
+    write_tile_maps(text_file_path, [[[0, 1], [2, 2]]])
+    with pytest.raises(FileNotFoundError):
+        level_loader.load_level_grid(1)
+    assert os.path.exists(binary_file_path) == False
+
+    level_compiler.compile()
+    assert level_loader.load_level_grid(1).tolist() == [[0, 1], [2, 2]]
+
+    # Edit the text file after the binary file was compiled (The binary file must be older than the text file, so that the loader can't rely on the times the files were modified)
+    write_tile_maps(text_file_path, [[[1, 0, 0], [2, 2, 2]]])
+    text_file_modified_time = os.path.getmtime(text_file_path)
+    os.utime(binary_file_path, (text_file_modified_time + 10, text_file_modified_time + 10))
+
+    with open(binary_file_path, "rb") as level_tile_maps_binary_file:
+        binary_file = level_tile_maps_binary_file.read()
+    with pytest.raises(ValueError, match = "out of date"):
+        level_loader.load_level_grid(1)
+
+    # The binary file must not have been changed by the loader
+    with open(binary_file_path, "rb") as level_tile_maps_binary_file:
+        assert level_tile_maps_binary_file.read() == binary_file
+
+    level_compiler.compile()
+    assert level_loader.load_level_grid(1).tolist() == [[1, 0, 0], [2, 2, 2]]
+
+
+def test_committed_binary_file_is_up_to_date():
+
+    # The binary file in the repository must have been compiled from the text file in the repository
+    LevelLoader().load_level_grid(1)
+
+
+def test_game_levels_load_the_same_tile_maps_as_the_text_file(tmp_path):
+
+    # Every level in the game's text file must load the same tile map after being compiled
+    with open("Files/Level/level_tile_maps.txt", "r") as level_tile_maps_file:
+        tile_maps = [tile_map for tile_map in level_tile_maps_file.read().split("\n") if tile_map.strip() != ""]
+
+    level_compiler = LevelCompiler(text_file_path = "Files/Level/level_tile_maps.txt", binary_file_path = tmp_path / "level_tile_maps.bin")
+    level_compiler.compile()
+    level_loader = LevelLoader(text_file_path = "Files/Level/level_tile_maps.txt", binary_file_path = tmp_path / "level_tile_maps.bin")
+
+    for level_number, tile_map in enumerate(tile_maps, start = 1):
+        level_grid = level_loader.load_level_grid(level_number)
+        assert isinstance(level_grid, np.ndarray)
+        assert level_grid.tolist() == level_compiler.parse_tile_map(tile_map)
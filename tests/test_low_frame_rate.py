@@ -0,0 +1,46 @@
+import random, pygame, pytest
+from Benchmarks.synthetic_tile_map import SyntheticTileMap
+from Level.level_loader import LevelLoader
+from Simulation.headless_simulation import HeadlessSimulation
+
+
+def assert_player_is_never_inside_a_tile(simulation, frames):
+
+    # Runs the frames (delta time, held keys, pressed keys), checking after each frame that the player isn't overlapping a tile or outside of the tile map
+    game = simulation.game
+    for frame_number, (delta_time, held_keys, pressed_keys) in enumerate(frames):
+        simulation.step(delta_time, held_keys = held_keys, pressed_keys = pressed_keys)
+
+        assert game.tile_grid.find_tiles_in_rect(game.player.rect) == {}, f"The player is inside a tile at frame {frame_number}: {game.player.rect}"
+        assert 0 <= game.player.rect.left and game.player.rect.right <= game.last_tile_position[0], f"The player is outside of the tile map at frame {frame_number}: {game.player.rect}"
+
+
+@pytest.mark.parametrize("delta_time", [0.1, 0.25, 0.41, 0.5])
+@pytest.mark.parametrize("held_key", [pygame.K_a, pygame.K_d])
+def test_holding_a_direction_at_a_low_frame_rate(delta_time, held_key):
+
+    # Holding a direction and jumping now and again at a low frame rate, so that the player moves further than the tile size in a single frame
+    simulation = HeadlessSimulation(SyntheticTileMap(width_in_screens = 3, density = 0.3, seed = 9).create_tile_map(), null_render_target = True)
+    assert_player_is_never_inside_a_tile(simulation, [(delta_time, {held_key}, [pygame.K_w] if frame_number % 7 == 0 else []) for frame_number in range(200)])
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_random_input_at_random_frame_rates(seed):
+
+    # Random input (including changing direction, jumping and power jumping) with delta times from 60 frames per second down to 2 frames per second
+    random_generator = random.Random(seed)
+    if seed % 4 == 0:
+        tile_map = LevelLoader().load_level_grid(2)
+    else:
+        tile_map = SyntheticTileMap(width_in_screens = random_generator.choice([1, 3]), density = random_generator.choice([0.05, 0.15, 0.3]), seed = seed).create_tile_map()
+    simulation = HeadlessSimulation(tile_map, null_render_target = True)
+
+    frames = []
+    held_keys = set()
+    for _ in range(400):
+        if random_generator.random() < 0.1:
+            held_keys = random_generator.choice([{pygame.K_d}, {pygame.K_a}, set(), {pygame.K_d, pygame.K_SPACE}, {pygame.K_a, pygame.K_SPACE}, {pygame.K_a, pygame.K_d}])
+        delta_time = random_generator.uniform(1 / 60, 0.5) if random_generator.random() < 0.5 else 1 / 60
+        frames.append((delta_time, held_keys, [key for key in (pygame.K_w, pygame.K_SPACE) if random_generator.random() < 0.08]))
+
+    assert_player_is_never_inside_a_tile(simulation, frames)
@@ -0,0 +1,136 @@
+import random, pygame
+import numpy as np
+from Level.tile_grid import TileGrid
+
+TILE_SIZE = 16
+
+
+def create_random_tile_grid(seed, number_of_columns = 12, number_of_rows = 10, density = 0.3):
+
+    # Creates a tile grid where each cell has a tile inside of it with a chance of the density
+    random_generator = np.random.default_rng(seed)
+    tile_grid = TileGrid(tile_size = TILE_SIZE)
+    tile_grid.set_tiles(tile_ids = (random_generator.random((number_of_rows, number_of_columns)) < density).astype(np.uint8), tile_images = {})
+    return tile_grid
+
+
+def create_random_rects(seed, tile_grid, number_of_rects = 200):
+
+    # Creates rects of random sizes at random positions, including positions partly outside of the grid
+    random_generator = random.Random(seed)
+    grid_width = tile_grid.number_of_columns * TILE_SIZE
+    grid_height = tile_grid.number_of_rows * TILE_SIZE
+    return [pygame.Rect(random_generator.randint(- TILE_SIZE, grid_width), random_generator.randint(- TILE_SIZE, grid_height), random_generator.randint(1, 2 * TILE_SIZE), random_generator.randint(1, 2 * TILE_SIZE)) for _ in range(number_of_rects)]
+
+
+def find_all_tiles(tile_grid):
+
+    # Returns the (column, row) of every cell which has a tile inside of it, by checking every cell
+    return [(column, row) for row in range(tile_grid.number_of_rows) for column in range(tile_grid.number_of_columns) if tile_grid.tile_ids[row, column] != 0]
+
+
+def test_find_tiles_in_rect():
+
+    for seed in range(5):
+        tile_grid = create_random_tile_grid(seed)
+
+        for rect in create_random_rects(seed, tile_grid):
+            expected_tiles = {(column, row): tile_grid.find_tile_rect(column, row) for column, row in find_all_tiles(tile_grid) if tile_grid.find_tile_rect(column, row).colliderect(rect)}
+            assert tile_grid.find_tiles_in_rect(rect) == expected_tiles
+
+
+def test_find_closest_tiles_below_and_above():
+
+    for seed in range(5):
+        tile_grid = create_random_tile_grid(seed)
+        all_tiles = find_all_tiles(tile_grid)
+
+        for rect in create_random_rects(seed, tile_grid):
+            columns = range(rect.left // TILE_SIZE, ((rect.right - 1) // TILE_SIZE) + 1)
+
+            # The closest tile below is the tile in the highest row that is on or below the row of the rect's bottom (the left-most one if there is more than one)
+            tiles_below = sorted((row, column) for column, row in all_tiles if column in columns and row >= rect.bottom // TILE_SIZE)
+            expected_tile_below = tile_grid.find_tile_rect(tiles_below[0][1], tiles_below[0][0]) if len(tiles_below) > 0 else None
+            assert tile_grid.find_closest_tile_below(rect) == expected_tile_below
+
+            # The closest tile above is the tile in the lowest row that starts above the rect's top (the left-most one if there is more than one)
+            tiles_above = sorted((- row, column) for column, row in all_tiles if column in columns and row * TILE_SIZE < rect.top)
+            expected_tile_above = tile_grid.find_tile_rect(tiles_above[0][1], - tiles_above[0][0]) if len(tiles_above) > 0 else None
+            assert tile_grid.find_closest_tile_above(rect) == expected_tile_above
+
+
+def find_earliest_impact_by_stepping(tile_grid, rect, dx, dy):
+
+    # Finds the first tile that the rect would hit when moving along a single axis, by moving the rect one pixel at a time
+    # Note: The rect hits a tile when it is touching the tile, so it is moved one pixel further than the movement to find the tiles that it touches at the end of the movement
+    distance = abs(dx) + abs(dy)
+    direction_x = (dx > 0) - (dx < 0)
+    direction_y = (dy > 0) - (dy < 0)
+
+    # Tiles that the rect is already overlapping are ignored
+    overlapped_tiles = set(tile_grid.find_tiles_in_rect(rect))
+
+    for step in range(1, distance + 2):
+        hit_tiles = [cell for cell in tile_grid.find_tiles_in_rect(rect.move(direction_x * step, direction_y * step)) if cell not in overlapped_tiles]
+
+        if len(hit_tiles) > 0:
+            return (step - 1) / distance, hit_tiles
+
+    return None
+
+
+def test_find_earliest_impact_matches_stepping():
+
+    for seed in range(5):
+        tile_grid = create_random_tile_grid(seed, density = 0.15)
+        random_generator = random.Random(seed)
+
+        for rect in create_random_rects(seed, tile_grid):
+            for dx, dy in ((random_generator.randint(1, 80), 0), (- random_generator.randint(1, 80), 0), (0, random_generator.randint(1, 80)), (0, - random_generator.randint(1, 80))):
+
+                impact = tile_grid.find_earliest_impact(rect, dx, dy)
+                expected_impact = find_earliest_impact_by_stepping(tile_grid, rect, dx, dy)
+
+                if expected_impact == None:
+                    assert impact == None
+                else:
+                    # The time of impact must be the same, and the tile must be one of the tiles that are hit at that time
+                    assert impact != None
+                    assert abs(impact[0] - expected_impact[0]) < 1e-9
+                    assert (impact[1].x // TILE_SIZE, impact[1].y // TILE_SIZE) in expected_impact[1]
+
+
+def test_find_earliest_impact_far_movement():
+
+    # A rect moving further than the size of a tile in one movement (e.g. at a low frame rate) must still hit the first tile along its path
+    tile_grid = TileGrid(tile_size = TILE_SIZE)
+    tile_ids = np.zeros((4, 20), dtype = np.uint8)
+    tile_ids[1, 5] = 1
+    tile_ids[1, 15] = 1
+    tile_grid.set_tiles(tile_ids = tile_ids, tile_images = {})
+
+    impact = tile_grid.find_earliest_impact(pygame.Rect(0, TILE_SIZE, TILE_SIZE, TILE_SIZE), 300, 0)
+    assert impact == ((5 * TILE_SIZE - TILE_SIZE) / 300, tile_grid.find_tile_rect(5, 1))
+
+    # Touching the corner of a tile is not a hit
+    assert tile_grid.find_earliest_impact(pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE), 300, 0) == None
+
+    # A rect that is already overlapping a tile can move out of it
+    assert tile_grid.find_earliest_impact(pygame.Rect(5 * TILE_SIZE + 4, TILE_SIZE, TILE_SIZE, TILE_SIZE), 40, 0) == None
+
+
+def test_find_closest_tiles_outside_of_the_grid():
+
+    # The closest tiles are found in the columns that the rect overlaps, even if the rect is above or below the grid
+    tile_grid = TileGrid(tile_size = TILE_SIZE)
+    tile_ids = np.zeros((4, 6), dtype = np.uint8)
+    tile_ids[2, 1] = 1
+    tile_ids[3, 4] = 1
+    tile_grid.set_tiles(tile_ids = tile_ids, tile_images = {})
+
+    assert tile_grid.find_closest_tile_below(pygame.Rect(TILE_SIZE + 4, - 3 * TILE_SIZE, TILE_SIZE, TILE_SIZE)) == tile_grid.find_tile_rect(1, 2)
+    assert tile_grid.find_closest_tile_above(pygame.Rect(4 * TILE_SIZE, 10 * TILE_SIZE, TILE_SIZE, TILE_SIZE)) == tile_grid.find_tile_rect(4, 3)
+
+    # Columns outside of the grid don't have any tiles
+    assert tile_grid.find_closest_tile_below(pygame.Rect(- 2 * TILE_SIZE, 0, TILE_SIZE, TILE_SIZE)) == None
+    assert tile_grid.find_closest_tile_above(pygame.Rect(6 * TILE_SIZE, 10 * TILE_SIZE, TILE_SIZE, TILE_SIZE)) == None